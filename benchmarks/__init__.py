@@ -0,0 +1,8 @@
+"""
+benchmarks
+
+Speed benchmarks of DeLoreans, run it with
+
+    > python -m benchmarks --output benchmark.json
+    > python -m benchmarks --baseline benchmark.json
+"""
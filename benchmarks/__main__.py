@@ -0,0 +1,80 @@
+"""
+Run benchmarks of 'deloreans.get'
+
+    > python -m benchmarks [--output FILE] [--baseline FILE] [--threshold RATIO]
+
+Exit with status 1 when any case is slower than baseline over the threshold
+"""
+import argparse
+import sys
+from typing import List, Optional, Sequence
+
+from benchmarks import baseline
+from benchmarks.suite import (
+    DEFAULT_BATCH_SIZES,
+    DEFAULT_MIN_CALLS,
+    DEFAULT_OFFSETS,
+    DEFAULT_REPEAT,
+    iter_cases,
+    run_case,
+)
+
+
+def _parse_ints(value: str) -> List[int]:
+    return [int(item) for item in value.split(',')]
+
+
+def _parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog='python -m benchmarks', description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--output', help='save results as baseline file')
+    parser.add_argument('--baseline', help='compare results with baseline file')
+    parser.add_argument(
+        '--threshold',
+        type=float,
+        default=baseline.DEFAULT_THRESHOLD,
+        help='flag regression when slower than baseline by this ratio',
+    )
+    parser.add_argument(
+        '--combination',
+        action='append',
+        help='only benchmark given granularity combination, e.g. weekly/yearly, could be repeated',
+    )
+    parser.add_argument('--firstweekday', type=_parse_ints, default=list(range(7)))
+    parser.add_argument('--offset', type=_parse_ints, default=list(DEFAULT_OFFSETS))
+    parser.add_argument('--batch-size', type=_parse_ints, default=list(DEFAULT_BATCH_SIZES))
+    parser.add_argument('--repeat', type=int, default=DEFAULT_REPEAT)
+    parser.add_argument('--min-calls', type=int, default=DEFAULT_MIN_CALLS)
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    args = _parse_args(argv)
+    baseline_ns = baseline.load(args.baseline) if args.baseline else {}
+
+    results = []
+    regressions = 0
+    print(f'{"case":<48}{"ns/call":>12}{"peak B/call":>13}{"calls/s":>12}{"change":>10}')
+    for case in iter_cases(args.offset, args.batch_size, args.firstweekday, args.combination):
+        result = run_case(case, args.repeat, args.min_calls)
+        results.append(result)
+        comparison, = baseline.compare([result], baseline_ns, args.threshold)
+        change = '' if comparison.change is None else f'{comparison.change:+.1%}'
+        if comparison.is_regression:
+            regressions += 1
+            change += ' !'
+        print(
+            f'{case.key:<48}{result.ns_per_call:>12.0f}{result.peak_bytes_per_call:>13}'
+            f'{result.calls_per_second:>12.0f}{change:>10}',
+            flush=True,
+        )
+
+    if args.output:
+        baseline.dump(results, args.output)
+    if regressions:
+        print(f'{regressions} regression(s) slower than baseline by over {args.threshold:.0%}', file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,77 @@
+"""
+benchmarks.baseline
+
+This module saves benchmark results as a baseline file,
+and compares later results with it to flag regressions
+"""
+import json
+import platform
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional
+
+from benchmarks.suite import BenchmarkResult
+
+
+# flag regression when slower than baseline by this ratio
+DEFAULT_THRESHOLD = 0.2
+
+
+class Comparison(NamedTuple):
+    result: BenchmarkResult
+    baseline_ns_per_call: Optional[float]
+    threshold: float
+
+    @property
+    def change(self) -> Optional[float]:
+        """
+        ratio of time change against baseline, positive when slower
+        """
+        if self.baseline_ns_per_call is None:
+            return None
+        return self.result.ns_per_call / self.baseline_ns_per_call - 1
+
+    @property
+    def is_regression(self) -> bool:
+        change = self.change
+        return change is not None and change > self.threshold
+
+
+def dump(results: Iterable[BenchmarkResult], path: str) -> None:
+    content: Dict[str, Any] = {
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'machine': platform.machine(),
+        'results': {
+            result.case.key: {
+                'ns_per_call': round(result.ns_per_call, 1),
+                'peak_bytes_per_call': result.peak_bytes_per_call,
+                'calls_per_second': round(result.calls_per_second, 1),
+            }
+            for result in results
+        },
+    }
+    with open(path, 'w') as f:
+        json.dump(content, f, indent=2, sort_keys=True)
+        f.write('\n')
+
+
+def load(path: str) -> Dict[str, float]:
+    """
+    time per call of each case in baseline file, keyed by case key
+    """
+    with open(path) as f:
+        content = json.load(f)
+    return {
+        key: value['ns_per_call']
+        for key, value in content['results'].items()
+    }
+
+
+def compare(
+    results: Iterable[BenchmarkResult],
+    baseline: Dict[str, float],
+    threshold: float = DEFAULT_THRESHOLD,
+) -> List[Comparison]:
+    return [
+        Comparison(result, baseline.get(result.case.key), threshold)
+        for result in results
+    ]
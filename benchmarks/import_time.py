@@ -0,0 +1,97 @@
+"""
+benchmarks.import_time
+
+Measure the time of 'import deloreans' in fresh interpreters, which should be within budget
+
+    > python -m benchmarks.import_time [--budget-ms 1.0] [--runs 20]
+
+Exit with status 1 when the median import time is over budget
+"""
+import argparse
+import statistics
+import subprocess
+import sys
+from typing import List, NamedTuple, Optional, Sequence
+
+
+DEFAULT_BUDGET_MS = 1.0
+DEFAULT_RUNS = 20
+
+# measured statement, and the setup which is excluded from measurement
+_SCRIPT = '''
+import time
+{setup}
+started_ns = time.perf_counter_ns()
+{statement}
+print(time.perf_counter_ns() - started_ns)
+'''
+
+
+class ImportCase(NamedTuple):
+    name: str
+    statement: str
+    setup: str = ''
+    # only the cases with budget would fail the benchmark
+    has_budget: bool = False
+
+
+CASES = (
+    ImportCase('import deloreans', 'import deloreans', has_budget=True),
+    ImportCase('first access of deloreans.get', 'deloreans.get', setup='import deloreans'),
+    ImportCase('import deloreans.vectorized', 'import deloreans.vectorized', setup='import numpy'),
+)
+
+
+class ImportResult(NamedTuple):
+    case: ImportCase
+    median_ns: float
+    min_ns: int
+
+
+def measure(case: ImportCase, runs: int = DEFAULT_RUNS) -> Optional[ImportResult]:
+    """
+    Returns:
+        result (Optional[ImportResult]): None when the setup is unavailable, e.g. NumPy is not installed
+    """
+    script = _SCRIPT.format(setup=case.setup, statement=case.statement)
+    elapsed: List[int] = []
+    for _ in range(runs):
+        completed = subprocess.run(
+            [sys.executable, '-c', script],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            universal_newlines=True,
+        )
+        if completed.returncode != 0:
+            return None
+        elapsed.append(int(completed.stdout))
+    return ImportResult(case, statistics.median(elapsed), min(elapsed))
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.import_time')
+    parser.add_argument('--budget-ms', type=float, default=DEFAULT_BUDGET_MS)
+    parser.add_argument('--runs', type=int, default=DEFAULT_RUNS)
+    args = parser.parse_args(argv)
+
+    over_budget = False
+    print(f'{"case":<40}{"median ms":>12}{"min ms":>12}{"budget ms":>12}')
+    for case in CASES:
+        result = measure(case, args.runs)
+        if result is None:
+            print(f'{case.name:<40}{"skipped":>12}')
+            continue
+        budget = f'{args.budget_ms:.3f}' if case.has_budget else ''
+        if case.has_budget and result.median_ns > args.budget_ms * 1e6:
+            over_budget = True
+            budget += ' !'
+        print(f'{case.name:<40}{result.median_ns / 1e6:>12.3f}{result.min_ns / 1e6:>12.3f}{budget:>12}')
+
+    if over_budget:
+        print(f'import time is over budget {args.budget_ms} ms', file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,179 @@
+"""
+benchmarks.suite
+
+This module provides the benchmark cases of scalar 'deloreans.get',
+which cover each registered granularity combination, firstweekday and offset at several batch sizes
+"""
+import datetime
+import time
+import tracemalloc
+from typing import Callable, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+import deloreans
+from deloreans.date_utils import VALID_GRAINS_COMB, DateGranularity, OffsetGranularity
+from deloreans.date_utils.common import get_weekly_start_date
+from deloreans.date_utils.ordinal import get_month_start
+
+
+DEFAULT_OFFSETS = (-1, 1, -10)
+DEFAULT_BATCH_SIZES = (1, 100, 1000)
+DEFAULT_REPEAT = 3
+# each measurement calls 'deloreans.get' at least this amount of times
+DEFAULT_MIN_CALLS = 500
+
+# date ranges of batch start from here
+_BASE_DATE = datetime.date(2024, 1, 1)
+# date ranges of batch have 1 to 3 date periods
+_MAX_DATE_RANGE_LENGTH = 3
+
+
+Params = Tuple[datetime.date, datetime.date, DateGranularity, int, OffsetGranularity, int]
+
+
+class BenchmarkCase(NamedTuple):
+    date_granularity: DateGranularity
+    offset_granularity: OffsetGranularity
+    firstweekday: int
+    offset: int
+    batch_size: int
+
+    @property
+    def key(self) -> str:
+        return (
+            f'{self.date_granularity.name.lower()}/{self.offset_granularity.name.lower()}'
+            f'/fw{self.firstweekday}/offset{self.offset}/batch{self.batch_size}'
+        )
+
+
+class BenchmarkResult(NamedTuple):
+    case: BenchmarkCase
+    ns_per_call: float
+    peak_bytes_per_call: int
+
+    @property
+    def calls_per_second(self) -> float:
+        return 1e9 / self.ns_per_call
+
+
+def iter_cases(
+    offsets: Sequence[int] = DEFAULT_OFFSETS,
+    batch_sizes: Sequence[int] = DEFAULT_BATCH_SIZES,
+    firstweekdays: Sequence[int] = tuple(range(7)),
+    combinations: Optional[Sequence[str]] = None,
+) -> Iterator[BenchmarkCase]:
+    """
+    benchmark cases of each granularity combination in 'VALID_GRAINS_COMB'
+
+    Args:
+        combinations (Sequence[str]): only the given combinations, e.g. 'weekly/yearly'
+    """
+    for date_granularity in DateGranularity:
+        for offset_granularity in OffsetGranularity:
+            if offset_granularity not in VALID_GRAINS_COMB[date_granularity]:
+                continue
+            combination = f'{date_granularity.name.lower()}/{offset_granularity.name.lower()}'
+            if combinations is not None and combination not in combinations:
+                continue
+            for firstweekday in firstweekdays:
+                for offset in offsets:
+                    for batch_size in batch_sizes:
+                        yield BenchmarkCase(
+                            date_granularity,
+                            offset_granularity,
+                            firstweekday,
+                            offset,
+                            batch_size,
+                        )
+
+
+def _get_period_start_date(
+    date_granularity: DateGranularity,
+    index: int,
+    firstweekday: int,
+) -> datetime.date:
+    """
+    start date of the period which is 'index' periods after the one of base date
+    """
+    if date_granularity == DateGranularity.DAILY:
+        return _BASE_DATE + datetime.timedelta(days=index)
+    if date_granularity == DateGranularity.WEEKLY:
+        return get_weekly_start_date(_BASE_DATE, firstweekday) + datetime.timedelta(weeks=index)
+    if date_granularity == DateGranularity.MONTHLY:
+        month_serial = _BASE_DATE.year * 12 + _BASE_DATE.month - 1 + index
+        return datetime.date.fromordinal(get_month_start(month_serial))
+    return datetime.date(_BASE_DATE.year + index, 1, 1)
+
+
+def get_batch(case: BenchmarkCase) -> List[Params]:
+    """
+    parameters of 'deloreans.get' with different complete date ranges,
+    excluding the ones without compared date range, e.g. Feb 29th year-over-year
+    """
+    batch: List[Params] = []
+    index = 0
+    while len(batch) < case.batch_size:
+        start_date = _get_period_start_date(case.date_granularity, index, case.firstweekday)
+        end_date = case.date_granularity.get_end_date(
+            start_date,
+            index % _MAX_DATE_RANGE_LENGTH + 1,
+            case.firstweekday,
+        )
+        params: Params = (
+            start_date,
+            end_date,
+            case.date_granularity,
+            case.offset,
+            case.offset_granularity,
+            case.firstweekday,
+        )
+        index += 1
+        try:
+            deloreans.get(*params)
+        except ValueError:
+            continue
+        batch.append(params)
+    return batch
+
+
+def _time_batch(func: Callable[..., object], batch: List[Params], number: int) -> int:
+    start = time.perf_counter_ns()
+    for _ in range(number):
+        for params in batch:
+            func(*params)
+    return time.perf_counter_ns() - start
+
+
+def _trace_peak_bytes(func: Callable[..., object], params: Params) -> int:
+    """
+    peak of memory allocated by a single call, traced by tracemalloc
+    """
+    func(*params)
+    tracemalloc.start()
+    try:
+        func(*params)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+def run_case(
+    case: BenchmarkCase,
+    repeat: int = DEFAULT_REPEAT,
+    min_calls: int = DEFAULT_MIN_CALLS,
+    func: Callable[..., object] = deloreans.get,
+) -> BenchmarkResult:
+    """
+    measure the best time per call of given case in 'repeat' measurements
+    """
+    batch = get_batch(case)
+    number = max(1, -(-min_calls // case.batch_size))
+    # warm up, e.g. calendar tables are built lazily
+    _time_batch(func, batch, 1)
+    elapsed = min(_time_batch(func, batch, number) for _ in range(repeat))
+    peak_bytes = max(_trace_peak_bytes(func, params) for params in batch[:_MAX_DATE_RANGE_LENGTH])
+    return BenchmarkResult(
+        case,
+        elapsed / (number * case.batch_size),
+        peak_bytes,
+    )
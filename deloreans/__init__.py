@@ -1,3 +1,70 @@
-from deloreans.api import get  # NOQA
-from deloreans.date_utils.date_granularity import DateGranularity  # NOQA
-from deloreans.date_utils.offset_granularity import OffsetGranularity  # NOQA
+"""
+deloreans
+
+Public attributes and submodules are loaded lazily on first access (PEP 562),
+so that 'import deloreans' doesn't import any submodule until it is used
+"""
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+    from deloreans.api import compile, get, get_many, get_offsets, iter_periods  # NOQA
+    from deloreans.cache import cache_clear, cache_info, disable_cache, enable_cache  # NOQA
+    from deloreans.date_utils.date_granularity import DateGranularity  # NOQA
+    from deloreans.date_utils.offset_granularity import OffsetGranularity  # NOQA
+    from deloreans.date_utils.period_sequence import PeriodSequence  # NOQA
+    from deloreans.inverse import get_base, get_base_ranges, get_covering_offsets  # NOQA
+    from deloreans.plan import ComparisonPlan  # NOQA
+    from deloreans.rolling_window import rolling, RollingWindow  # NOQA
+    from deloreans.stream import StreamComparator  # NOQA
+    from deloreans.tracing import get_tracer, set_tracer, TraceEvent  # NOQA
+
+
+# public attribute name to the module which provides it
+_LAZY_ATTRIBUTES = {
+    'compile': 'deloreans.api',
+    'get': 'deloreans.api',
+    'get_many': 'deloreans.api',
+    'get_offsets': 'deloreans.api',
+    'iter_periods': 'deloreans.api',
+    'cache_clear': 'deloreans.cache',
+    'cache_info': 'deloreans.cache',
+    'disable_cache': 'deloreans.cache',
+    'enable_cache': 'deloreans.cache',
+    'DateGranularity': 'deloreans.date_utils.date_granularity',
+    'OffsetGranularity': 'deloreans.date_utils.offset_granularity',
+    'PeriodSequence': 'deloreans.date_utils.period_sequence',
+    'get_base': 'deloreans.inverse',
+    'get_base_ranges': 'deloreans.inverse',
+    'get_covering_offsets': 'deloreans.inverse',
+    'ComparisonPlan': 'deloreans.plan',
+    'rolling': 'deloreans.rolling_window',
+    'RollingWindow': 'deloreans.rolling_window',
+    'StreamComparator': 'deloreans.stream',
+    'get_tracer': 'deloreans.tracing',
+    'set_tracer': 'deloreans.tracing',
+    'TraceEvent': 'deloreans.tracing',
+}
+
+__all__ = list(_LAZY_ATTRIBUTES)
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        # submodule, e.g. 'deloreans.api', which is set as module attribute once imported
+        try:
+            return import_module(f'{__name__}.{name}')
+        except ModuleNotFoundError as error:
+            if error.name != f'{__name__}.{name}':
+                raise
+            raise AttributeError(f'module {__name__!r} has no attribute {name!r}') from None
+
+    value = getattr(import_module(module_name), name)
+    # cache it as module attribute, then '__getattr__' is not called for it anymore
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
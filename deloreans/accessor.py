@@ -0,0 +1,256 @@
+"""
+deloreans.accessor
+
+This module registers 'deloreans' accessor on pandas DataFrame and Series,
+which provides compared date ranges of date columns with 'deloreans.vectorized'
+
+Importing this module registers the accessor, and pandas is an optional dependency
+which should be installed before importing this module
+
+    >>> import deloreans.accessor
+    >>> df.deloreans.compare('start_date', 'end_date', DateGranularity.MONTHLY, -1, OffsetGranularity.YEARLY)
+"""
+from typing import Any, Tuple
+
+try:
+    import numpy as np  # type: ignore[import]
+    import pandas as pd  # type: ignore[import]
+except ImportError:  # pragma: no cover
+    raise ImportError(
+        'deloreans.accessor requires pandas, please install it by "python -m pip install pandas"'
+    )
+
+from deloreans.date_utils import DateGranularity, OffsetGranularity
+import deloreans.vectorized as vectorized
+
+
+COMPARED_START_DATE = 'compared_start_date'
+COMPARED_END_DATE = 'compared_end_date'
+BASE = 'base'
+COMPARED = 'compared'
+
+
+def _to_days(column: Any, bound: str) -> Tuple[Any, Any, Any]:
+    """
+    convert datetime64 or Period column into epoch days,
+    with the mask of missing values and the dtype to restore dates
+
+    Args:
+        column (pd.Series): datetime64 or Period column
+        bound (str): 'start' or 'end', which bound of period represents the date
+    """
+    mask = column.isna().to_numpy()
+    if isinstance(column.dtype, pd.PeriodDtype):
+        # ordinals of daily periods are epoch days, which are free of the bounds of nanoseconds
+        return column.array.asfreq('D', how=bound).asi8, mask, column.dtype
+    if not pd.api.types.is_datetime64_any_dtype(column.dtype):
+        raise ValueError(
+            f'Invalid column {column.name!r} with dtype {column.dtype}, should be datetime64 or Period'
+        )
+    if getattr(column.dt, 'tz', None) is not None:
+        column = column.dt.tz_localize(None)
+    # convert from the unit of column, which is not always nanosecond
+    dates = column.to_numpy()
+    return dates.astype('datetime64[D]').astype(np.int64), mask, dates.dtype
+
+
+def _index_to_days(index: Any) -> Any:
+    """
+    convert DatetimeIndex or PeriodIndex into epoch days of period start dates
+    """
+    if isinstance(index, pd.PeriodIndex):
+        return index.asfreq('D', how='start').asi8
+    if not isinstance(index, pd.DatetimeIndex):
+        raise ValueError(f'Invalid index with type {type(index).__name__}, should be DatetimeIndex or PeriodIndex')
+    if index.tz is not None:
+        index = index.tz_localize(None)
+    return index.to_numpy().astype('datetime64[D]').astype(np.int64)
+
+
+def _to_column(days: Any, mask: Any, index: Any, name: str, dtype: Any) -> Any:
+    """
+    convert epoch days into the column of given datetime64 or Period dtype, where masked values are missing
+    """
+    days = np.where(mask, 0, days).astype(np.int64)
+    if isinstance(dtype, pd.PeriodDtype):
+        daily_periods = pd.arrays.PeriodArray(days, dtype=pd.PeriodDtype('D'))
+        dates = pd.Series(daily_periods, index=index, name=name).dt.asfreq(dtype.freq)
+    else:
+        # pandas checks the bounds of unit, instead of wrapping silently as NumPy does
+        dates = pd.Series(days.astype('datetime64[D]'), index=index, name=name).astype(dtype)
+    dates[mask] = pd.NaT
+    return dates
+
+
+def _compare_columns(
+    start: Any,
+    end: Any,
+    date_granularity: DateGranularity,
+    offset: int,
+    offset_granularity: OffsetGranularity,
+    firstweekday: int = 0,
+    errors: str = 'raise',
+) -> Any:
+    if errors not in ('raise', 'coerce'):
+        raise ValueError(f'Invalid errors {errors!r}, should be "raise" or "coerce"')
+    start_days, start_mask, dtype = _to_days(start, 'start')
+    end_days, end_mask, _ = _to_days(end, 'end')
+    mask = start_mask | end_mask
+
+    # missing values are replaced by a complete date range, then masked again in results
+    if mask.any():
+        placeholder_start, placeholder_end = vectorized._get_placeholder(date_granularity, firstweekday)
+        start_days = np.where(mask, placeholder_start, start_days)
+        end_days = np.where(mask, placeholder_end, end_days)
+
+    compared_start_days, compared_end_days, valid = vectorized.compare(
+        start_days,
+        end_days,
+        date_granularity,
+        offset,
+        offset_granularity,
+        firstweekday,
+    )
+    invalid = ~valid & ~mask
+    if errors == 'raise' and invalid.any():
+        raise ValueError(
+            f'{np.count_nonzero(invalid)} date ranges have no compared date range'
+        )
+    mask = mask | invalid
+    return pd.DataFrame({
+        COMPARED_START_DATE: _to_column(compared_start_days, mask, start.index, COMPARED_START_DATE, dtype),
+        COMPARED_END_DATE: _to_column(compared_end_days, mask, start.index, COMPARED_END_DATE, dtype),
+    })
+
+
+@pd.api.extensions.register_dataframe_accessor('deloreans')
+class DeLoreansDataFrameAccessor:
+
+    def __init__(self, pandas_obj: Any) -> None:
+        self._obj = pandas_obj
+
+    def compare(
+        self,
+        start: str,
+        end: str,
+        date_granularity: DateGranularity,
+        offset: int,
+        offset_granularity: OffsetGranularity,
+        firstweekday: int = 0,
+        errors: str = 'raise',
+    ) -> Any:
+        """
+        provide compared date ranges of date ranges in given columns
+
+        Args:
+            start (str): column of start dates, datetime64 or Period
+            end (str): column of end dates, datetime64 or Period
+            date_granularity (DateGranularity): granularity of date range, e.g. daily, weekly
+            offset (int): away from given date range, to the future when positive
+            offset_granularity (OffsetGranularity): granularity of offset period, e.g. year-over-year
+            firstweekday (int): define the start date's weekday of week, 0 is Monday, 6 is Sunday
+            errors (str): when 'coerce', date range without compared one would be NaT instead of raising
+
+        Returns:
+            compared (pd.DataFrame): columns 'compared_start_date' and 'compared_end_date',
+                                     which are NaT when given start or end date is missing
+        """
+        return _compare_columns(
+            self._obj[start],
+            self._obj[end],
+            date_granularity,
+            offset,
+            offset_granularity,
+            firstweekday,
+            errors,
+        )
+
+
+@pd.api.extensions.register_series_accessor('deloreans')
+class DeLoreansSeriesAccessor:
+
+    def __init__(self, pandas_obj: Any) -> None:
+        self._obj = pandas_obj
+
+    def compare(
+        self,
+        date_granularity: DateGranularity,
+        offset: int,
+        offset_granularity: OffsetGranularity,
+        firstweekday: int = 0,
+        end: Any = None,
+        errors: str = 'raise',
+    ) -> Any:
+        """
+        provide compared date ranges of date ranges starting at dates in this series
+
+        When 'end' is not given, each date range is the single period represented by the value,
+        which is either the Period itself or the date-granularity period starting at the date
+
+        Args:
+            date_granularity (DateGranularity): granularity of date range, e.g. daily, weekly
+            offset (int): away from given date range, to the future when positive
+            offset_granularity (OffsetGranularity): granularity of offset period, e.g. year-over-year
+            firstweekday (int): define the start date's weekday of week, 0 is Monday, 6 is Sunday
+            end (pd.Series): end dates, datetime64 or Period
+            errors (str): when 'coerce', date range without compared one would be NaT instead of raising
+
+        Returns:
+            compared (pd.DataFrame): columns 'compared_start_date' and 'compared_end_date'
+        """
+        start = self._obj
+        if end is None:
+            if isinstance(start.dtype, pd.PeriodDtype):
+                end = start
+            else:
+                start_days, mask, dtype = _to_days(start, 'start')
+                placeholder_start, _ = vectorized._get_placeholder(date_granularity, firstweekday)
+                end_days = vectorized.get_end_date(
+                    date_granularity,
+                    np.where(mask, placeholder_start, start_days),
+                    1,
+                    firstweekday,
+                )
+                end = _to_column(end_days, mask, start.index, start.name, dtype)
+        return _compare_columns(
+            start,
+            end,
+            date_granularity,
+            offset,
+            offset_granularity,
+            firstweekday,
+            errors,
+        )
+
+    def align(
+        self,
+        date_granularity: DateGranularity,
+        offset: int,
+        offset_granularity: OffsetGranularity,
+        firstweekday: int = 0,
+    ) -> Any:
+        """
+        provide values of this series and of compared periods aligned period by period,
+        e.g. the revenue of each month with the one of the same month in the year before
+
+        Args:
+            date_granularity (DateGranularity): granularity of periods in index, e.g. daily, weekly
+            offset (int): away from given periods, to the future when positive
+            offset_granularity (OffsetGranularity): granularity of offset period, e.g. year-over-year
+            firstweekday (int): define the start date's weekday of week, 0 is Monday, 6 is Sunday
+
+        Returns:
+            aligned (pd.DataFrame): columns 'base' and 'compared' with the index of this series,
+                                    'compared' is missing when compared period is not in the index
+        """
+        series = self._obj
+        positions, _ = vectorized.align_positions(
+            _index_to_days(series.index),
+            date_granularity,
+            offset,
+            offset_granularity,
+            firstweekday,
+        )
+        # missing positions are -1, which are filled with missing values of the dtype of this series
+        compared = pd.api.extensions.take(series.array, positions, allow_fill=True)
+        return pd.DataFrame({BASE: series, COMPARED: pd.Series(compared, index=series.index)})
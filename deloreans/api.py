@@ -3,11 +3,15 @@ deloreans.api
 
 This module implements the DeLoreans API
 """
+from __future__ import annotations
 import datetime
-from typing import Tuple
+from collections.abc import Mapping
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
 
 from deloreans.app import DeLoreans
-from deloreans.date_utils import DateGranularity, OffsetGranularity
+from deloreans.cache import get_cache
+from deloreans.date_utils import DateGranularity, OffsetGranularity, PeriodSequence
+from deloreans.plan import ComparisonPlan
 
 
 def get(
@@ -17,6 +21,7 @@ def get(
     offset: int,
     offset_granularity: OffsetGranularity,
     firstweekday: int = 0,
+    trusted: bool = False,
 ) -> Tuple[datetime.date, datetime.date]:
     """
     provide compared date range according to given parameters
@@ -28,11 +33,24 @@ def get(
         offset (int): away from given date range, to the future when positive
         offset_granularity (OffsetGranularity): granularity of offset period, e.g. year-over-year
         firstweekday (int): define the start date's weekday of week, 0 is Monday, 6 is Sunday
+        trusted (bool): skip validation of parameters, only for the ones known to be valid,
+                        e.g. derived from date utilities. Invalid ones lead to undefined results
 
     Returns:
         compared_start_date (datetime.date): start date of compared date range
         compared_end_date (datetime.date): end date of compared date range
     """
+    comparison_cache = get_cache()
+    if comparison_cache is not None:
+        return comparison_cache.get(
+            start_date,
+            end_date,
+            date_granularity,
+            offset,
+            offset_granularity,
+            firstweekday,
+        )
+
     component = DeLoreans(
         start_date,
         end_date,
@@ -40,5 +58,158 @@ def get(
         offset,
         offset_granularity,
         firstweekday,
+        trusted,
     )
     return component.get()
+
+
+def _unpack_request(
+    start_date: datetime.date,
+    end_date: datetime.date,
+    date_granularity: DateGranularity,
+    offset: int,
+    offset_granularity: OffsetGranularity,
+    firstweekday: int = 0,
+) -> Tuple[datetime.date, datetime.date, DateGranularity, int, OffsetGranularity, int]:
+    return start_date, end_date, date_granularity, offset, offset_granularity, firstweekday
+
+
+def get_many(
+    requests: Iterable[Union[Sequence[Any], Mapping[str, Any]]],
+) -> List[Tuple[datetime.date, datetime.date]]:
+    """
+    provide compared date ranges of a batch of requests
+
+    Requests are partitioned by granularity combination and firstweekday,
+    so that each group is validated and planned once instead of per request
+
+    Args:
+        requests (Iterable): parameters of 'get', each of which is either
+                             a tuple in the order of 'get' arguments, or a dict of its keyword arguments
+
+    Returns:
+        compared_date_ranges (list): compared date range of each request, in the order of input
+    """
+    groups: Dict[
+        Tuple[DateGranularity, OffsetGranularity, int],
+        List[Tuple[int, datetime.date, datetime.date, int]],
+    ] = {}
+    count = 0
+    for position, request in enumerate(requests):
+        if isinstance(request, Mapping):
+            params = _unpack_request(**request)
+        else:
+            params = _unpack_request(*request)
+        start_date, end_date, date_granularity, offset, offset_granularity, firstweekday = params
+        groups.setdefault(
+            (date_granularity, offset_granularity, firstweekday),
+            [],
+        ).append((position, start_date, end_date, offset))
+        count = position + 1
+
+    results: List[Optional[Tuple[datetime.date, datetime.date]]] = [None] * count
+    for (date_granularity, offset_granularity, firstweekday), rows in groups.items():
+        plans: Dict[int, ComparisonPlan] = {}
+        for position, start_date, end_date, offset in rows:
+            plan = plans.get(offset)
+            if plan is None:
+                plan = plans[offset] = ComparisonPlan(
+                    date_granularity,
+                    offset,
+                    offset_granularity,
+                    firstweekday,
+                )
+            results[position] = plan.apply(start_date, end_date)
+    return results  # type: ignore[return-value]
+
+
+def get_offsets(
+    start_date: datetime.date,
+    end_date: datetime.date,
+    date_granularity: DateGranularity,
+    offsets: Iterable[int],
+    offset_granularity: OffsetGranularity,
+    firstweekday: int = 0,
+    errors: str = 'raise',
+) -> List[Optional[Tuple[datetime.date, datetime.date]]]:
+    """
+    provide compared date ranges of one date range with many offsets in a single pass,
+    e.g. the same period of each of the 5 previous years
+
+    Parameters are validated, and the length and start period index of date range are computed,
+    only once for all offsets
+
+    Args:
+        start_date (datetime.date): start date of date range
+        end_date (datetime.date): end date of date range
+        date_granularity (DateGranularity): granularity of date range, e.g. daily, weekly
+        offsets (Iterable[int]): offsets away from given date range, e.g. range(-5, 0)
+        offset_granularity (OffsetGranularity): granularity of offset period, e.g. year-over-year
+        firstweekday (int): define the start date's weekday of week, 0 is Monday, 6 is Sunday
+        errors (str): when 'coerce', the compared date range which doesn't exist would be None instead of raising
+
+    Returns:
+        compared_date_ranges (list): compared start date and end date of each offset, in the order of offsets
+    """
+    plan = ComparisonPlan(date_granularity, 0, offset_granularity, firstweekday)
+    return plan.apply_offsets(start_date, end_date, offsets, errors=errors)
+
+
+def compile(
+    date_granularity: DateGranularity,
+    offset: int,
+    offset_granularity: OffsetGranularity,
+    firstweekday: int = 0,
+) -> ComparisonPlan:
+    """
+    provide a reusable comparison plan according to given parameters,
+    which could be applied on any date range with the same granularity combination
+
+    Args:
+        date_granularity (DateGranularity): granularity of date range, e.g. daily, weekly
+        offset (int): away from given date range, to the future when positive
+        offset_granularity (OffsetGranularity): granularity of offset period, e.g. year-over-year
+        firstweekday (int): define the start date's weekday of week, 0 is Monday, 6 is Sunday
+
+    Returns:
+        plan (ComparisonPlan): call 'plan.apply(start_date, end_date)' for compared date range
+    """
+    return ComparisonPlan(
+        date_granularity,
+        offset,
+        offset_granularity,
+        firstweekday,
+    )
+
+
+def iter_periods(
+    start_date: datetime.date,
+    end_date: datetime.date,
+    granularity: DateGranularity,
+    firstweekday: int = 0,
+    bounds: bool = False,
+) -> PeriodSequence:
+    """
+    provide the periods located in given date range lazily, e.g. the days, weeks or months of a compared date range
+
+    A week is located in the date range when its fourth day is, as week-of-month and week-of-year,
+    and the other periods are when their first days are
+
+        >>> compared_start_date, compared_end_date = deloreans.get(...)
+        >>> for week_start_date, week_end_date in deloreans.iter_periods(
+        ...     compared_start_date, compared_end_date, DateGranularity.WEEKLY, bounds=True,
+        ... ):
+        ...     ...
+
+    Args:
+        start_date (datetime.date): start date of date range
+        end_date (datetime.date): end date of date range
+        granularity (DateGranularity): granularity of periods, e.g. daily, weekly
+        firstweekday (int): define the start date's weekday of week, 0 is Monday, 6 is Sunday
+        bounds (bool): provide (start_date, end_date) of each period instead of start date only
+
+    Returns:
+        periods (PeriodSequence): sequence of period start dates or bounds, which are computed on access
+                                  and could be sliced without materializing
+    """
+    return PeriodSequence(start_date, end_date, granularity, firstweekday, bounds)
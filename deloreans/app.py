@@ -3,8 +3,10 @@ deloreans.app
 
 This module provides a component 'DeLoreans' on core logic
 """
+from __future__ import annotations
 import datetime
-from typing import Tuple
+from time import perf_counter_ns
+from typing import Any, Callable, Tuple
 
 from deloreans.date_utils import (
     DateGranularity,
@@ -14,6 +16,7 @@ from deloreans.date_utils import (
     VALID_GRAINS_COMB,
 )
 import deloreans.date_utils.common as common_date_utils
+from deloreans.tracing import TraceEvent, Tracer, get_tracer
 
 
 class DeLoreans:
@@ -26,15 +29,22 @@ class DeLoreans:
         offset: int,
         offset_granularity: OffsetGranularity,
         firstweekday: int = 0,
+        trusted: bool = False,
     ) -> None:
+        """
+        parameters are validated on construction,
+        unless 'trusted' that the caller guarantees they are valid, e.g. derived from date utilities
+        """
         self._date_range = DateRange(
             start_date,
             end_date,
             date_granularity,
             firstweekday,
+            trusted,
         )
-        self._date_period_offset = DatePeriodOffset(offset, offset_granularity)
-        self._validate_grain_comb()
+        self._date_period_offset = DatePeriodOffset(offset, offset_granularity, trusted)
+        if not trusted:
+            self._validate_grain_comb()
         self._date_grain_name = date_granularity.name.lower()
         self._offset_grain_name = offset_granularity.name.lower()
 
@@ -54,80 +64,46 @@ class DeLoreans:
                 f"when date granularity is {date_granularity!r}"
             )
 
-    def _get_start_period_index(self) -> int:
+    def _get_located_grain_name(self) -> str:
         if self._date_period_offset.offset_granularity == OffsetGranularity.PERIODIC:
-            offset_grain_name = self._date_grain_name
-        else:
-            offset_grain_name = self._offset_grain_name
+            return self._date_grain_name
+        return self._offset_grain_name
 
+    def _get_start_period_index_func(self) -> Callable[..., int]:
         try:
-            func = getattr(
+            return getattr(
                 common_date_utils,
-                f'get_{self._date_grain_name}_index_of_{offset_grain_name}',
+                f'get_{self._date_grain_name}_index_of_{self._get_located_grain_name()}',
             )
         except AttributeError:
             raise NotImplementedError(
                 f'{self._date_grain_name} period\'s index in {self._offset_grain_name} period '
                 f'has not been implemented'
             )
-        return func(
-            self._date_range.start_date,
-            firstweekday=self._date_range.firstweekday,
-        )
-
-    def _get_compared_located_period_start_date(self) -> datetime.date:
-        if self._date_period_offset.offset_granularity == OffsetGranularity.PERIODIC:
-            offset_grain_name = self._date_grain_name
-            given_date_range_length = self._date_range.date_granularity.get_date_range_length(
-                self._date_range.start_date,
-                self._date_range.end_date,
-            )
-            offset = int(self._date_period_offset.offset * given_date_range_length)
-        else:
-            offset_grain_name = self._offset_grain_name
-            offset = self._date_period_offset.offset
 
+    def _get_compared_located_period_start_date_func(self) -> Callable[..., datetime.date]:
         try:
-            func = getattr(
+            return getattr(
                 common_date_utils,
-                f'get_compared_start_{self._date_grain_name}_located_{offset_grain_name}',
+                f'get_compared_start_{self._date_grain_name}_located_{self._get_located_grain_name()}',
             )
         except AttributeError:
             raise NotImplementedError(
                 f'start {self._date_grain_name} period in {self._offset_grain_name} period '
                 f'has not been implemented'
             )
-        return func(
-            self._date_range.start_date,
-            offset,
-            firstweekday=self._date_range.firstweekday,
-        )
-
-    def _get_compared_start_date(
-        self,
-        located_period_start_date: datetime.date,
-        period_index: int,
-    ) -> datetime.date:
-        if self._date_period_offset.offset_granularity == OffsetGranularity.PERIODIC:
-            offset_grain_name = self._date_grain_name
-        else:
-            offset_grain_name = self._offset_grain_name
 
+    def _get_compared_start_date_func(self) -> Callable[..., datetime.date]:
         try:
-            func = getattr(
+            return getattr(
                 common_date_utils,
-                f'get_{self._date_grain_name}_with_index_in_{offset_grain_name}',
+                f'get_{self._date_grain_name}_with_index_in_{self._get_located_grain_name()}',
             )
         except AttributeError:
             raise NotImplementedError(
                 f'{self._date_grain_name} period with index in {self._offset_grain_name} period '
                 f'has not been implemented'
             )
-        return func(
-            located_period_start_date,
-            period_index,
-            firstweekday=self._date_range.firstweekday,
-        )
 
     def get(self) -> Tuple[datetime.date, datetime.date]:
         """
@@ -140,24 +116,69 @@ class DeLoreans:
            2.1 get the length of given date range
            2.2 get the end date away from compared date range's start date with above length
                as compared date range's end date
+
+        Each phase is reported to the tracer installed by 'deloreans.set_tracer', in the order they run
         """
-        start_period_index = self._get_start_period_index()
-        base_start_date = self._get_compared_located_period_start_date()
-        compared_start_date = self._get_compared_start_date(
-            base_start_date,
-            start_period_index,
-        )
+        tracer = get_tracer()
+        date_range = self._date_range
+        date_granularity = date_range.date_granularity
+        start_date = date_range.start_date
+        firstweekday = date_range.firstweekday
+
+        func: Callable[..., Any] = self._get_start_period_index_func()
+        started_ns = perf_counter_ns() if tracer is not None else 0
+        start_period_index = func(start_date, firstweekday=firstweekday)
+        if tracer is not None:
+            _report(
+                tracer, 'start_period_index', func, started_ns,
+                start_date=start_date, firstweekday=firstweekday, index=start_period_index,
+            )
 
-        date_granularity = self._date_range.date_granularity
-        given_date_range_length = date_granularity.get_date_range_length(
-            self._date_range.start_date,
-            self._date_range.end_date,
-            self._date_range.firstweekday,
-        )
-        compared_end_date = date_granularity.get_end_date(
-            compared_start_date,
-            given_date_range_length,
-            self._date_range.firstweekday
-        )
+        started_ns = perf_counter_ns() if tracer is not None else 0
+        date_range_length = date_range.length
+        if tracer is not None:
+            _report(
+                tracer, 'date_range_length', date_granularity.get_date_range_length, started_ns,
+                start_date=start_date, end_date=date_range.end_date, length=date_range_length,
+            )
+
+        func = self._get_compared_located_period_start_date_func()
+        offset = self._date_period_offset.offset
+        if self._date_period_offset.offset_granularity == OffsetGranularity.PERIODIC:
+            offset = int(offset * date_range_length)
+        started_ns = perf_counter_ns() if tracer is not None else 0
+        located_period_start_date = func(start_date, offset, firstweekday=firstweekday)
+        if tracer is not None:
+            _report(
+                tracer, 'located_period_start_date', func, started_ns,
+                start_date=start_date, offset=offset, located_period_start_date=located_period_start_date,
+            )
+
+        func = self._get_compared_start_date_func()
+        started_ns = perf_counter_ns() if tracer is not None else 0
+        compared_start_date = func(located_period_start_date, start_period_index, firstweekday=firstweekday)
+        if tracer is not None:
+            _report(
+                tracer, 'compared_start_date', func, started_ns,
+                located_period_start_date=located_period_start_date,
+                index=start_period_index,
+                compared_start_date=compared_start_date,
+            )
+
+        # the compared start date is always the start date of period
+        func = date_granularity.get_end_date
+        started_ns = perf_counter_ns() if tracer is not None else 0
+        compared_end_date = func(compared_start_date, date_range_length, firstweekday, trusted=True)
+        if tracer is not None:
+            _report(
+                tracer, 'compared_end_date', func, started_ns,
+                compared_start_date=compared_start_date,
+                length=date_range_length,
+                compared_end_date=compared_end_date,
+            )
 
         return compared_start_date, compared_end_date
+
+
+def _report(tracer: Tracer, phase: str, func: Callable[..., Any], started_ns: int, **values: Any) -> None:
+    tracer(TraceEvent(phase, func, values, perf_counter_ns() - started_ns))
@@ -0,0 +1,213 @@
+"""
+deloreans.arrow
+
+This module provides compared date ranges of Apache Arrow date32 arrays with 'deloreans.vectorized',
+reading their data buffers as int32 epoch days in place and wrapping results as date32 arrays without copying
+
+Null bitmaps are kept, that is, compared date range is null when given start or end date is null.
+pyarrow is an optional dependency which should be installed before importing this module
+
+    >>> import deloreans.arrow
+    >>> deloreans.arrow.compare(
+    ...     table['start_date'], table['end_date'], DateGranularity.MONTHLY, -1, OffsetGranularity.YEARLY,
+    ... )
+"""
+from typing import Any, Optional, Tuple
+
+try:
+    import numpy as np  # type: ignore[import]
+    import pyarrow as pa  # type: ignore[import]
+except ImportError:  # pragma: no cover
+    raise ImportError(
+        'deloreans.arrow requires pyarrow, please install it by "python -m pip install pyarrow"'
+    )
+
+from deloreans.date_utils import DateGranularity, OffsetGranularity
+import deloreans.vectorized as vectorized
+
+
+_DAYS_DTYPE = np.int32
+
+# Arrow types whose data buffer is int32 epoch days
+_DAYS_TYPES = (pa.date32(), pa.int32())
+
+
+def to_days(array: Any) -> Tuple[Any, Optional[Any], int]:
+    """
+    view the data buffer of date32 array, or any buffer of int32 epoch days, as numpy int32 array
+
+    Args:
+        array (pa.Array or buffer): date32 or int32 Arrow array, numpy array or object supporting buffer protocol
+
+    Returns:
+        days (np.ndarray): int32 epoch days, values of null slots are undefined
+        validity (Optional[pa.Buffer]): null bitmap, None when there is no null
+        offset (int): offset of the first value in validity bitmap
+    """
+    if isinstance(array, pa.Array):
+        if array.type not in _DAYS_TYPES:
+            raise ValueError(f'Invalid array with type {array.type}, should be date32 or int32')
+        validity, data = array.buffers()
+        days = np.frombuffer(data, dtype=_DAYS_DTYPE, count=array.offset + len(array))[array.offset:]
+        if array.null_count == 0:
+            validity = None
+        return days, validity, array.offset
+    if not isinstance(array, np.ndarray):
+        array = np.frombuffer(array, dtype=_DAYS_DTYPE)
+    days, _ = vectorized.as_days(array)
+    if days.ndim != 1:
+        raise ValueError(f'Invalid days with shape {days.shape}, should be 1-D array')
+    return days, None, 0
+
+
+def _unpack_mask(validity: Any, offset: int, length: int) -> Any:
+    """
+    boolean array of whether each slot is null
+    """
+    bits = np.unpackbits(
+        np.frombuffer(validity, dtype=np.uint8),
+        count=offset + length,
+        bitorder='little',
+    )
+    return bits[offset:] == 0
+
+
+def to_date32(days: Any, validity: Optional[Any] = None, null_count: int = -1) -> Any:
+    """
+    wrap int32 epoch days as date32 array without copying
+
+    Args:
+        days (np.ndarray): contiguous int32 epoch days
+        validity (Optional[pa.Buffer]): null bitmap starting from the first value
+        null_count (int): amount of nulls, -1 to count lazily
+    """
+    days = np.ascontiguousarray(days, dtype=_DAYS_DTYPE)
+    if validity is None:
+        null_count = 0
+    return pa.Array.from_buffers(pa.date32(), len(days), [validity, pa.py_buffer(days)], null_count)
+
+
+def _compare_arrays(
+    start: Any,
+    end: Any,
+    date_granularity: DateGranularity,
+    offset: Any,
+    offset_granularity: OffsetGranularity,
+    firstweekday: int,
+    errors: str,
+) -> Tuple[Any, Any]:
+    start_days, start_validity, start_offset = to_days(start)
+    end_days, end_validity, end_offset = to_days(end)
+    if start_days.shape != end_days.shape:
+        raise ValueError(f'Mismatched lengths of start dates {len(start_days)} and end dates {len(end_days)}')
+    length = len(start_days)
+
+    mask = None
+    if start_validity is not None:
+        mask = _unpack_mask(start_validity, start_offset, length)
+    if end_validity is not None:
+        end_mask = _unpack_mask(end_validity, end_offset, length)
+        mask = end_mask if mask is None else mask | end_mask
+
+    # values of null slots are replaced by a complete date range, then masked again in results
+    if mask is not None:
+        placeholder_start, placeholder_end = vectorized._get_placeholder(date_granularity, firstweekday)
+        start_days = np.where(mask, placeholder_start, start_days)
+        end_days = np.where(mask, placeholder_end, end_days)
+
+    compared_start_days, compared_end_days, valid = vectorized.compare(
+        start_days,
+        end_days,
+        date_granularity,
+        offset,
+        offset_granularity,
+        firstweekday,
+    )
+    invalid = ~valid if mask is None else ~valid & ~mask
+    if invalid.any():
+        if errors == 'raise':
+            raise ValueError(
+                f'{np.count_nonzero(invalid)} date ranges have no compared date range'
+            )
+        mask = invalid if mask is None else mask | invalid
+
+    validity = None
+    if mask is not None:
+        if start_validity is not None and end_validity is None and start_offset % 8 == 0 and not invalid.any():
+            # reuse the null bitmap as it is
+            validity = start_validity.slice(start_offset // 8)
+        elif end_validity is not None and start_validity is None and end_offset % 8 == 0 and not invalid.any():
+            validity = end_validity.slice(end_offset // 8)
+        else:
+            validity = pa.py_buffer(np.packbits(~mask, bitorder='little'))
+    null_count = -1 if mask is None else int(np.count_nonzero(mask))
+    return (
+        to_date32(compared_start_days, validity, null_count),
+        to_date32(compared_end_days, validity, null_count),
+    )
+
+
+def compare(
+    start: Any,
+    end: Any,
+    date_granularity: DateGranularity,
+    offset: Any,
+    offset_granularity: OffsetGranularity,
+    firstweekday: int = 0,
+    errors: str = 'raise',
+) -> Tuple[Any, Any]:
+    """
+    provide compared date ranges of date32 arrays, refer to 'deloreans.vectorized.compare'
+
+    Args:
+        start (pa.Array, pa.ChunkedArray or buffer): start dates, date32 or int32 epoch days
+        end (pa.Array, pa.ChunkedArray or buffer): end dates, date32 or int32 epoch days
+        date_granularity (DateGranularity): granularity of date range, e.g. daily, weekly
+        offset (int or array): away from given date range, to the future when positive
+        offset_granularity (OffsetGranularity): granularity of offset period, e.g. year-over-year
+        firstweekday (int): define the start date's weekday of week, 0 is Monday, 6 is Sunday
+        errors (str): when 'coerce', date range without compared one would be null instead of raising
+
+    Returns:
+        compared_start_dates (pa.Array or pa.ChunkedArray): date32 start dates of compared date ranges
+        compared_end_dates (pa.Array or pa.ChunkedArray): date32 end dates of compared date ranges,
+                                                          chunked as given start dates when they are chunked
+    """
+    if errors not in ('raise', 'coerce'):
+        raise ValueError(f'Invalid errors {errors!r}, should be "raise" or "coerce"')
+    if not isinstance(start, pa.ChunkedArray):
+        if isinstance(end, pa.ChunkedArray):
+            end = end.combine_chunks()
+        return _compare_arrays(start, end, date_granularity, offset, offset_granularity, firstweekday, errors)
+
+    if not isinstance(end, pa.ChunkedArray):
+        # end dates are sliced along chunks of start dates, as a single chunk
+        if not isinstance(end, pa.Array):
+            end = to_date32(to_days(end)[0])
+        end = pa.chunked_array([end])
+    if len(start) != len(end):
+        raise ValueError(f'Mismatched lengths of start dates {len(start)} and end dates {len(end)}')
+    offsets = np.asarray(offset)
+    compared_start_chunks, compared_end_chunks = [], []
+    position = 0
+    for start_chunk in start.chunks:
+        chunk_length = len(start_chunk)
+        # slices of chunked array are zero-copy, and so is combining a single chunk
+        end_chunk = end.slice(position, chunk_length)
+        end_chunk = end_chunk.chunk(0) if end_chunk.num_chunks == 1 else end_chunk.combine_chunks()
+        compared_start_chunk, compared_end_chunk = _compare_arrays(
+            start_chunk,
+            end_chunk,
+            date_granularity,
+            offsets if offsets.ndim == 0 else offsets[position:position + chunk_length],
+            offset_granularity,
+            firstweekday,
+            errors,
+        )
+        compared_start_chunks.append(compared_start_chunk)
+        compared_end_chunks.append(compared_end_chunk)
+        position += chunk_length
+    return (
+        pa.chunked_array(compared_start_chunks, type=pa.date32()),
+        pa.chunked_array(compared_end_chunks, type=pa.date32()),
+    )
@@ -0,0 +1,204 @@
+"""
+deloreans.cache
+
+This module provides an opt-in bounded LRU cache in front of 'deloreans.get'
+
+    >>> deloreans.enable_cache(maxsize=1024)
+    >>> deloreans.get(...)
+    >>> deloreans.cache_info()
+    CacheInfo(hits=0, misses=1, evictions=0, maxsize=1024, currsize=1)
+"""
+from __future__ import annotations
+import datetime
+import threading
+from collections import namedtuple, OrderedDict
+from typing import Any, Hashable, Optional, Tuple
+
+from deloreans.app import DeLoreans
+from deloreans.date_utils import DateGranularity, OffsetGranularity
+
+
+class CacheInfo(namedtuple('CacheInfo', ['hits', 'misses', 'evictions', 'maxsize', 'currsize'])):
+    __slots__ = ()
+
+
+# invalid inputs are cached with the exception they raised
+_CACHED_EXCEPTIONS = (ValueError, TypeError, NotImplementedError)
+
+
+def make_key(
+    start_date: datetime.date,
+    end_date: datetime.date,
+    date_granularity: DateGranularity,
+    offset: int,
+    offset_granularity: OffsetGranularity,
+    firstweekday: int = 0,
+) -> Hashable:
+    """
+    canonical key of 'deloreans.get' arguments, the ones standing for the same date periods share a key,
+    e.g. firstweekday doesn't matter when neither granularity is weekly
+
+    The key may be unhashable when the arguments are, which are invalid ones
+    """
+    if (
+        date_granularity != DateGranularity.WEEKLY
+        and offset_granularity != OffsetGranularity.WEEKLY
+        and isinstance(firstweekday, int)
+        and 0 <= firstweekday < 7
+    ):
+        firstweekday = 0
+    return (
+        type(start_date),
+        start_date,
+        type(end_date),
+        end_date,
+        date_granularity,
+        type(offset),
+        offset,
+        offset_granularity,
+        type(firstweekday),
+        firstweekday,
+    )
+
+
+class ComparisonCache:
+    """
+    Least-recently-used cache of compared date ranges
+
+    Keys are canonicalized by 'make_key', so that the inputs standing for the same date periods share an entry
+    """
+
+    def __init__(self, maxsize: int = 1024) -> None:
+        if not isinstance(maxsize, int):
+            raise TypeError(f'Invalid maxsize {maxsize!r}, should be int')
+        if maxsize < 1:
+            raise ValueError(f'Invalid maxsize {maxsize!r}, should be positive')
+        self._maxsize = maxsize
+        self._entries: 'OrderedDict[Hashable, Tuple[bool, Any]]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(
+        self,
+        start_date: datetime.date,
+        end_date: datetime.date,
+        date_granularity: DateGranularity,
+        offset: int,
+        offset_granularity: OffsetGranularity,
+        firstweekday: int = 0,
+    ) -> Tuple[datetime.date, datetime.date]:
+        """
+        provide compared date range from cache, compute and cache it when missed
+        """
+        params = (start_date, end_date, date_granularity, offset, offset_granularity, firstweekday)
+        key = make_key(*params)
+        try:
+            hash(key)
+        except TypeError:
+            # unhashable inputs are invalid, let the component raise the exception
+            return DeLoreans(*params).get()
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+            else:
+                self._misses += 1
+
+        if entry is None:
+            entry = self._compute(*params)
+            self._put(key, entry)
+
+        is_valid, value = entry
+        if not is_valid:
+            exc_type, exc_args = value
+            raise exc_type(*exc_args)
+        return value
+
+    @staticmethod
+    def _compute(
+        start_date: datetime.date,
+        end_date: datetime.date,
+        date_granularity: DateGranularity,
+        offset: int,
+        offset_granularity: OffsetGranularity,
+        firstweekday: int = 0,
+    ) -> Tuple[bool, Any]:
+        """
+        Returns:
+            is_valid (bool): whether the inputs are valid
+            value (Any): compared date range when valid, otherwise the exception type and arguments
+        """
+        try:
+            return True, DeLoreans(
+                start_date,
+                end_date,
+                date_granularity,
+                offset,
+                offset_granularity,
+                firstweekday,
+            ).get()
+        except _CACHED_EXCEPTIONS as e:
+            return False, (type(e), e.args)
+
+    def _put(self, key: Hashable, entry: Tuple[bool, Any]) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(
+                self._hits,
+                self._misses,
+                self._evictions,
+                self._maxsize,
+                len(self._entries),
+            )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+
+
+_cache: Optional[ComparisonCache] = None
+
+
+def enable_cache(maxsize: int = 1024) -> None:
+    """
+    cache compared date ranges of 'deloreans.get', with the amount of entries up to 'maxsize'
+    """
+    global _cache
+    _cache = ComparisonCache(maxsize)
+
+
+def disable_cache() -> None:
+    global _cache
+    _cache = None
+
+
+def get_cache() -> Optional[ComparisonCache]:
+    return _cache
+
+
+def cache_info() -> Optional[CacheInfo]:
+    """
+    statistics of the cache, None when the cache is disabled
+    """
+    if _cache is None:
+        return None
+    return _cache.info()
+
+
+def cache_clear() -> None:
+    if _cache is not None:
+        _cache.clear()
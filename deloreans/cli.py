@@ -0,0 +1,338 @@
+"""
+deloreans.cli
+
+This module provides the command line interface, which transforms date ranges from CSV or JSON Lines
+into their compared date ranges
+
+    > python -m deloreans exports.csv --date-granularity monthly --offset -1 --offset-granularity yearly
+
+Records are read, compared and written chunk by chunk, so that memory usage doesn't grow with the input.
+Each record provides the parameters of 'deloreans.get' by field name,
+dates are in ISO format and granularities are in lower-case names, e.g. 'weekly'.
+Missing fields are filled with the defaults given by options.
+Output records are the input ones with 'compared_start_date' and 'compared_end_date' appended
+"""
+from __future__ import annotations
+import argparse
+import csv
+import datetime
+import json
+import sys
+from contextlib import ExitStack
+from itertools import islice
+from typing import Any, Callable, IO, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from deloreans.api import get, get_many
+from deloreans.date_utils import DateGranularity, OffsetGranularity
+
+
+FIELDS = (
+    'start_date',
+    'end_date',
+    'date_granularity',
+    'offset',
+    'offset_granularity',
+    'firstweekday',
+)
+COMPARED_FIELDS = ('compared_start_date', 'compared_end_date')
+
+DEFAULT_CHUNK_SIZE = 10000
+
+_DATE_GRANULARITIES = {member.name.lower(): member for member in DateGranularity}
+_OFFSET_GRANULARITIES = {member.name.lower(): member for member in OffsetGranularity}
+
+# exceptions of invalid records, which are reported with record number
+_INVALID_RECORD_EXCEPTIONS = (ValueError, TypeError, AttributeError, NotImplementedError, OverflowError)
+
+
+def _parse_date(value: Any) -> datetime.date:
+    return datetime.date.fromisoformat(value)
+
+
+def _parse_date_granularity(value: Any) -> DateGranularity:
+    if isinstance(value, DateGranularity):
+        return value
+    granularity = _DATE_GRANULARITIES.get(value.lower())
+    if granularity is None:
+        raise ValueError(f'Invalid date granularity {value!r}')
+    return granularity
+
+
+def _parse_offset_granularity(value: Any) -> OffsetGranularity:
+    if isinstance(value, OffsetGranularity):
+        return value
+    granularity = _OFFSET_GRANULARITIES.get(value.lower())
+    if granularity is None:
+        raise ValueError(f'Invalid offset granularity {value!r}')
+    return granularity
+
+
+def _parse_int(value: Any) -> int:
+    if isinstance(value, bool) or isinstance(value, float):
+        raise TypeError(f'Invalid integer {value!r}')
+    return int(value)
+
+
+# field parsers in the order of 'FIELDS'
+_PARSERS: Tuple[Callable[[Any], Any], ...] = (
+    _parse_date,
+    _parse_date,
+    _parse_date_granularity,
+    _parse_int,
+    _parse_offset_granularity,
+    _parse_int,
+)
+
+
+def parse_request(
+    values: Sequence[Any],
+    defaults: Sequence[Any],
+) -> Tuple[Any, ...]:
+    """
+    parse raw field values into the parameters of 'deloreans.get'
+
+    Args:
+        values (Sequence): raw value of each field in the order of 'FIELDS', None or empty string if missing
+        defaults (Sequence): parsed default value of each field in the order of 'FIELDS', None if no default
+
+    Returns:
+        params (tuple): parameters in the order of 'deloreans.get' arguments
+    """
+    params = []
+    for field, parser, value, default in zip(FIELDS, _PARSERS, values, defaults):
+        if value is None or value == '':
+            if default is None:
+                raise ValueError(f'Missing {field}')
+            params.append(default)
+        else:
+            params.append(parser(value))
+    return tuple(params)
+
+
+class _InvalidRequest:
+
+    __slots__ = ('error',)
+
+    def __init__(self, error: Exception) -> None:
+        self.error = error
+
+
+def compare_chunk(requests: Sequence[Any]) -> List[Any]:
+    """
+    compare a chunk of parsed requests with batch engine 'deloreans.get_many'
+
+    Args:
+        requests (Sequence): parameters tuple of each request, or '_InvalidRequest' which failed on parsing
+
+    Returns:
+        results (list): compared date range of each request in the order of input,
+                        or '_InvalidRequest' with the exception it raised
+    """
+    valid_positions = [
+        position for position, request in enumerate(requests)
+        if not isinstance(request, _InvalidRequest)
+    ]
+    results: List[Any] = list(requests)
+    try:
+        compared = get_many([requests[position] for position in valid_positions])
+    except _INVALID_RECORD_EXCEPTIONS:
+        # locate the invalid ones request by request
+        for position in valid_positions:
+            try:
+                results[position] = get(*requests[position])
+            except _INVALID_RECORD_EXCEPTIONS as error:
+                results[position] = _InvalidRequest(error)
+        return results
+    for position, compared_date_range in zip(valid_positions, compared):
+        results[position] = compared_date_range
+    return results
+
+
+class InvalidRecordError(ValueError):
+
+    def __init__(self, record_number: int, error: Exception) -> None:
+        super().__init__(f'record {record_number}: {error!r}')
+        self.record_number = record_number
+        self.error = error
+
+
+class Transformer:
+    """
+    Read records in chunks, compare and write them back in the same format
+
+    Args:
+        defaults (Sequence): parsed default value of each field in the order of 'FIELDS', None if no default
+        chunk_size (int): number of records compared in a batch
+        skip_invalid (bool): write invalid records with empty compared dates instead of raising
+    """
+
+    def __init__(
+        self,
+        defaults: Sequence[Any],
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        skip_invalid: bool = False,
+    ) -> None:
+        if chunk_size < 1:
+            raise ValueError(f'Invalid chunk size {chunk_size!r}, should be positive')
+        self.defaults = tuple(defaults)
+        self.chunk_size = chunk_size
+        self.skip_invalid = skip_invalid
+        self.records = 0
+        self.invalid_records = 0
+
+    def _parse(self, values: Sequence[Any]) -> Any:
+        try:
+            return parse_request(values, self.defaults)
+        except _INVALID_RECORD_EXCEPTIONS as error:
+            return _InvalidRequest(error)
+
+    def _iter_compared(self, chunk_values: Iterable[Any]) -> Iterator[Tuple[str, str]]:
+        """
+        Args:
+            chunk_values (Iterable): raw field values of each record, or '_InvalidRequest' of malformed record
+
+        Yields:
+            compared_dates (tuple): ISO format compared start and end date of each record,
+                                    empty strings for invalid records when they are skipped
+        """
+        requests = [
+            values if isinstance(values, _InvalidRequest) else self._parse(values)
+            for values in chunk_values
+        ]
+        for result in compare_chunk(requests):
+            self.records += 1
+            if isinstance(result, _InvalidRequest):
+                if not self.skip_invalid:
+                    raise InvalidRecordError(self.records, result.error)
+                self.invalid_records += 1
+                yield '', ''
+            else:
+                compared_start_date, compared_end_date = result
+                yield compared_start_date.isoformat(), compared_end_date.isoformat()
+
+    def transform_csv(self, input_stream: IO[str], output_stream: IO[str]) -> None:
+        reader = csv.reader(input_stream)
+        header = next(reader, None)
+        if header is None:
+            return
+        indices = [header.index(field) if field in header else None for field in FIELDS]
+        writer = csv.writer(output_stream, lineterminator='\n')
+        writer.writerow(header + list(COMPARED_FIELDS))
+
+        while True:
+            rows = list(islice(reader, self.chunk_size))
+            if not rows:
+                break
+            chunk_values = [
+                [row[index] if index is not None and index < len(row) else None for index in indices]
+                for row in rows
+            ]
+            writer.writerows(
+                row + list(compared_dates)
+                for row, compared_dates in zip(rows, self._iter_compared(chunk_values))
+            )
+            output_stream.flush()
+
+    def transform_jsonl(self, input_stream: IO[str], output_stream: IO[str]) -> None:
+        lines = (line for line in input_stream if line.strip())
+        while True:
+            chunk_lines = list(islice(lines, self.chunk_size))
+            if not chunk_lines:
+                break
+            records: List[Any] = []
+            for line in chunk_lines:
+                try:
+                    record = json.loads(line)
+                    if not isinstance(record, dict):
+                        raise TypeError('Record should be an object')
+                except (ValueError, TypeError) as error:
+                    # malformed line is an invalid record, which is written back as it is when skipped
+                    record = _InvalidRequest(error)
+                records.append(record)
+            chunk_values = [
+                record if isinstance(record, _InvalidRequest) else [record.get(field) for field in FIELDS]
+                for record in records
+            ]
+            compared = self._iter_compared(chunk_values)
+            for line, record, (compared_start_date, compared_end_date) in zip(chunk_lines, records, compared):
+                if isinstance(record, _InvalidRequest):
+                    output_stream.write(line.rstrip('\r\n'))
+                    output_stream.write('\n')
+                    continue
+                record['compared_start_date'] = compared_start_date or None
+                record['compared_end_date'] = compared_end_date or None
+                output_stream.write(json.dumps(record))
+                output_stream.write('\n')
+            output_stream.flush()
+
+
+def _infer_format(path: str) -> str:
+    if path.endswith(('.jsonl', '.ndjson')):
+        return 'jsonl'
+    return 'csv'
+
+
+def _parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog='python -m deloreans',
+        description='Transform date ranges from CSV or JSON Lines into their compared date ranges',
+    )
+    parser.add_argument('input', nargs='?', default='-', help='input file, read stdin when omitted or -')
+    parser.add_argument('-o', '--output', default='-', help='output file, write stdout when omitted or -')
+    parser.add_argument(
+        '--format',
+        choices=('csv', 'jsonl'),
+        help='format of input and output, inferred from input file extension by default',
+    )
+    parser.add_argument('--date-granularity', choices=sorted(_DATE_GRANULARITIES))
+    parser.add_argument('--offset', type=int)
+    parser.add_argument('--offset-granularity', choices=sorted(_OFFSET_GRANULARITIES))
+    parser.add_argument('--firstweekday', type=int, default=0)
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument(
+        '--skip-invalid',
+        action='store_true',
+        help='write invalid records with empty compared dates instead of failing',
+    )
+    args = parser.parse_args(argv)
+    if args.chunk_size < 1:
+        parser.error(f'invalid chunk size {args.chunk_size}, should be positive')
+    return args
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    args = _parse_args(argv)
+    file_format = args.format or _infer_format(args.input)
+    defaults = (
+        None,
+        None,
+        _DATE_GRANULARITIES.get(args.date_granularity),
+        args.offset,
+        _OFFSET_GRANULARITIES.get(args.offset_granularity),
+        args.firstweekday,
+    )
+    transformer = Transformer(defaults, args.chunk_size, args.skip_invalid)
+    transform = transformer.transform_csv if file_format == 'csv' else transformer.transform_jsonl
+
+    # newline translation is left to csv module
+    newline = '' if file_format == 'csv' else None
+    try:
+        with ExitStack() as stack:
+            input_stream = sys.stdin
+            if args.input != '-':
+                input_stream = stack.enter_context(open(args.input, newline=newline, encoding='utf-8'))
+            output_stream = sys.stdout
+            if args.output != '-':
+                output_stream = stack.enter_context(open(args.output, 'w', newline=newline, encoding='utf-8'))
+            transform(input_stream, output_stream)
+    except (InvalidRecordError, OSError) as error:
+        # e.g. missing input file or unwritable output path
+        print(f'deloreans: {error}', file=sys.stderr)
+        return 1
+
+    if transformer.invalid_records:
+        print(
+            f'deloreans: skipped {transformer.invalid_records} invalid record(s) of {transformer.records}',
+            file=sys.stderr,
+        )
+    return 0
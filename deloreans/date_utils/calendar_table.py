@@ -0,0 +1,244 @@
+"""
+deloreans.date_utils.calendar_table
+
+This module provides precomputed week calendars, one per firstweekday,
+which answer week-related questions of a date with index lookup on its proleptic ordinal
+
+Tables cover the dates within a year window, and are built lazily on first use.
+Lookups return None for dates out of the window, then callers should fall back to date arithmetic
+"""
+from __future__ import annotations
+import datetime
+from array import array
+from typing import Dict, Optional, Tuple
+
+
+DEFAULT_MIN_YEAR = 1900
+DEFAULT_MAX_YEAR = 2099
+
+
+def _get_weekly_start_ordinal(ordinal: int, firstweekday: int) -> int:
+    # ordinal 1 (0001-01-01) is Monday
+    return ordinal - (ordinal + 6 - firstweekday) % 7
+
+
+def _get_start_weekly_ordinal_of_month(month_serial: int, firstweekday: int) -> int:
+    """
+    ordinal of the start date of month's start week, month serial is 'year * 12 + month - 1'
+    """
+    year, month_index = divmod(month_serial, 12)
+    daily_start_ordinal = datetime.date(year, month_index + 1, 1).toordinal()
+    week_start_ordinal = _get_weekly_start_ordinal(daily_start_ordinal, firstweekday)
+    # the week represented by anchor date is in previous month
+    # so that the first week should be the next one
+    if daily_start_ordinal > week_start_ordinal + 3:
+        week_start_ordinal += 7
+    return week_start_ordinal
+
+
+class CalendarTable:
+    """
+    Week calendar with given firstweekday within years from 'min_year' to 'max_year'
+
+    Per-day tables are keyed by ordinal, per-month tables by month serial
+    which is 'year * 12 + month - 1', and per-year tables by year
+    """
+
+    __slots__ = (
+        '_firstweekday',
+        '_min_year',
+        '_max_year',
+        '_first_ordinal',
+        '_last_ordinal',
+        '_first_month_serial',
+        '_last_month_serial',
+        '_week_index_of_day',
+        '_anchor_month_serial',
+        '_week_index_of_month',
+        '_week_index_of_year',
+        '_start_weekly_of_month',
+        '_weeks_of_month',
+        '_weeks_of_year',
+    )
+
+    def __init__(
+        self,
+        firstweekday: int = 0,
+        min_year: int = DEFAULT_MIN_YEAR,
+        max_year: int = DEFAULT_MAX_YEAR,
+    ) -> None:
+        if not 0 <= firstweekday < 7:
+            raise ValueError
+        # neighbour years are required to resolve weeks across the boundaries of window
+        if not datetime.MINYEAR < min_year <= max_year < datetime.MAXYEAR:
+            raise ValueError(
+                f'Invalid year window from {min_year} to {max_year}'
+            )
+        self._firstweekday = firstweekday
+        self._min_year = min_year
+        self._max_year = max_year
+        self._first_ordinal = datetime.date(min_year, 1, 1).toordinal()
+        self._last_ordinal = datetime.date(max_year, 12, 31).toordinal()
+        self._first_month_serial = min_year * 12
+        self._last_month_serial = max_year * 12 + 11
+        self._build()
+
+    @property
+    def firstweekday(self) -> int:
+        return self._firstweekday
+
+    @property
+    def min_year(self) -> int:
+        return self._min_year
+
+    @property
+    def max_year(self) -> int:
+        return self._max_year
+
+    def _build(self) -> None:
+        firstweekday = self._firstweekday
+        first_ordinal, last_ordinal = self._first_ordinal, self._last_ordinal
+
+        # from the month before window to the month after window
+        start_weekly_of_month = [
+            _get_start_weekly_ordinal_of_month(month_serial, firstweekday)
+            for month_serial in range(self._first_month_serial - 1, self._last_month_serial + 3)
+        ]
+        weeks_of_month = [
+            (exceeded - start) // 7
+            for start, exceeded in zip(start_weekly_of_month, start_weekly_of_month[1:])
+        ]
+        # from the year before window to the year after window
+        start_weekly_of_year = [
+            _get_start_weekly_ordinal_of_month(year * 12, firstweekday)
+            for year in range(self._min_year - 1, self._max_year + 2)
+        ]
+        weeks_of_year = [
+            (exceeded - start) // 7
+            for start, exceeded in zip(start_weekly_of_year, start_weekly_of_year[1:])
+        ]
+
+        # per-day values are filled month by month with slices of a repeated week index pattern,
+        # so that no Python code runs per day
+        week_indexes = array('b', [week_index for week_index in range(54) for _ in range(7)])
+        anchor_month_serial = array('l')
+        week_index_of_month = array('b')
+        week_index_of_year = array('b')
+        for position, month_start in enumerate(start_weekly_of_month[:-1]):
+            month_serial = self._first_month_serial - 1 + position
+            year_start = start_weekly_of_year[month_serial // 12 - self._min_year + 1]
+            month_days = weeks_of_month[position] * 7
+            year_position = month_start - year_start
+            anchor_month_serial.extend(array('l', [month_serial]) * month_days)
+            week_index_of_month.extend(week_indexes[:month_days])
+            week_index_of_year.extend(week_indexes[year_position:year_position + month_days])
+
+        # weeks start from the start week of the month before window
+        days = last_ordinal - first_ordinal + 1
+        first_position = first_ordinal - start_weekly_of_month[0]
+        last_position = first_position + days
+        week_pattern = array('b', [(first_ordinal + position + 6 - firstweekday) % 7 for position in range(7)])
+        self._week_index_of_day = (week_pattern * (days // 7 + 1))[:days]
+        self._anchor_month_serial = anchor_month_serial[first_position:last_position]
+        self._week_index_of_month = week_index_of_month[first_position:last_position]
+        self._week_index_of_year = week_index_of_year[first_position:last_position]
+        # per-month tables include the month before and after window
+        self._start_weekly_of_month = array('l', start_weekly_of_month[:-1])
+        self._weeks_of_month = array('b', weeks_of_month)
+        self._weeks_of_year = array('b', weeks_of_year[1:])
+
+    def get_week_start(self, ordinal: int) -> Optional[int]:
+        """
+        ordinal of the start date of week which given date located
+        """
+        position = ordinal - self._first_ordinal
+        if not 0 <= position < len(self._week_index_of_day):
+            return None
+        return ordinal - self._week_index_of_day[position]
+
+    def get_anchor_month(self, ordinal: int) -> Optional[Tuple[int, int]]:
+        """
+        year and month of the week anchor date, refer to 'get_week_anchor_date'
+        """
+        position = ordinal - self._first_ordinal
+        if not 0 <= position < len(self._anchor_month_serial):
+            return None
+        year, month_index = divmod(self._anchor_month_serial[position], 12)
+        return year, month_index + 1
+
+    def get_anchor_month_serial(self, ordinal: int) -> Optional[int]:
+        position = ordinal - self._first_ordinal
+        if not 0 <= position < len(self._anchor_month_serial):
+            return None
+        return self._anchor_month_serial[position]
+
+    def get_week_index_of_month(self, ordinal: int) -> Optional[int]:
+        """
+        index of the week which given date located, in the month of week anchor date
+        """
+        position = ordinal - self._first_ordinal
+        if not 0 <= position < len(self._week_index_of_month):
+            return None
+        return self._week_index_of_month[position]
+
+    def get_week_index_of_year(self, ordinal: int) -> Optional[int]:
+        """
+        index of the week which given date located, in the year of week anchor date
+        """
+        position = ordinal - self._first_ordinal
+        if not 0 <= position < len(self._week_index_of_year):
+            return None
+        return self._week_index_of_year[position]
+
+    def get_start_weekly_of_month(self, month_serial: int) -> Optional[int]:
+        """
+        ordinal of the start date of month's start week
+        """
+        position = month_serial - self._first_month_serial + 1
+        if not 0 <= position < len(self._start_weekly_of_month):
+            return None
+        return self._start_weekly_of_month[position]
+
+    def get_weeks_of_month(self, month_serial: int) -> Optional[int]:
+        position = month_serial - self._first_month_serial + 1
+        if not 0 <= position < len(self._weeks_of_month):
+            return None
+        return self._weeks_of_month[position]
+
+    def get_weeks_of_year(self, year: int) -> Optional[int]:
+        position = year - self._min_year
+        if not 0 <= position < len(self._weeks_of_year):
+            return None
+        return self._weeks_of_year[position]
+
+
+_year_window: Tuple[int, int] = (DEFAULT_MIN_YEAR, DEFAULT_MAX_YEAR)
+_tables: Dict[int, CalendarTable] = {}
+
+
+def get_calendar_table(firstweekday: int = 0) -> CalendarTable:
+    """
+    calendar table of given firstweekday, which is built on first use
+    """
+    _firstweekday = firstweekday % 7
+    table = _tables.get(_firstweekday)
+    if table is None:
+        table = _tables[_firstweekday] = CalendarTable(_firstweekday, *_year_window)
+    return table
+
+
+def set_year_window(min_year: int, max_year: int) -> None:
+    """
+    define the years covered by calendar tables, which are rebuilt on next use
+    """
+    global _year_window
+    if not datetime.MINYEAR < min_year <= max_year < datetime.MAXYEAR:
+        raise ValueError(
+            f'Invalid year window from {min_year} to {max_year}'
+        )
+    _year_window = (min_year, max_year)
+    _tables.clear()
+
+
+def get_year_window() -> Tuple[int, int]:
+    return _year_window
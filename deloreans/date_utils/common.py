@@ -1,7 +1,11 @@
+from __future__ import annotations
 import datetime
 from datetime import timedelta
 from typing import Any
 
+from deloreans.date_utils.calendar_table import get_calendar_table
+from deloreans.date_utils.ordinal import get_days_of_month, get_days_of_year
+
 
 def get_weekly_start_date(
     a_date: datetime.date,
@@ -56,6 +60,11 @@ def get_start_weekly_of_month(
     which is represented by week's start date
     """
     _firstweekday = firstweekday % 7
+    if 1 <= month <= 12:
+        start_ordinal = get_calendar_table(_firstweekday).get_start_weekly_of_month(year * 12 + month - 1)
+        if start_ordinal is not None:
+            return datetime.date.fromordinal(start_ordinal)
+
     daily_start_date = datetime.date(year, month, 1)
     week_anchor_date = get_week_anchor_date(
         daily_start_date,
@@ -239,6 +248,10 @@ def get_weekly_index_of_monthly(
     **kwargs: Any,
 ) -> int:
     firstweekday: int = kwargs.get('firstweekday', 0)
+    index = get_calendar_table(firstweekday).get_week_index_of_month(a_date.toordinal())
+    if index is not None:
+        return index
+
     located_start_date = get_start_weekly_of_monthly(
         a_date,
         firstweekday=firstweekday,
@@ -252,6 +265,10 @@ def get_weekly_index_of_yearly(
     **kwargs: Any,
 ) -> int:
     firstweekday: int = kwargs.get('firstweekday', 0)
+    index = get_calendar_table(firstweekday).get_week_index_of_year(a_date.toordinal())
+    if index is not None:
+        return index
+
     located_start_date = get_start_weekly_of_yearly(
         a_date,
         firstweekday=firstweekday,
@@ -339,13 +356,8 @@ def get_compared_start_daily_located_monthly(
     located_start_date = get_start_daily_of_monthly(a_date)
     located_year, located_month = located_start_date.year, located_start_date.month
 
-    total_months = (located_year * 12 + located_month) + offset
-    compared_year = total_months // 12
-    compared_month = total_months % 12
-    if compared_month == 0:
-        compared_year -= 1
-        compared_month = 12
-    return datetime.date(compared_year, compared_month, 1)
+    compared_year, compared_month_index = divmod(located_year * 12 + located_month - 1 + offset, 12)
+    return datetime.date(compared_year, compared_month_index + 1, 1)
 
 
 def get_compared_start_daily_located_yearly(
@@ -376,6 +388,13 @@ def get_compared_start_weekly_located_monthly(
     **kwargs: Any,
 ) -> datetime.date:
     firstweekday: int = kwargs.get('firstweekday', 0)
+    calendar_table = get_calendar_table(firstweekday)
+    month_serial = calendar_table.get_anchor_month_serial(a_date.toordinal())
+    if month_serial is not None:
+        start_ordinal = calendar_table.get_start_weekly_of_month(month_serial + offset)
+        if start_ordinal is not None:
+            return datetime.date.fromordinal(start_ordinal)
+
     week_anchor_date = get_week_anchor_date(a_date, firstweekday)
     compared_month_start_date = get_compared_start_daily_located_monthly(
         week_anchor_date,
@@ -395,6 +414,13 @@ def get_compared_start_weekly_located_yearly(
     **kwargs: Any,
 ) -> datetime.date:
     firstweekday: int = kwargs.get('firstweekday', 0)
+    calendar_table = get_calendar_table(firstweekday)
+    month_serial = calendar_table.get_anchor_month_serial(a_date.toordinal())
+    if month_serial is not None:
+        start_ordinal = calendar_table.get_start_weekly_of_month((month_serial // 12 + offset) * 12)
+        if start_ordinal is not None:
+            return datetime.date.fromordinal(start_ordinal)
+
     week_anchor_date = get_week_anchor_date(a_date, firstweekday)
     compared_year_start_date = get_compared_start_daily_located_yearly(
         week_anchor_date,
@@ -489,18 +515,7 @@ def get_daily_with_index_in_monthly(
     index: int,
     **kwargs: Any,  # NOQA
 ) -> datetime.date:
-    next_month_total_months = (a_date.year * 12 + a_date.month) + 1
-    exceeded_year = next_month_total_months // 12
-    exceeded_month = next_month_total_months % 12
-    if exceeded_month == 0:
-        exceeded_year -= 1
-        exceeded_month = 12
-    next_month_start_date = datetime.date(
-        exceeded_year,
-        exceeded_month,
-        1,
-    )
-    capacity = (next_month_start_date - timedelta(days=1)).day
+    capacity = get_days_of_month(a_date.year, a_date.month)
     if not 0 <= index < capacity:
         raise ValueError
 
@@ -513,9 +528,7 @@ def get_daily_with_index_in_yearly(
     index: int,
     **kwargs: Any,  # NOQA
 ) -> datetime.date:
-    year_start_date = datetime.date(a_date.year, 1, 1)
-    year_end_date = datetime.date(a_date.year, 12, 31)
-    capacity = (year_end_date - year_start_date).days + 1
+    capacity = get_days_of_year(a_date.year)
     if not 0 <= index < capacity:
         raise ValueError
 
@@ -540,6 +553,17 @@ def get_weekly_with_index_in_monthly(
     **kwargs: Any,
 ) -> datetime.date:
     firstweekday: int = kwargs.get('firstweekday', 0)
+    calendar_table = get_calendar_table(firstweekday)
+    month_serial = calendar_table.get_anchor_month_serial(a_date.toordinal())
+    if month_serial is not None:
+        weeks_of_month = calendar_table.get_weeks_of_month(month_serial)
+        start_ordinal = calendar_table.get_start_weekly_of_month(month_serial)
+        if weeks_of_month is not None and start_ordinal is not None:
+            # each month has different amount of weeks
+            if not 0 <= index < weeks_of_month:
+                raise ValueError
+            return datetime.date.fromordinal(start_ordinal + 7 * index)
+
     anchor_date = get_week_anchor_date(
         a_date,
         firstweekday=firstweekday,
@@ -571,6 +595,18 @@ def get_weekly_with_index_in_yearly(
     **kwargs: Any,
 ) -> datetime.date:
     firstweekday: int = kwargs.get('firstweekday', 0)
+    calendar_table = get_calendar_table(firstweekday)
+    month_serial = calendar_table.get_anchor_month_serial(a_date.toordinal())
+    if month_serial is not None:
+        year = month_serial // 12
+        weeks_of_year = calendar_table.get_weeks_of_year(year)
+        start_ordinal = calendar_table.get_start_weekly_of_month(year * 12)
+        if weeks_of_year is not None and start_ordinal is not None:
+            # each year has different amount of weeks
+            if not 0 <= index < weeks_of_year:
+                raise ValueError
+            return datetime.date.fromordinal(start_ordinal + 7 * index)
+
     anchor_date = get_week_anchor_date(
         a_date,
         firstweekday=firstweekday,
@@ -4,12 +4,21 @@ from enum import Enum
 
 from deloreans.date_utils.common import (
     get_weekly_start_date,
-    get_weeks_offset,
     get_start_monthly_of_monthly,
     get_compared_start_monthly_located_monthly,
     get_start_yearly_of_yearly,
     get_compared_start_yearly_located_yearly,
 )
+from deloreans.date_utils.period_key import (
+    get_day_key,
+    get_day_start,
+    get_week_key,
+    get_week_start,
+    get_month_key,
+    get_month_start,
+    get_year_key,
+    get_year_start,
+)
 
 
 class BaseGranularity:
@@ -50,28 +59,69 @@ class BaseGranularity:
         """
         raise NotImplementedError
 
+    @staticmethod
+    def _get_key(
+        ordinal: int,
+        firstweekday: int = 0,
+    ) -> int:
+        """
+        Key of the granularity-unit date period which given proleptic ordinal located,
+        refer to 'deloreans.date_utils.period_key'
+        """
+        raise NotImplementedError
+
+    @staticmethod
+    def _get_start(
+        key: int,
+        firstweekday: int = 0,
+    ) -> int:
+        """
+        Start proleptic ordinal of the granularity-unit date period with given key
+        """
+        raise NotImplementedError
+
+    @classmethod
+    def to_key(
+        cls,
+        a_date: datetime.date,
+        firstweekday: int = 0,
+    ) -> int:
+        return cls._get_key(a_date.toordinal(), firstweekday)
+
+    @classmethod
+    def from_key(
+        cls,
+        key: int,
+        firstweekday: int = 0,
+    ) -> datetime.date:
+        return datetime.date.fromordinal(cls._get_start(key, firstweekday))
+
     @classmethod
     def get_date_range_length(
         cls,
         start_date: datetime.date,
         end_date: datetime.date,
         firstweekday: int = 0,
+        trusted: bool = False,
     ) -> int:
         """
         Provide the count of date periods with given granularity
         e.g. 1 day, 2 weeks, 3 months, 4 years
+
+        skip validation when 'trusted'
         """
-        if start_date > end_date:
+        if not trusted and start_date > end_date:
             raise ValueError
         return cls._get_date_range_length(start_date, end_date, firstweekday)
 
-    @staticmethod
+    @classmethod
     def _get_date_range_length(
+        cls,
         start_date: datetime.date,
         end_date: datetime.date,
         firstweekday: int = 0,
     ) -> int:
-        raise NotImplementedError
+        return cls.to_key(end_date, firstweekday) - cls.to_key(start_date, firstweekday) + 1
 
     @classmethod
     def get_end_date(
@@ -79,7 +129,15 @@ class BaseGranularity:
         start_date: datetime.date,
         date_range_length: int,
         firstweekday: int = 0,
+        trusted: bool = False,
     ) -> datetime.date:
+        """
+        skip validation when 'trusted',
+        e.g. start date is provided by date utilities which always return the start date of period
+        """
+        if trusted:
+            return cls._get_end_date(start_date, date_range_length)
+
         if not cls._is_start_date(
             start_date,
             firstweekday,
@@ -90,16 +148,22 @@ class BaseGranularity:
 
         return cls._get_end_date(start_date, date_range_length)
 
-    @staticmethod
+    @classmethod
     def _get_end_date(
+        cls,
         start_date: datetime.date,
         date_range_length: int,
     ) -> datetime.date:
-        raise NotImplementedError
+        # the day before the start of period which is 'date_range_length' periods later
+        exceeded_key = cls.to_key(start_date) + date_range_length
+        return datetime.date.fromordinal(cls._get_start(exceeded_key) - 1)
 
 
 class Daily(BaseGranularity):
 
+    _get_key = staticmethod(get_day_key)
+    _get_start = staticmethod(get_day_start)
+
     @staticmethod
     def _is_start_date(
         a_date: datetime.date,
@@ -114,24 +178,12 @@ class Daily(BaseGranularity):
     ) -> bool:
         return True
 
-    @staticmethod
-    def _get_date_range_length(
-        start_date: datetime.date,
-        end_date: datetime.date,
-        firstweekday: int = 0,
-    ) -> int:
-        return (end_date - start_date).days + 1
-
-    @staticmethod
-    def _get_end_date(
-        start_date: datetime.date,
-        date_range_length: int,
-    ) -> datetime.date:
-        return start_date + timedelta(days=date_range_length - 1)
-
 
 class Weekly(BaseGranularity):
 
+    _get_key = staticmethod(get_week_key)
+    _get_start = staticmethod(get_week_start)
+
     @staticmethod
     def _is_start_date(
         a_date: datetime.date,
@@ -152,25 +204,30 @@ class Weekly(BaseGranularity):
         week_end_date = next_week_start_date + timedelta(days=-1)
         return a_date == week_end_date
 
-    @staticmethod
-    def _get_date_range_length(
-        start_date: datetime.date,
-        end_date: datetime.date,
-        firstweekday: int = 0,
-    ) -> int:
-        return get_weeks_offset(start_date, end_date, firstweekday) + 1
-
     @staticmethod
     def _get_end_date(
         start_date: datetime.date,
         date_range_length: int,
     ) -> datetime.date:
+        # every week has 7 days, so that it doesn't depend on firstweekday
         exceeded_week_start_date = start_date + timedelta(weeks=date_range_length)
         return exceeded_week_start_date + timedelta(days=-1)
 
 
 class Monthly(BaseGranularity):
 
+    _get_key = staticmethod(get_month_key)
+    _get_start = staticmethod(get_month_start)
+
+    @classmethod
+    def to_key(
+        cls,
+        a_date: datetime.date,
+        firstweekday: int = 0,
+    ) -> int:
+        # the same as 'get_month_key', without converting date into ordinal
+        return a_date.year * 12 + a_date.month - 1
+
     @staticmethod
     def _is_start_date(
         a_date: datetime.date,
@@ -188,30 +245,19 @@ class Monthly(BaseGranularity):
         month_end_date = exceeded_month_start_date + timedelta(days=-1)
         return a_date == month_end_date
 
-    @staticmethod
-    def _get_date_range_length(
-        start_date: datetime.date,
-        end_date: datetime.date,
-        firstweekday: int = 0,
-    ) -> int:
-        start_total_months = 12 * start_date.year + start_date.month
-        end_total_months = 12 * end_date.year + end_date.month
-        return end_total_months - start_total_months + 1
 
-    @staticmethod
-    def _get_end_date(
-        start_date: datetime.date,
-        date_range_length: int,
-    ) -> datetime.date:
-        exceeded_month_start_date = get_compared_start_monthly_located_monthly(
-            start_date,
-            date_range_length,
-        )
-        month_end_date = exceeded_month_start_date + timedelta(days=-1)
-        return month_end_date
+class Yearly(BaseGranularity):
 
+    _get_key = staticmethod(get_year_key)
+    _get_start = staticmethod(get_year_start)
 
-class Yearly(BaseGranularity):
+    @classmethod
+    def to_key(
+        cls,
+        a_date: datetime.date,
+        firstweekday: int = 0,
+    ) -> int:
+        return a_date.year
 
     @staticmethod
     def _is_start_date(
@@ -230,25 +276,6 @@ class Yearly(BaseGranularity):
         year_end_date = exceeded_start_date + timedelta(days=-1)
         return a_date == year_end_date
 
-    @staticmethod
-    def _get_date_range_length(
-        start_date: datetime.date,
-        end_date: datetime.date,
-        firstweekday: int = 0,
-    ) -> int:
-        return end_date.year - start_date.year + 1
-
-    @staticmethod
-    def _get_end_date(
-        start_date: datetime.date,
-        date_range_length: int,
-    ) -> datetime.date:
-        exceeded_start_date = get_compared_start_yearly_located_yearly(
-            start_date,
-            date_range_length,
-        )
-        return exceeded_start_date + timedelta(days=-1)
-
 
 class DateGranularity(Enum):
     """
@@ -278,11 +305,13 @@ class DateGranularity(Enum):
         start_date: datetime.date,
         end_date: datetime.date,
         firstweekday: int = 0,
+        trusted: bool = False,
     ) -> int:
         return self.value.get_date_range_length(
             start_date,
             end_date,
             firstweekday,
+            trusted,
         )
 
     def get_end_date(
@@ -290,9 +319,32 @@ class DateGranularity(Enum):
         start_date: datetime.date,
         date_range_length: int,
         firstweekday: int = 0,
+        trusted: bool = False,
     ) -> datetime.date:
         return self.value.get_end_date(
             start_date,
             date_range_length,
             firstweekday,
+            trusted,
         )
+
+    def to_key(
+        self,
+        a_date: datetime.date,
+        firstweekday: int = 0,
+    ) -> int:
+        """
+        dense integer key of the period which given date located,
+        refer to 'deloreans.date_utils.period_key'
+        """
+        return self.value.to_key(a_date, firstweekday)
+
+    def from_key(
+        self,
+        key: int,
+        firstweekday: int = 0,
+    ) -> datetime.date:
+        """
+        start date of the period with given key
+        """
+        return self.value.from_key(key, firstweekday)
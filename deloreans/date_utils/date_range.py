@@ -1,9 +1,31 @@
+from __future__ import annotations
 import datetime
+from typing import Any, Optional, Tuple
 
 from deloreans.date_utils.date_granularity import DateGranularity
+from deloreans.date_utils.period_sequence import PeriodSequence
 
 
 class DateRange:
+    """
+    Immutable date range, which is validated once on construction
+
+    With 'trusted', validation is skipped for the inputs which are known to be valid,
+    e.g. the ones derived from date utilities
+    """
+
+    __slots__ = (
+        '_start_date',
+        '_end_date',
+        '_date_granularity',
+        '_firstweekday',
+        '_length',
+    )
+    _start_date: datetime.date
+    _end_date: datetime.date
+    _date_granularity: DateGranularity
+    _firstweekday: int
+    _length: Optional[int]
 
     def __init__(
         self,
@@ -11,11 +33,16 @@ class DateRange:
         end_date: datetime.date,
         date_granularity: DateGranularity,
         firstweekday: int = 0,
+        trusted: bool = False,
     ):
-        self._start_date = start_date
-        self._end_date = end_date
-        self._date_granularity = date_granularity
-        self._firstweekday = firstweekday
+        _setattr = object.__setattr__
+        _setattr(self, '_start_date', start_date)
+        _setattr(self, '_end_date', end_date)
+        _setattr(self, '_date_granularity', date_granularity)
+        _setattr(self, '_firstweekday', firstweekday)
+        _setattr(self, '_length', None)
+        if trusted:
+            return
         self._validate_firstweekday()
         self._validate_date_type()
         self._validate_date_relativity()
@@ -42,6 +69,74 @@ class DateRange:
     def firstweekday(self) -> int:
         return self._firstweekday
 
+    @property
+    def length(self) -> int:
+        """
+        count of date periods with date granularity, which is computed on first use
+        """
+        length = self._length
+        if length is None:
+            length = self._date_granularity.get_date_range_length(
+                self._start_date,
+                self._end_date,
+                self._firstweekday,
+                trusted=True,
+            )
+            object.__setattr__(self, '_length', length)
+        return length
+
+    def iter_periods(
+        self,
+        granularity: Optional[DateGranularity] = None,
+        bounds: bool = False,
+    ) -> PeriodSequence:
+        """
+        lazy sequence of the periods located in this date range, refer to 'PeriodSequence'
+
+        Args:
+            granularity (Optional[DateGranularity]): granularity of periods, date granularity of this range by default
+            bounds (bool): provide (start_date, end_date) of each period instead of start date only
+        """
+        return PeriodSequence(
+            self._start_date,
+            self._end_date,
+            self._date_granularity if granularity is None else granularity,
+            self._firstweekday,
+            bounds,
+        )
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f'{self.__class__.__name__} is immutable')
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f'{self.__class__.__name__} is immutable')
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        """
+        pickle and copy by the trusted construction, since attributes can't be set on an immutable instance
+        """
+        return self.__class__, (self._start_date, self._end_date, self._date_granularity, self._firstweekday, True)
+
+    def _key(self) -> Tuple[datetime.date, datetime.date, DateGranularity, int]:
+        return self._start_date, self._end_date, self._date_granularity, self._firstweekday
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, DateRange):
+            return NotImplemented
+        return self._key() == other._key()
+
+    def __hash__(self) -> int:
+        return hash(self._key())
+
+    def __repr__(self) -> str:
+        return (
+            f'{self.__class__.__name__}('
+            f'start_date={self._start_date!r}, '
+            f'end_date={self._end_date!r}, '
+            f'date_granularity={self._date_granularity}, '
+            f'firstweekday={self._firstweekday})'
+        )
+
     def _validate_date_type(self) -> None:
         """
         date parameters should be datetime.date
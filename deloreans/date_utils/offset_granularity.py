@@ -1,4 +1,6 @@
+from __future__ import annotations
 from enum import Enum
+from typing import Any, Tuple
 
 
 class OffsetGranularity(Enum):
@@ -13,14 +15,24 @@ class OffsetGranularity(Enum):
 
 
 class DatePeriodOffset:
+    """
+    Immutable offset, which is validated once on construction unless 'trusted'
+    """
+
+    __slots__ = ('_offset', '_offset_granularity')
+    _offset: int
+    _offset_granularity: OffsetGranularity
 
     def __init__(
         self,
         offset: int,
         offset_granularity: OffsetGranularity,
+        trusted: bool = False,
     ) -> None:
-        self._offset = offset
-        self._offset_granularity = offset_granularity
+        object.__setattr__(self, '_offset', offset)
+        object.__setattr__(self, '_offset_granularity', offset_granularity)
+        if trusted:
+            return
         self._validate_offset()
         self._validate_offset_granularity_type()
 
@@ -32,6 +44,36 @@ class DatePeriodOffset:
     def offset_granularity(self) -> OffsetGranularity:
         return self._offset_granularity
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f'{self.__class__.__name__} is immutable')
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f'{self.__class__.__name__} is immutable')
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        """
+        pickle and copy by the trusted construction, since attributes can't be set on an immutable instance
+        """
+        return self.__class__, (self._offset, self._offset_granularity, True)
+
+    def _key(self) -> Tuple[int, OffsetGranularity]:
+        return self._offset, self._offset_granularity
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, DatePeriodOffset):
+            return NotImplemented
+        return self._key() == other._key()
+
+    def __hash__(self) -> int:
+        return hash(self._key())
+
+    def __repr__(self) -> str:
+        return (
+            f'{self.__class__.__name__}('
+            f'offset={self._offset!r}, '
+            f'offset_granularity={self._offset_granularity})'
+        )
+
     def _validate_offset(self) -> None:
         if not isinstance(self._offset, int):
             raise TypeError(
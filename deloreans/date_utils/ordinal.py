@@ -0,0 +1,600 @@
+"""
+deloreans.date_utils.ordinal
+
+This module provides the integer kernel of date utilities,
+which mirrors 'deloreans.date_utils.common' on proleptic ordinals instead of 'datetime.date'
+
+Dates are represented by their proleptic ordinal, where 0001-01-01 is 1, refer to 'datetime.date.toordinal';
+months by month serial, which is 'year * 12 + month - 1'.
+All of them are computed in closed form, so that date objects are only created at the boundary
+"""
+from __future__ import annotations
+import datetime
+from typing import Any, Tuple
+
+from deloreans.date_utils.calendar_table import get_calendar_table
+
+
+# days before the first day of each month in a common year, indexed by 'month - 1'
+_DAYS_BEFORE_MONTH = (0, 31, 59, 90, 120, 151, 181, 212, 243, 273, 304, 334)
+_DAYS_IN_MONTH = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+
+def is_leap_year(year: int) -> bool:
+    return year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
+
+
+def get_days_of_month(year: int, month: int) -> int:
+    if month == 2 and is_leap_year(year):
+        return 29
+    return _DAYS_IN_MONTH[month - 1]
+
+
+def get_days_of_year(year: int) -> int:
+    return 366 if is_leap_year(year) else 365
+
+
+def get_ordinal(year: int, month: int = 1, day: int = 1) -> int:
+    """
+    proleptic ordinal of given date, which is consistent with 'datetime.date(year, month, day).toordinal()'
+    """
+    if not datetime.MINYEAR <= year <= datetime.MAXYEAR:
+        raise ValueError(f'year {year} is out of range')
+    if not 1 <= month <= 12:
+        raise ValueError('month must be in 1..12')
+    previous_year = year - 1
+    days_before_month = _DAYS_BEFORE_MONTH[month - 1]
+    if month > 2 and is_leap_year(year):
+        days_before_month += 1
+    return (
+        previous_year * 365 + previous_year // 4 - previous_year // 100 + previous_year // 400
+        + days_before_month
+        + day
+    )
+
+
+def get_year_month_day(ordinal: int) -> Tuple[int, int, int]:
+    """
+    year, month and day of given proleptic ordinal
+
+    refer to: https://howardhinnant.github.io/date_algorithms.html#civil_from_days
+    whose day 0 is 0000-03-01, that is ordinal -305
+    """
+    days = ordinal + 305
+    era = days // 146097
+    day_of_era = days - era * 146097
+    year_of_era = (
+        day_of_era - day_of_era // 1460 + day_of_era // 36524 - day_of_era // 146096
+    ) // 365
+    day_of_year = day_of_era - (365 * year_of_era + year_of_era // 4 - year_of_era // 100)
+    shifted_month = (5 * day_of_year + 2) // 153
+    day = day_of_year - (153 * shifted_month + 2) // 5 + 1
+    if shifted_month < 10:
+        return year_of_era + era * 400, shifted_month + 3, day
+    return year_of_era + era * 400 + 1, shifted_month - 9, day
+
+
+def get_month_serial(ordinal: int) -> int:
+    year, month, _ = get_year_month_day(ordinal)
+    return year * 12 + month - 1
+
+
+def get_month_start(month_serial: int) -> int:
+    """
+    ordinal of the first day of month with given month serial
+    """
+    year, month_index = divmod(month_serial, 12)
+    return get_ordinal(year, month_index + 1)
+
+
+def to_date(ordinal: int) -> datetime.date:
+    return datetime.date.fromordinal(ordinal)
+
+
+def get_weekly_start(
+    ordinal: int,
+    firstweekday: int = 0,
+) -> int:
+    """
+    get the start ordinal of week which given ordinal located
+    """
+    # ordinal 1 (0001-01-01) is Monday
+    return ordinal - (ordinal + 6 - firstweekday) % 7
+
+
+def get_week_anchor(
+    ordinal: int,
+    firstweekday: int = 0,
+) -> int:
+    """
+    The fourth day of week determine the year and month that week located
+    """
+    return get_weekly_start(ordinal, firstweekday) + 3
+
+
+def get_week_anchor_month_serial(
+    ordinal: int,
+    firstweekday: int = 0,
+) -> int:
+    month_serial = get_calendar_table(firstweekday).get_anchor_month_serial(ordinal)
+    if month_serial is not None:
+        return month_serial
+    return get_month_serial(get_week_anchor(ordinal, firstweekday))
+
+
+def get_start_weekly_of_month(
+    month_serial: int,
+    firstweekday: int = 0,
+) -> int:
+    """
+    get the start week of a month, which is represented by week's start ordinal
+    """
+    _firstweekday = firstweekday % 7
+    start_ordinal = get_calendar_table(_firstweekday).get_start_weekly_of_month(month_serial)
+    if start_ordinal is not None:
+        return start_ordinal
+
+    daily_start_ordinal = get_month_start(month_serial)
+    week_start_ordinal = get_weekly_start(daily_start_ordinal, _firstweekday)
+    # the week represented by anchor date is in previous month
+    # so that the first week should be the next one
+    if daily_start_ordinal > week_start_ordinal + 3:
+        week_start_ordinal += 7
+    return week_start_ordinal
+
+
+def get_weeks_of_month(
+    month_serial: int,
+    firstweekday: int = 0,
+) -> int:
+    weeks = get_calendar_table(firstweekday).get_weeks_of_month(month_serial)
+    if weeks is not None:
+        return weeks
+    return (
+        get_start_weekly_of_month(month_serial + 1, firstweekday)
+        - get_start_weekly_of_month(month_serial, firstweekday)
+    ) // 7
+
+
+def get_weeks_of_year(
+    year: int,
+    firstweekday: int = 0,
+) -> int:
+    weeks = get_calendar_table(firstweekday).get_weeks_of_year(year)
+    if weeks is not None:
+        return weeks
+    return (
+        get_start_weekly_of_month((year + 1) * 12, firstweekday)
+        - get_start_weekly_of_month(year * 12, firstweekday)
+    ) // 7
+
+
+# ==========================================================================================================
+#
+#   Series of functions which provide start period of a unit date period,
+#   refer to the same ones in 'deloreans.date_utils.common'
+#
+#   The pattern of function name is like:
+#   get_start_%(date_period_granularity)s_of_%(located_unit_period_granularity)s
+#
+#   Args:
+#       ordinal (int): proleptic ordinal of the date located in a single date period,
+#                      representing this period
+#
+#   Return:
+#       start_ordinal (int): proleptic ordinal of the start date which representing its start period of location
+#
+# ==========================================================================================================
+
+
+def get_start_daily_of_daily(ordinal: int) -> int:
+    return ordinal
+
+
+def get_start_daily_of_weekly(
+    ordinal: int,
+    **kwargs: Any,
+) -> int:
+    firstweekday: int = kwargs.get('firstweekday', 0)
+    return get_weekly_start(ordinal, firstweekday)
+
+
+def get_start_daily_of_monthly(ordinal: int) -> int:
+    _, _, day = get_year_month_day(ordinal)
+    return ordinal - day + 1
+
+
+def get_start_daily_of_yearly(ordinal: int) -> int:
+    year, _, _ = get_year_month_day(ordinal)
+    return get_ordinal(year)
+
+
+def get_start_weekly_of_weekly(
+    ordinal: int,
+    **kwargs: Any,
+) -> int:
+    firstweekday: int = kwargs.get('firstweekday', 0)
+    return get_weekly_start(ordinal, firstweekday)
+
+
+def get_start_weekly_of_monthly(
+    ordinal: int,
+    **kwargs: Any,
+) -> int:
+    firstweekday: int = kwargs.get('firstweekday', 0)
+    return get_start_weekly_of_month(
+        get_week_anchor_month_serial(ordinal, firstweekday),
+        firstweekday,
+    )
+
+
+def get_start_weekly_of_yearly(
+    ordinal: int,
+    **kwargs: Any,
+) -> int:
+    """
+    special case that the month is January
+    """
+    firstweekday: int = kwargs.get('firstweekday', 0)
+    year = get_week_anchor_month_serial(ordinal, firstweekday) // 12
+    return get_start_weekly_of_month(year * 12, firstweekday)
+
+
+def get_start_monthly_of_monthly(ordinal: int) -> int:
+    return get_start_daily_of_monthly(ordinal)
+
+
+def get_start_monthly_of_yearly(ordinal: int) -> int:
+    return get_start_daily_of_yearly(ordinal)
+
+
+def get_start_yearly_of_yearly(ordinal: int) -> int:
+    return get_start_daily_of_yearly(ordinal)
+
+
+# =================================================================================================
+#
+#   Series of functions which provide period's index of a unit date period,
+#   refer to the same ones in 'deloreans.date_utils.common'
+#
+#   The pattern of function name is like:
+#   get_%(date_period_granularity)s_index_of_%(located_unit_period_granularity)s
+#
+#   Args:
+#       ordinal (int): proleptic ordinal of the date located in a single date period,
+#                      representing this period
+#
+#   Return:
+#       index (int): the index of the single date period in located unit date period
+#
+# =================================================================================================
+
+
+def get_daily_index_of_daily(
+    ordinal: int,  # NOQA
+    **kwargs: Any,  # NOQA
+) -> int:
+    return 0
+
+
+def get_daily_index_of_weekly(
+    ordinal: int,
+    **kwargs: Any,
+) -> int:
+    firstweekday: int = kwargs.get('firstweekday', 0)
+    return (ordinal + 6 - firstweekday) % 7
+
+
+def get_daily_index_of_monthly(
+    ordinal: int,
+    **kwargs: Any,  # NOQA
+) -> int:
+    _, _, day = get_year_month_day(ordinal)
+    return day - 1
+
+
+def get_daily_index_of_yearly(
+    ordinal: int,
+    **kwargs: Any,  # NOQA
+) -> int:
+    return ordinal - get_start_daily_of_yearly(ordinal)
+
+
+def get_weekly_index_of_weekly(
+    ordinal: int,  # NOQA
+    **kwargs: Any,  # NOQA
+) -> int:
+    return 0
+
+
+def get_weekly_index_of_monthly(
+    ordinal: int,
+    **kwargs: Any,
+) -> int:
+    firstweekday: int = kwargs.get('firstweekday', 0)
+    index = get_calendar_table(firstweekday).get_week_index_of_month(ordinal)
+    if index is not None:
+        return index
+
+    located_start_ordinal = get_start_weekly_of_monthly(ordinal, firstweekday=firstweekday)
+    return (get_weekly_start(ordinal, firstweekday) - located_start_ordinal) // 7
+
+
+def get_weekly_index_of_yearly(
+    ordinal: int,
+    **kwargs: Any,
+) -> int:
+    firstweekday: int = kwargs.get('firstweekday', 0)
+    index = get_calendar_table(firstweekday).get_week_index_of_year(ordinal)
+    if index is not None:
+        return index
+
+    located_start_ordinal = get_start_weekly_of_yearly(ordinal, firstweekday=firstweekday)
+    return (get_weekly_start(ordinal, firstweekday) - located_start_ordinal) // 7
+
+
+def get_monthly_index_of_monthly(
+    ordinal: int,  # NOQA
+    **kwargs: Any,  # NOQA
+) -> int:
+    return 0
+
+
+def get_monthly_index_of_yearly(
+    ordinal: int,
+    **kwargs: Any,  # NOQA
+) -> int:
+    _, month, _ = get_year_month_day(ordinal)
+    return month - 1
+
+
+def get_yearly_index_of_yearly(
+    ordinal: int,  # NOQA
+    **kwargs: Any,  # NOQA
+) -> int:
+    return 0
+
+
+# =================================================================================================
+#
+#   Series of functions which provide unit date period which compared start period located,
+#   refer to the same ones in 'deloreans.date_utils.common'
+#
+#   The pattern of function name is like:
+#   get_compared_start_%(date_period_granularity)s_located_%(located_unit_period_granularity)s
+#
+#   Args:
+#       ordinal (int): proleptic ordinal of the date located in a single date period,
+#                      representing this period
+#       offset (int): offset on unit date period, move to the future when positive
+#
+#   Return:
+#       start_ordinal (int): proleptic ordinal of the start date
+#                            which representing its start period of compared location
+#
+# =================================================================================================
+
+
+def get_compared_start_daily_located_daily(
+    ordinal: int,
+    offset: int,
+    **kwargs: Any,  # NOQA
+) -> int:
+    return ordinal + offset
+
+
+def get_compared_start_daily_located_weekly(
+    ordinal: int,
+    offset: int,
+    **kwargs: Any,
+) -> int:
+    firstweekday: int = kwargs.get('firstweekday', 0)
+    return get_weekly_start(ordinal, firstweekday) + 7 * offset
+
+
+def get_compared_start_daily_located_monthly(
+    ordinal: int,
+    offset: int,
+    **kwargs: Any,  # NOQA
+) -> int:
+    return get_month_start(get_month_serial(ordinal) + offset)
+
+
+def get_compared_start_daily_located_yearly(
+    ordinal: int,
+    offset: int,
+    **kwargs: Any,  # NOQA
+) -> int:
+    year, _, _ = get_year_month_day(ordinal)
+    return get_ordinal(year + offset)
+
+
+def get_compared_start_weekly_located_weekly(
+    ordinal: int,
+    offset: int,
+    **kwargs: Any,
+) -> int:
+    firstweekday: int = kwargs.get('firstweekday', 0)
+    return get_weekly_start(ordinal, firstweekday) + 7 * offset
+
+
+def get_compared_start_weekly_located_monthly(
+    ordinal: int,
+    offset: int,
+    **kwargs: Any,
+) -> int:
+    firstweekday: int = kwargs.get('firstweekday', 0)
+    month_serial = get_week_anchor_month_serial(ordinal, firstweekday) + offset
+    # keep consistent with date arithmetic, which is unable to represent the month out of range
+    get_month_start(month_serial)
+    return get_start_weekly_of_month(month_serial, firstweekday)
+
+
+def get_compared_start_weekly_located_yearly(
+    ordinal: int,
+    offset: int,
+    **kwargs: Any,
+) -> int:
+    firstweekday: int = kwargs.get('firstweekday', 0)
+    month_serial = (get_week_anchor_month_serial(ordinal, firstweekday) // 12 + offset) * 12
+    # keep consistent with date arithmetic, which is unable to represent the year out of range
+    get_month_start(month_serial)
+    return get_start_weekly_of_month(month_serial, firstweekday)
+
+
+def get_compared_start_monthly_located_monthly(
+    ordinal: int,
+    offset: int,
+    **kwargs: Any,  # NOQA
+) -> int:
+    return get_compared_start_daily_located_monthly(ordinal, offset)
+
+
+def get_compared_start_monthly_located_yearly(
+    ordinal: int,
+    offset: int,
+    **kwargs: Any,  # NOQA
+) -> int:
+    """
+    special case that the month is January
+    """
+    return get_compared_start_daily_located_yearly(ordinal, offset)
+
+
+def get_compared_start_yearly_located_yearly(
+    ordinal: int,
+    offset: int,
+    **kwargs: Any,  # NOQA
+) -> int:
+    return get_compared_start_daily_located_yearly(ordinal, offset)
+
+
+# =================================================================================================
+#
+#   Series of functions which provide date period with index in located unit date period,
+#   refer to the same ones in 'deloreans.date_utils.common'
+#
+#   The pattern of function name is like:
+#   get_%(date_period_granularity)s_with_index_in_%(located_unit_period_granularity)s
+#
+#   Args:
+#       ordinal (int): proleptic ordinal of the date of a single date period
+#                      which representing it's located unit date period
+#       index (int): the index of target single period at located unit date period
+#
+#   Return:
+#       start_ordinal (int): proleptic ordinal of the start date which representing the target single period
+#
+# =================================================================================================
+
+
+def get_daily_with_index_in_daily(
+    ordinal: int,
+    index: int,
+    **kwargs: Any,  # NOQA
+) -> int:
+    if index != 0:
+        raise ValueError
+    return ordinal
+
+
+def get_daily_with_index_in_weekly(
+    ordinal: int,
+    index: int,
+    **kwargs: Any,
+) -> int:
+    # since one week only has 7 days
+    if not 0 <= index < 7:
+        raise ValueError
+    firstweekday: int = kwargs.get('firstweekday', 0)
+    return get_weekly_start(ordinal, firstweekday) + index
+
+
+def get_daily_with_index_in_monthly(
+    ordinal: int,
+    index: int,
+    **kwargs: Any,  # NOQA
+) -> int:
+    year, month, day = get_year_month_day(ordinal)
+    if not 0 <= index < get_days_of_month(year, month):
+        raise ValueError
+    return ordinal - day + 1 + index
+
+
+def get_daily_with_index_in_yearly(
+    ordinal: int,
+    index: int,
+    **kwargs: Any,  # NOQA
+) -> int:
+    year, _, _ = get_year_month_day(ordinal)
+    if not 0 <= index < get_days_of_year(year):
+        raise ValueError
+    return get_ordinal(year) + index
+
+
+def get_weekly_with_index_in_weekly(
+    ordinal: int,
+    index: int,
+    **kwargs: Any,
+) -> int:
+    if index != 0:
+        raise ValueError
+    firstweekday: int = kwargs.get('firstweekday', 0)
+    return get_weekly_start(ordinal, firstweekday)
+
+
+def get_weekly_with_index_in_monthly(
+    ordinal: int,
+    index: int,
+    **kwargs: Any,
+) -> int:
+    firstweekday: int = kwargs.get('firstweekday', 0)
+    month_serial = get_week_anchor_month_serial(ordinal, firstweekday)
+    # each month has different amount of weeks
+    if not 0 <= index < get_weeks_of_month(month_serial, firstweekday):
+        raise ValueError
+    return get_start_weekly_of_month(month_serial, firstweekday) + 7 * index
+
+
+def get_weekly_with_index_in_yearly(
+    ordinal: int,
+    index: int,
+    **kwargs: Any,
+) -> int:
+    firstweekday: int = kwargs.get('firstweekday', 0)
+    year = get_week_anchor_month_serial(ordinal, firstweekday) // 12
+    # each year has different amount of weeks
+    if not 0 <= index < get_weeks_of_year(year, firstweekday):
+        raise ValueError
+    return get_start_weekly_of_month(year * 12, firstweekday) + 7 * index
+
+
+def get_monthly_with_index_in_monthly(
+    ordinal: int,
+    index: int,
+    **kwargs: Any,  # NOQA
+) -> int:
+    if index != 0:
+        raise ValueError
+    return get_start_daily_of_monthly(ordinal)
+
+
+def get_monthly_with_index_in_yearly(
+    ordinal: int,
+    index: int,
+    **kwargs: Any,  # NOQA
+) -> int:
+    if not 0 <= index < 12:
+        raise ValueError
+    year, _, _ = get_year_month_day(ordinal)
+    return get_ordinal(year, index + 1)
+
+
+def get_yearly_with_index_in_yearly(
+    ordinal: int,
+    index: int,
+    **kwargs: Any,  # NOQA
+) -> int:
+    if index != 0:
+        raise ValueError
+    return get_start_daily_of_yearly(ordinal)
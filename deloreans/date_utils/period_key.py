@@ -0,0 +1,138 @@
+"""
+deloreans.date_utils.period_key
+
+This module provides the codec between date periods and their dense integer keys,
+so that periods are hashed, sorted and diffed as integers, and offsets are integer additions
+
+    daily       days since 1970-01-01 (epoch day)
+    weekly      weeks since the week which 1970-01-01 locates, depending on firstweekday
+    monthly     month serial, which is 'year * 12 + month - 1'
+    yearly      year
+
+Keys of consecutive periods are consecutive integers, and they are the same as the ones
+of 'deloreans.vectorized', which converts arrays of them with NumPy
+"""
+from __future__ import annotations
+import datetime
+from typing import TYPE_CHECKING, Any
+
+import deloreans.date_utils.ordinal as ordinal_date_utils
+
+if TYPE_CHECKING:
+    from deloreans.date_utils.date_granularity import DateGranularity
+
+
+# proleptic ordinal of 1970-01-01
+EPOCH_ORDINAL = 719163
+
+# 1970-01-01 is Thursday
+_EPOCH_WEEKDAY = 3
+
+
+# ==========================================================================================================
+#
+#   Series of functions which convert between proleptic ordinal and period key
+#
+#   get_%(granularity)s_key(ordinal, firstweekday) provides the key of period which given ordinal locates
+#   get_%(granularity)s_start(key, firstweekday) provides the start ordinal of period with given key
+#
+# ==========================================================================================================
+
+
+def get_day_key(ordinal: int, firstweekday: int = 0) -> int:
+    return ordinal - EPOCH_ORDINAL
+
+
+def get_day_start(key: int, firstweekday: int = 0) -> int:
+    return key + EPOCH_ORDINAL
+
+
+def get_week_key(ordinal: int, firstweekday: int = 0) -> int:
+    return (ordinal - EPOCH_ORDINAL + _EPOCH_WEEKDAY - firstweekday) // 7
+
+
+def get_week_start(key: int, firstweekday: int = 0) -> int:
+    return key * 7 + EPOCH_ORDINAL - _EPOCH_WEEKDAY + firstweekday
+
+
+def get_month_key(ordinal: int, firstweekday: int = 0) -> int:
+    return ordinal_date_utils.get_month_serial(ordinal)
+
+
+def get_month_start(key: int, firstweekday: int = 0) -> int:
+    return ordinal_date_utils.get_month_start(key)
+
+
+def get_year_key(ordinal: int, firstweekday: int = 0) -> int:
+    year, _, _ = ordinal_date_utils.get_year_month_day(ordinal)
+    return year
+
+
+def get_year_start(key: int, firstweekday: int = 0) -> int:
+    return ordinal_date_utils.get_ordinal(key)
+
+
+def get_period_key(granularity: DateGranularity, ordinal: int, firstweekday: int = 0) -> int:
+    """
+    key of the date-granularity period which given proleptic ordinal locates
+    """
+    return granularity.value._get_key(ordinal, firstweekday)
+
+
+def get_period_start(granularity: DateGranularity, key: int, firstweekday: int = 0) -> int:
+    """
+    start proleptic ordinal of the date-granularity period with given key
+    """
+    return granularity.value._get_start(key, firstweekday)
+
+
+# ==========================================================================================================
+#
+#   Conversion between dates and period keys of given granularity
+#
+# ==========================================================================================================
+
+
+def to_key(granularity: DateGranularity, a_date: datetime.date, firstweekday: int = 0) -> int:
+    """
+    key of the date-granularity period which given date locates
+
+        >>> to_key(DateGranularity.MONTHLY, datetime.date(2024, 6, 15))
+        24293
+    """
+    return granularity.to_key(a_date, firstweekday)
+
+
+def from_key(granularity: DateGranularity, key: int, firstweekday: int = 0) -> datetime.date:
+    """
+    start date of the date-granularity period with given key
+
+        >>> from_key(DateGranularity.MONTHLY, 24293)
+        datetime.date(2024, 6, 1)
+    """
+    return granularity.from_key(key, firstweekday)
+
+
+def to_keys(granularity: DateGranularity, dates: Any, firstweekday: int = 0) -> Any:
+    """
+    keys of the date-granularity periods which given dates locate, refer to 'to_key'
+
+    Args:
+        dates (array): numpy.datetime64[D] dates or epoch days, NumPy should be installed
+    """
+    # NumPy is an optional dependency, required only by array conversion
+    import deloreans.vectorized as vectorized
+    days, _ = vectorized.as_days(dates)
+    return vectorized._get_period_key(granularity, days, firstweekday)
+
+
+def from_keys(granularity: DateGranularity, keys: Any, firstweekday: int = 0) -> Any:
+    """
+    start dates of the date-granularity periods with given keys, refer to 'from_key'
+
+    Returns:
+        dates (array): numpy.datetime64[D] start dates
+    """
+    import deloreans.vectorized as vectorized
+    keys, _ = vectorized.as_days(keys)
+    return vectorized.restore_dates(vectorized._get_period_start(granularity, keys, firstweekday), True)
@@ -0,0 +1,161 @@
+"""
+deloreans.date_utils.period_sequence
+
+This module provides a lazy sequence of the date periods located in a date range,
+e.g. the days, weeks or months of a compared date range
+
+A period is located in the date range when its anchor date is, which is the fourth day of week
+as the week-of-month and week-of-year logic in 'deloreans.date_utils.common', and the first day otherwise.
+Each period is computed on access from its key, refer to 'deloreans.date_utils.period_key',
+so that neither iterating nor slicing materializes the whole sequence
+"""
+from __future__ import annotations
+import datetime
+from collections.abc import Sequence
+from typing import Any, Iterator, Union
+
+from deloreans.date_utils.date_granularity import DateGranularity
+from deloreans.date_utils.period_key import get_period_key, get_period_start, get_week_key
+
+
+def get_first_key(granularity: DateGranularity, ordinal: int, firstweekday: int) -> int:
+    """
+    key of the first period whose anchor date is not earlier than given ordinal
+    """
+    if granularity == DateGranularity.WEEKLY:
+        # the week containing 'ordinal + 3' is the first one whose fourth day is not earlier than 'ordinal'
+        return get_week_key(ordinal + 3, firstweekday)
+    key = get_period_key(granularity, ordinal, firstweekday)
+    # the period starting before given ordinal is not located
+    return key + (get_period_start(granularity, key, firstweekday) != ordinal)
+
+
+def get_last_key(granularity: DateGranularity, ordinal: int, firstweekday: int) -> int:
+    """
+    key of the last period whose anchor date is not later than given ordinal
+    """
+    if granularity == DateGranularity.WEEKLY:
+        return get_week_key(ordinal - 3, firstweekday)
+    return get_period_key(granularity, ordinal, firstweekday)
+
+
+class PeriodSequence(Sequence):
+    """
+    Immutable sequence of the date periods located in a date range, computed on access
+
+    Items are start dates of periods, or tuples of start date and end date when 'bounds' is True.
+    Slicing provides another lazy sequence, and length is known without iteration
+
+        >>> periods = PeriodSequence(datetime.date(2024, 6, 1), datetime.date(2024, 6, 30), DateGranularity.WEEKLY)
+        >>> len(periods)
+        4
+        >>> periods[0]
+        datetime.date(2024, 6, 3)
+        >>> list(periods[1::2])
+        [datetime.date(2024, 6, 10), datetime.date(2024, 6, 24)]
+
+    Args:
+        start_date (datetime.date): start date of date range
+        end_date (datetime.date): end date of date range
+        granularity (DateGranularity): granularity of periods, e.g. daily, weekly
+        firstweekday (int): define the start date's weekday of week, 0 is Monday, 6 is Sunday
+        bounds (bool): provide (start_date, end_date) of each period instead of start date only
+    """
+
+    __slots__ = ('_granularity', '_firstweekday', '_bounds', '_keys')
+
+    def __init__(
+        self,
+        start_date: datetime.date,
+        end_date: datetime.date,
+        granularity: DateGranularity,
+        firstweekday: int = 0,
+        bounds: bool = False,
+    ) -> None:
+        for a_date in (start_date, end_date):
+            if not isinstance(a_date, datetime.date):
+                raise ValueError(f'Invalid date {a_date!r}, should be datetime.date')
+        if end_date < start_date:
+            raise ValueError(
+                f'Invalid date range, '
+                f'the end one {end_date} should be equal or greater than the start one {start_date}'
+            )
+        if not isinstance(granularity, DateGranularity):
+            raise ValueError(f'Invalid granularity {granularity!r}, should be DateGranularity')
+        if not isinstance(firstweekday, int):
+            raise TypeError
+        if not 0 <= firstweekday < 7:
+            raise ValueError
+
+        self._granularity = granularity
+        self._firstweekday = firstweekday
+        self._bounds = bounds
+        self._keys = range(
+            get_first_key(granularity, start_date.toordinal(), firstweekday),
+            get_last_key(granularity, end_date.toordinal(), firstweekday) + 1,
+        )
+
+    @classmethod
+    def _from_keys(
+        cls,
+        keys: range,
+        granularity: DateGranularity,
+        firstweekday: int,
+        bounds: bool,
+    ) -> PeriodSequence:
+        sequence = cls.__new__(cls)
+        sequence._granularity = granularity
+        sequence._firstweekday = firstweekday
+        sequence._bounds = bounds
+        sequence._keys = keys
+        return sequence
+
+    @property
+    def granularity(self) -> DateGranularity:
+        return self._granularity
+
+    @property
+    def firstweekday(self) -> int:
+        return self._firstweekday
+
+    def _get_period(self, key: int) -> Any:
+        # the first week located in the calendar may start before the min date, then it starts from the min date
+        start_ordinal = max(get_period_start(self._granularity, key, self._firstweekday), 1)
+        start_date = datetime.date.fromordinal(start_ordinal)
+        if not self._bounds:
+            return start_date
+        try:
+            end_date = datetime.date.fromordinal(get_period_start(self._granularity, key + 1, self._firstweekday) - 1)
+        except ValueError:
+            # the next period starts beyond the calendar, so the last one ends at the max date
+            end_date = datetime.date.max
+        return start_date, end_date
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        if isinstance(index, slice):
+            return self._from_keys(self._keys[index], self._granularity, self._firstweekday, self._bounds)
+        return self._get_period(self._keys[index])
+
+    def __iter__(self) -> Iterator[Any]:
+        get_period = self._get_period
+        for key in self._keys:
+            yield get_period(key)
+
+    def __reversed__(self) -> Iterator[Any]:
+        get_period = self._get_period
+        for key in reversed(self._keys):
+            yield get_period(key)
+
+    def __repr__(self) -> str:
+        if not self._keys:
+            return f'{self.__class__.__name__}([], granularity={self._granularity})'
+        return (
+            f'{self.__class__.__name__}('
+            f'first={self[0]!r}, '
+            f'last={self[-1]!r}, '
+            f'length={len(self)}, '
+            f'granularity={self._granularity})'
+        )
@@ -0,0 +1,223 @@
+"""
+deloreans.inverse
+
+This module provides the inverse lookups of 'deloreans.get',
+e.g. which base date ranges are affected when the data of some dates is restated
+
+Comparison keeps the index of start period in its located period,
+e.g. the 10th day of 2024 is compared with the 10th day of 2023 year-over-year,
+so that it is a bijection between the date ranges whose compared date range exists and their compared ones.
+Then the base date range of a compared one is the compared one of it with the opposite offset,
+and the offsets whose compared date ranges cover given dates are bounded in closed form
+by the located periods of those dates, instead of searching offsets one by one
+"""
+from __future__ import annotations
+import datetime
+from typing import List, Optional, Tuple
+
+from deloreans.date_utils import DateGranularity, OffsetGranularity
+from deloreans.date_utils.period_key import get_period_key, get_period_start
+from deloreans.date_utils.ordinal import get_weekly_start
+from deloreans.plan import ComparisonPlan
+
+
+def _validate_offset(offset: int) -> None:
+    if not isinstance(offset, int):
+        raise TypeError(f'Invalid offset {offset!r}, should be int')
+
+
+def _validate_covered_dates(
+    covered_start_date: datetime.date,
+    covered_end_date: datetime.date,
+) -> None:
+    for a_date in (covered_start_date, covered_end_date):
+        if not isinstance(a_date, datetime.date):
+            raise ValueError(f'Invalid date {a_date!r}, should be datetime.date')
+    if covered_end_date < covered_start_date:
+        raise ValueError(
+            f'Invalid covered dates, '
+            f'the end one {covered_end_date} should be equal or greater than the start one {covered_start_date}'
+        )
+
+
+def get_base(
+    compared_start_date: datetime.date,
+    compared_end_date: datetime.date,
+    date_granularity: DateGranularity,
+    offset: int,
+    offset_granularity: OffsetGranularity,
+    firstweekday: int = 0,
+) -> Tuple[datetime.date, datetime.date]:
+    """
+    provide the base date range whose compared date range with given offset is the given one
+
+    Args:
+        compared_start_date (datetime.date): start date of compared date range
+        compared_end_date (datetime.date): end date of compared date range
+        date_granularity (DateGranularity): granularity of date range, e.g. daily, weekly
+        offset (int): offset which base date range is compared with, to the future when positive
+        offset_granularity (OffsetGranularity): granularity of offset period, e.g. year-over-year
+        firstweekday (int): define the start date's weekday of week, 0 is Monday, 6 is Sunday
+
+    Returns:
+        base_start_date (datetime.date): start date of base date range
+        base_end_date (datetime.date): end date of base date range
+
+    Raises:
+        ValueError: given date range is not compared one of any date range with given offset,
+                    e.g. the 366th day of 2024 with offset -1 year-over-year
+    """
+    _validate_offset(offset)
+    plan = ComparisonPlan(date_granularity, -offset, offset_granularity, firstweekday)
+    return plan.apply(compared_start_date, compared_end_date)
+
+
+def get_base_ranges(
+    covered_start_date: datetime.date,
+    covered_end_date: datetime.date,
+    date_granularity: DateGranularity,
+    offset: int,
+    offset_granularity: OffsetGranularity,
+    firstweekday: int = 0,
+    date_range_length: int = 1,
+) -> List[Tuple[datetime.date, datetime.date]]:
+    """
+    provide every base date range of given length whose compared date range with given offset
+    overlaps the covered dates, e.g. the report windows to invalidate when the data of those dates is restated
+
+    Args:
+        covered_start_date (datetime.date): start date of covered dates
+        covered_end_date (datetime.date): end date of covered dates
+        date_granularity (DateGranularity): granularity of base date ranges, e.g. daily, weekly
+        offset (int): offset which base date ranges are compared with, to the future when positive
+        offset_granularity (OffsetGranularity): granularity of offset period, e.g. year-over-year
+        firstweekday (int): define the start date's weekday of week, 0 is Monday, 6 is Sunday
+        date_range_length (int): count of date-granularity periods of each base date range
+
+    Returns:
+        base_date_ranges (list): start date and end date of base date ranges,
+                                 in the order of their compared date ranges
+    """
+    _validate_offset(offset)
+    _validate_covered_dates(covered_start_date, covered_end_date)
+    if not isinstance(date_range_length, int):
+        raise TypeError(f'Invalid date range length {date_range_length!r}, should be int')
+    if date_range_length < 1:
+        raise ValueError(f'Invalid date range length {date_range_length!r}, should be positive')
+    plan = ComparisonPlan(date_granularity, -offset, offset_granularity, firstweekday)
+
+    # compared date ranges overlapping covered dates start from the period which is 'length - 1' periods
+    # before the one covered start date locates, to the one covered end date locates
+    first_key = get_period_key(date_granularity, covered_start_date.toordinal(), firstweekday) - date_range_length + 1
+    last_key = get_period_key(date_granularity, covered_end_date.toordinal(), firstweekday)
+    base_date_ranges = []
+    for key in range(first_key, last_key + 1):
+        compared_start_date = datetime.date.fromordinal(get_period_start(date_granularity, key, firstweekday))
+        compared_end_date = date_granularity.get_end_date(
+            compared_start_date,
+            date_range_length,
+            firstweekday,
+            trusted=True,
+        )
+        try:
+            base_date_ranges.append(plan.apply(compared_start_date, compared_end_date, trusted=True))
+        except ValueError:
+            # the compared date range of no date range, e.g. the 366th day of a leap year year-over-year
+            continue
+    return base_date_ranges
+
+
+def _get_located_key(
+    date_granularity: DateGranularity,
+    located_granularity: DateGranularity,
+    a_date: datetime.date,
+    firstweekday: int,
+) -> int:
+    """
+    key of the located period of the date-granularity period which given date locates,
+    where a week locates the month or year of its fourth day
+    """
+    ordinal = a_date.toordinal()
+    if date_granularity == DateGranularity.WEEKLY:
+        ordinal = get_weekly_start(ordinal, firstweekday) + 3
+    return get_period_key(located_granularity, ordinal, firstweekday)
+
+
+def get_covering_offsets(
+    start_date: datetime.date,
+    end_date: datetime.date,
+    date_granularity: DateGranularity,
+    offset_granularity: OffsetGranularity,
+    covered_start_date: datetime.date,
+    covered_end_date: Optional[datetime.date] = None,
+    firstweekday: int = 0,
+) -> List[int]:
+    """
+    provide the offsets whose compared date ranges of given date range overlap the covered dates
+
+    Compared start date moves forward with offset, as it is located in the offset-granularity period
+    which is away from the located one of given date range by the offset,
+    so that the offsets are bounded by the located periods of covered dates,
+    and only the bounds are checked with the date utilities
+
+    Args:
+        start_date (datetime.date): start date of date range
+        end_date (datetime.date): end date of date range
+        date_granularity (DateGranularity): granularity of date range, e.g. daily, weekly
+        offset_granularity (OffsetGranularity): granularity of offset period, e.g. year-over-year
+        covered_start_date (datetime.date): start date of covered dates
+        covered_end_date (Optional[datetime.date]): end date of covered dates, the same as start date by default
+        firstweekday (int): define the start date's weekday of week, 0 is Monday, 6 is Sunday
+
+    Returns:
+        offsets (list): ascending offsets whose compared date ranges exist and overlap the covered dates
+    """
+    if covered_end_date is None:
+        covered_end_date = covered_start_date
+    _validate_covered_dates(covered_start_date, covered_end_date)
+    plan = ComparisonPlan(date_granularity, 0, offset_granularity, firstweekday)
+    plan.validate_date_range(start_date, end_date)
+    date_range_length = date_granularity.get_date_range_length(start_date, end_date, firstweekday, trusted=True)
+
+    if offset_granularity == OffsetGranularity.PERIODIC:
+        # compared date range is away by 'offset * length' date-granularity periods
+        located_granularity = date_granularity
+        step = date_range_length
+    else:
+        located_granularity = DateGranularity[offset_granularity.name]
+        step = 1
+
+    # compared start date should be in the period where covered end date locates or earlier,
+    # and compared end date in the period where covered start date locates or later,
+    # that is, compared start date is in the period 'length - 1' periods before it or later
+    earliest_start_ordinal = get_period_start(
+        date_granularity,
+        get_period_key(date_granularity, covered_start_date.toordinal(), firstweekday) - date_range_length + 1,
+        firstweekday,
+    )
+    earliest_start_date = datetime.date.fromordinal(earliest_start_ordinal)
+    base_key = _get_located_key(date_granularity, located_granularity, start_date, firstweekday)
+    min_offset = -(-(
+        _get_located_key(date_granularity, located_granularity, earliest_start_date, firstweekday) - base_key
+    ) // step)
+    max_offset = (
+        _get_located_key(date_granularity, located_granularity, covered_end_date, firstweekday) - base_key
+    ) // step
+
+    if step == 1:
+        # compared start date of the bound offset is in the same located period as the bound date,
+        # which is on either side of it
+        compared_date_range, = plan.apply_offsets(start_date, end_date, [min_offset], trusted=True, errors='coerce')
+        if compared_date_range is None or compared_date_range[0] < earliest_start_date:
+            min_offset += 1
+        compared_date_range, = plan.apply_offsets(start_date, end_date, [max_offset], trusted=True, errors='coerce')
+        if compared_date_range is None or compared_date_range[0] > covered_end_date:
+            max_offset -= 1
+
+    offsets = range(min_offset, max_offset + 1)
+    compared_date_ranges = plan.apply_offsets(start_date, end_date, offsets, trusted=True, errors='coerce')
+    return [
+        offset
+        for offset, compared_date_range in zip(offsets, compared_date_ranges)
+        if compared_date_range is not None
+    ]
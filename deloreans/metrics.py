@@ -0,0 +1,173 @@
+"""
+deloreans.metrics
+
+This module provides a component 'MetricIndex', which aggregates a metric over base windows
+and their compared windows, e.g. revenue of each dashboard tile against the same period of the year before
+
+Values are bucketed into date-granularity periods once, and kept as cumulative sums over dense period keys,
+then the sum over any window is a difference of two cumulative sums, whose cost doesn't depend on its length.
+NumPy is an optional dependency which should be installed before importing this module
+"""
+from typing import Any, NamedTuple, Tuple
+
+try:
+    import numpy as np  # type: ignore[import]
+except ImportError:  # pragma: no cover
+    raise ImportError(
+        'deloreans.metrics requires NumPy, please install it by "python -m pip install numpy"'
+    )
+
+from deloreans.date_utils import DateGranularity, OffsetGranularity
+import deloreans.vectorized as vectorized
+
+
+class Aggregates(NamedTuple):
+    """
+    aggregates of windows, whose shape is the same as windows
+
+    Args:
+        sum (array): sum of values, 0 for the window without any value
+        count (array): count of values
+        mean (array): mean of values, NaN for the window without any value
+    """
+    sum: Any
+    count: Any
+    mean: Any
+
+
+class MetricIndex:
+    """
+    Cumulative sums of a metric on date-granularity periods, which answer aggregates of windows in O(1) each
+
+        >>> index = deloreans.metrics.MetricIndex(order_dates, revenues)
+        >>> base, compared, valid = index.compare(
+        ...     start_dates, end_dates, -1, OffsetGranularity.YEARLY,
+        ... )
+        >>> growth = np.divide(base.sum, compared.sum, where=valid) - 1
+
+    Args:
+        dates (array): 1-D dates of values, which are not required to be sorted or unique
+        values (array): 1-D values, and NaN is regarded as missing
+        date_granularity (DateGranularity): granularity of periods which values are bucketed into,
+                                            and of windows, e.g. daily, weekly
+        firstweekday (int): define the start date's weekday of week, 0 is Monday, 6 is Sunday
+    """
+
+    def __init__(
+        self,
+        dates: Any,
+        values: Any,
+        date_granularity: DateGranularity = DateGranularity.DAILY,
+        firstweekday: int = 0,
+    ) -> None:
+        if not isinstance(date_granularity, DateGranularity):
+            raise ValueError(
+                f'Invalid date granularity {date_granularity!r}, should be DateGranularity'
+            )
+        if not isinstance(firstweekday, int):
+            raise TypeError(f'Invalid firstweekday {firstweekday!r}, should be int')
+        if not 0 <= firstweekday < 7:
+            raise ValueError(f'Invalid firstweekday {firstweekday!r}, should be from 0 (Monday) to 6 (Sunday)')
+        days, _ = vectorized.as_days(dates)
+        values = np.asarray(values, dtype=np.float64)
+        if days.ndim != 1 or values.shape != days.shape:
+            raise ValueError(
+                f'Invalid shapes of dates {days.shape} and values {values.shape}, should be 1-D arrays of same length'
+            )
+        self._date_granularity = date_granularity
+        self._firstweekday = firstweekday
+
+        present = ~np.isnan(values)
+        keys = vectorized._get_period_key(date_granularity, days[present], firstweekday)
+        # keys of periods without any value are kept, so that period keys are positions
+        self._first_key = int(keys.min()) if keys.size else 0
+        positions = keys - self._first_key
+        size = int(positions.max()) + 1 if keys.size else 0
+        self._sums = np.zeros(size + 1)
+        self._counts = np.zeros(size + 1, dtype=np.int64)
+        np.cumsum(np.bincount(positions, weights=values[present], minlength=size), out=self._sums[1:])
+        np.cumsum(np.bincount(positions, minlength=size), out=self._counts[1:])
+
+    @property
+    def date_granularity(self) -> DateGranularity:
+        return self._date_granularity
+
+    @property
+    def firstweekday(self) -> int:
+        return self._firstweekday
+
+    def _aggregate_keys(self, start_keys: Any, end_keys: Any) -> Aggregates:
+        """
+        aggregates of windows from start keys to end keys, both inclusive,
+        periods out of the index have no value
+        """
+        size = self._sums.size - 1
+        start_positions = np.clip(start_keys - self._first_key, 0, size)
+        stop_positions = np.clip(end_keys + 1 - self._first_key, 0, size)
+        sums = self._sums[stop_positions] - self._sums[start_positions]
+        counts = self._counts[stop_positions] - self._counts[start_positions]
+        means = np.divide(sums, counts, out=np.full(sums.shape, np.nan), where=counts > 0)
+        return Aggregates(sums, counts, means)
+
+    def _get_keys(self, start_days: Any, end_days: Any) -> Tuple[Any, Any]:
+        return (
+            vectorized._get_period_key(self._date_granularity, start_days, self._firstweekday),
+            vectorized._get_period_key(self._date_granularity, end_days, self._firstweekday),
+        )
+
+    def aggregate(self, start_dates: Any, end_dates: Any) -> Aggregates:
+        """
+        aggregates of values in given windows
+
+        Args:
+            start_dates (array): start dates of windows
+            end_dates (array): end dates of windows, windows should be complete periods of date granularity
+
+        Returns:
+            aggregates (Aggregates): sum, count and mean of each window
+        """
+        start_days, _, _ = vectorized._get_complete_date_ranges(
+            start_dates,
+            end_dates,
+            self._date_granularity,
+            self._firstweekday,
+        )
+        end_days, _ = vectorized.as_days(end_dates)
+        return self._aggregate_keys(*self._get_keys(start_days, end_days))
+
+    def compare(
+        self,
+        start_dates: Any,
+        end_dates: Any,
+        offset: Any,
+        offset_granularity: OffsetGranularity,
+    ) -> Tuple[Aggregates, Aggregates, Any]:
+        """
+        aggregates of values in given windows and their compared windows, refer to 'deloreans.vectorized.compare'
+
+        Args:
+            start_dates (array): start dates of windows
+            end_dates (array): end dates of windows, windows should be complete periods of date granularity
+            offset (int or array): away from given windows, to the future when positive
+            offset_granularity (OffsetGranularity): granularity of offset period, e.g. year-over-year
+
+        Returns:
+            base_aggregates (Aggregates): sum, count and mean of each window
+            compared_aggregates (Aggregates): sum, count and mean of each compared window,
+                                              which are meaningless where not valid
+            valid (array): whether compared window exists
+        """
+        start_days, _ = vectorized.as_days(start_dates)
+        end_days, _ = vectorized.as_days(end_dates)
+        # windows are validated by comparison
+        compared_start_days, compared_end_days, valid = vectorized.compare(
+            start_days,
+            end_days,
+            self._date_granularity,
+            offset,
+            offset_granularity,
+            self._firstweekday,
+        )
+        base_aggregates = self._aggregate_keys(*self._get_keys(start_days, end_days))
+        compared_aggregates = self._aggregate_keys(*self._get_keys(compared_start_days, compared_end_days))
+        return base_aggregates, compared_aggregates, valid
@@ -0,0 +1,279 @@
+"""
+deloreans.parallel
+
+This module runs 'deloreans.vectorized.compare' on chunks of very large date range arrays with a process pool
+
+Dates are exchanged with workers as int32 epoch days in shared memory instead of pickled objects,
+each worker attaches to the buffers by name, compares its own rows and writes them back in place,
+so that rows keep the order of input. NumPy is an optional dependency which should be installed
+before importing this module, and shared memory requires Python 3.8 or above
+"""
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+try:
+    import numpy as np  # type: ignore[import]
+except ImportError:  # pragma: no cover
+    raise ImportError(
+        'deloreans.parallel requires NumPy, please install it by "python -m pip install numpy"'
+    )
+
+try:
+    from multiprocessing.shared_memory import SharedMemory
+except ImportError:  # pragma: no cover
+    raise ImportError('deloreans.parallel requires shared memory, which is supported by Python 3.8 or above')
+
+from deloreans.date_utils import DateGranularity, OffsetGranularity
+import deloreans.vectorized as vectorized
+
+
+DEFAULT_CHUNK_SIZE = 1 << 20
+
+_DAYS_DTYPE = np.int32
+
+
+class ChunkError(ValueError):
+    """
+    Raised when comparing a chunk of rows fails, the original exception is its cause
+
+    Args:
+        start (int): first row of the chunk
+        stop (int): row after the last one of the chunk
+        error (Exception): exception raised by the chunk
+    """
+
+    def __init__(self, start: int, stop: int, error: BaseException) -> None:
+        super().__init__(f'Failed to compare rows [{start}, {stop}): {error!r}')
+        self.start = start
+        self.stop = stop
+        self.error = error
+
+
+class _SharedArray(NamedTuple):
+    """
+    picklable description of a 1-D array in shared memory
+    """
+    name: str
+    dtype: str
+    size: int
+
+
+def _create_shared_array(dtype: Any, size: int) -> Tuple[SharedMemory, Any]:
+    itemsize = np.dtype(dtype).itemsize
+    # zero sized shared memory is not allowed
+    shared_memory = SharedMemory(create=True, size=max(itemsize * size, 1))
+    return shared_memory, np.ndarray((size,), dtype=dtype, buffer=shared_memory.buf)
+
+
+def _attach_shared_array(shared_array: _SharedArray) -> Tuple[SharedMemory, Any]:
+    shared_memory = SharedMemory(name=shared_array.name)
+    return shared_memory, np.ndarray((shared_array.size,), dtype=shared_array.dtype, buffer=shared_memory.buf)
+
+
+def _compare_chunk(
+    shared_arrays: Dict[str, _SharedArray],
+    offset: Optional[int],
+    date_granularity: DateGranularity,
+    offset_granularity: OffsetGranularity,
+    firstweekday: int,
+    start: int,
+    stop: int,
+) -> None:
+    """
+    compare rows [start, stop) of shared input arrays, and write results into shared output arrays
+
+    Args:
+        shared_arrays (dict): 'start_days', 'end_days', 'compared_start_days', 'compared_end_days', 'valid',
+                              and 'offset' when offset is an array
+        offset (Optional[int]): scalar offset, None when offset is an array
+    """
+    attached = {key: _attach_shared_array(shared_array) for key, shared_array in shared_arrays.items()}
+    try:
+        arrays = {key: array for key, (_, array) in attached.items()}
+        compared_start_days, compared_end_days, valid = vectorized.compare(
+            arrays['start_days'][start:stop],
+            arrays['end_days'][start:stop],
+            date_granularity,
+            arrays['offset'][start:stop] if offset is None else offset,
+            offset_granularity,
+            firstweekday,
+        )
+        arrays['compared_start_days'][start:stop] = compared_start_days
+        arrays['compared_end_days'][start:stop] = compared_end_days
+        arrays['valid'][start:stop] = valid
+        del arrays, compared_start_days, compared_end_days, valid
+    finally:
+        for shared_memory, _ in attached.values():
+            shared_memory.close()
+
+
+def _as_days(dates: Any, name: str) -> Tuple[Any, bool]:
+    days, is_datetime = vectorized.as_days(dates)
+    if days.ndim != 1:
+        raise ValueError(f'Invalid {name} with shape {days.shape}, should be 1-D array')
+    return days, is_datetime
+
+
+def compare(
+    start_dates: Any,
+    end_dates: Any,
+    date_granularity: DateGranularity,
+    offset: Any,
+    offset_granularity: OffsetGranularity,
+    firstweekday: int = 0,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    processes: Optional[int] = None,
+    executor: Optional[Executor] = None,
+) -> Tuple[Any, Any, Any]:
+    """
+    provide compared date ranges of given date ranges in parallel, refer to 'deloreans.vectorized.compare'
+
+    Args:
+        start_dates (array): 1-D start dates of date ranges
+        end_dates (array): 1-D end dates of date ranges
+        date_granularity (DateGranularity): granularity of date ranges, e.g. daily, weekly
+        offset (int or array): away from given date ranges, to the future when positive
+        offset_granularity (OffsetGranularity): granularity of offset period, e.g. year-over-year
+        firstweekday (int): define the start date's weekday of week, 0 is Monday, 6 is Sunday
+        chunk_size (int): number of rows compared by a worker at once
+        processes (Optional[int]): number of worker processes, CPU count by default
+        executor (Optional[Executor]): reuse the process pool instead of starting one per call
+
+    Returns:
+        compared_start_dates (array): start dates of compared date ranges
+        compared_end_dates (array): end dates of compared date ranges
+        valid (array): whether compared date range exists
+
+    Raises:
+        ChunkError: the first chunk in row order which failed, e.g. contains incomplete date ranges
+    """
+    if not isinstance(chunk_size, int) or chunk_size < 1:
+        raise ValueError(f'Invalid chunk size {chunk_size!r}, should be positive integer')
+    vectorized.validate_params(date_granularity, offset_granularity, firstweekday)
+    start_days, is_datetime = _as_days(start_dates, 'start dates')
+    end_days, _ = _as_days(end_dates, 'end dates')
+    if start_days.shape != end_days.shape:
+        raise ValueError(f'Mismatched shapes of start dates {start_days.shape} and end dates {end_days.shape}')
+    # offsets are checked before copying into int32 shared memory, which would truncate or wrap them silently
+    offsets = vectorized.as_offsets(offset)
+    if offsets.ndim == 0:
+        scalar_offset: Optional[int] = int(offsets)
+    else:
+        scalar_offset = None
+        offsets = np.broadcast_to(offsets, start_days.shape)
+
+    size = start_days.size
+    inputs = {'start_days': start_days, 'end_days': end_days}
+    if scalar_offset is None:
+        inputs['offset'] = offsets
+    outputs = {'compared_start_days': _DAYS_DTYPE, 'compared_end_days': _DAYS_DTYPE, 'valid': np.bool_}
+
+    shared: Dict[str, Tuple[SharedMemory, Any]] = {}
+    try:
+        for key, array in inputs.items():
+            shared[key] = _create_shared_array(_DAYS_DTYPE, size)
+            shared[key][1][:] = array
+        for key, dtype in outputs.items():
+            shared[key] = _create_shared_array(dtype, size)
+        shared_arrays = {
+            key: _SharedArray(shared_memory.name, array.dtype.str, size)
+            for key, (shared_memory, array) in shared.items()
+        }
+
+        bounds = [(start, min(start + chunk_size, size)) for start in range(0, size, chunk_size)]
+        failures: List[Tuple[int, int, BaseException]] = []
+        pool = executor
+        if pool is None and len(bounds) > 1:
+            pool = ProcessPoolExecutor(max_workers=min(processes or os.cpu_count() or 1, len(bounds)))
+        try:
+            if pool is None:
+                for start, stop in bounds:
+                    try:
+                        _compare_chunk(
+                            shared_arrays,
+                            scalar_offset,
+                            date_granularity,
+                            offset_granularity,
+                            firstweekday,
+                            start,
+                            stop,
+                        )
+                    except Exception as error:
+                        failures.append((start, stop, error))
+            else:
+                futures = [
+                    pool.submit(
+                        _compare_chunk,
+                        shared_arrays,
+                        scalar_offset,
+                        date_granularity,
+                        offset_granularity,
+                        firstweekday,
+                        start,
+                        stop,
+                    )
+                    for start, stop in bounds
+                ]
+                for (start, stop), future in zip(bounds, futures):
+                    exception = future.exception()
+                    if exception is not None:
+                        failures.append((start, stop, exception))
+        finally:
+            if pool is not executor:
+                pool.shutdown()  # type: ignore[union-attr]
+
+        if failures:
+            start, stop, exception = failures[0]
+            raise ChunkError(start, stop, exception) from exception
+
+        compared_start_days = shared['compared_start_days'][1].copy()
+        compared_end_days = shared['compared_end_days'][1].copy()
+        valid = shared['valid'][1].copy()
+    finally:
+        for shared_memory, _ in shared.values():
+            shared_memory.close()
+            shared_memory.unlink()
+
+    return (
+        vectorized.restore_dates(compared_start_days, is_datetime),
+        vectorized.restore_dates(compared_end_days, is_datetime),
+        valid,
+    )
+
+
+def get(
+    start_dates: Any,
+    end_dates: Any,
+    date_granularity: DateGranularity,
+    offset: Any,
+    offset_granularity: OffsetGranularity,
+    firstweekday: int = 0,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    processes: Optional[int] = None,
+    executor: Optional[Executor] = None,
+) -> Tuple[Any, Any]:
+    """
+    provide compared date ranges of given date ranges in parallel,
+    raise ValueError as 'deloreans.get' does when any compared date range doesn't exist
+
+    Returns:
+        compared_start_dates (array): start dates of compared date ranges
+        compared_end_dates (array): end dates of compared date ranges
+    """
+    compared_start_dates, compared_end_dates, valid = compare(
+        start_dates,
+        end_dates,
+        date_granularity,
+        offset,
+        offset_granularity,
+        firstweekday,
+        chunk_size,
+        processes,
+        executor,
+    )
+    if not np.all(valid):
+        raise ValueError(
+            f'{np.size(valid) - np.count_nonzero(valid)} date ranges have no compared date range'
+        )
+    return compared_start_dates, compared_end_dates
@@ -0,0 +1,308 @@
+"""
+deloreans.plan
+
+This module provides a component 'ComparisonPlan',
+which resolves the date utilities of a granularity combination once
+and applies them on any number of given date ranges
+"""
+from __future__ import annotations
+import datetime
+from typing import Any, Callable, Iterable, List, Optional, Tuple
+
+from deloreans.date_utils import (
+    DateGranularity,
+    DatePeriodOffset,
+    OffsetGranularity,
+    VALID_GRAINS_COMB,
+)
+import deloreans.date_utils.common as common_date_utils
+
+
+def _resolve_date_util(func_name: str, description: str) -> Callable[..., Any]:
+    try:
+        return getattr(common_date_utils, func_name)
+    except AttributeError:
+        raise NotImplementedError(f'{description} has not been implemented')
+
+
+class ComparisonPlan:
+    """
+    Reusable comparison on fixed parameters except the given date range
+
+    Date granularity, offset, offset granularity and firstweekday are validated,
+    and the date utilities they require are resolved, only once when planning.
+    Applying the plan on a date range then runs the date arithmetic only.
+    """
+
+    __slots__ = (
+        '_date_granularity',
+        '_offset',
+        '_offset_granularity',
+        '_firstweekday',
+        '_is_periodic',
+        '_index_func',
+        '_located_func',
+        '_with_index_func',
+    )
+    _date_granularity: DateGranularity
+    _offset: int
+    _offset_granularity: OffsetGranularity
+    _firstweekday: int
+    _is_periodic: bool
+    _index_func: Callable[..., int]
+    _located_func: Callable[..., datetime.date]
+    _with_index_func: Callable[..., datetime.date]
+
+    def __init__(
+        self,
+        date_granularity: DateGranularity,
+        offset: int,
+        offset_granularity: OffsetGranularity,
+        firstweekday: int = 0,
+    ) -> None:
+        date_period_offset = DatePeriodOffset(offset, offset_granularity)
+        _setattr = object.__setattr__
+        _setattr(self, '_date_granularity', date_granularity)
+        _setattr(self, '_offset', date_period_offset.offset)
+        _setattr(self, '_offset_granularity', date_period_offset.offset_granularity)
+        _setattr(self, '_firstweekday', firstweekday)
+        self._validate_date_granularity_type()
+        self._validate_firstweekday()
+        self._validate_grain_comb()
+
+        is_periodic = offset_granularity == OffsetGranularity.PERIODIC
+        date_grain_name = date_granularity.name.lower()
+        offset_grain_name = offset_granularity.name.lower()
+        located_grain_name = date_grain_name if is_periodic else offset_grain_name
+
+        _setattr(self, '_is_periodic', is_periodic)
+        _setattr(self, '_index_func', _resolve_date_util(
+            f'get_{date_grain_name}_index_of_{located_grain_name}',
+            f'{date_grain_name} period\'s index in {offset_grain_name} period',
+        ))
+        _setattr(self, '_located_func', _resolve_date_util(
+            f'get_compared_start_{date_grain_name}_located_{located_grain_name}',
+            f'start {date_grain_name} period in {offset_grain_name} period',
+        ))
+        _setattr(self, '_with_index_func', _resolve_date_util(
+            f'get_{date_grain_name}_with_index_in_{located_grain_name}',
+            f'{date_grain_name} period with index in {offset_grain_name} period',
+        ))
+
+    @property
+    def date_granularity(self) -> DateGranularity:
+        return self._date_granularity
+
+    @property
+    def offset(self) -> int:
+        return self._offset
+
+    @property
+    def offset_granularity(self) -> OffsetGranularity:
+        return self._offset_granularity
+
+    @property
+    def firstweekday(self) -> int:
+        return self._firstweekday
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f'{self.__class__.__name__} is immutable')
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f'{self.__class__.__name__} is immutable')
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        """
+        pickle and copy by planning again, since attributes can't be set on an immutable instance
+        """
+        return self.__class__, self._key()
+
+    def _key(self) -> Tuple[DateGranularity, int, OffsetGranularity, int]:
+        return self._date_granularity, self._offset, self._offset_granularity, self._firstweekday
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ComparisonPlan):
+            return NotImplemented
+        return self._key() == other._key()
+
+    def __hash__(self) -> int:
+        return hash(self._key())
+
+    def __repr__(self) -> str:
+        return (
+            f'{self.__class__.__name__}('
+            f'date_granularity={self._date_granularity}, '
+            f'offset={self._offset}, '
+            f'offset_granularity={self._offset_granularity}, '
+            f'firstweekday={self._firstweekday})'
+        )
+
+    def _validate_date_granularity_type(self) -> None:
+        """
+        date granularity should be defined enum
+        """
+        if not isinstance(self._date_granularity, DateGranularity):
+            raise ValueError(
+                f'Invalid date granularity {self._date_granularity!r}, should be DateGranularity'
+            )
+
+    def _validate_firstweekday(self) -> None:
+        if not isinstance(self._firstweekday, int):
+            raise TypeError
+        if not 0 <= self._firstweekday < 7:
+            raise ValueError
+
+    def _validate_grain_comb(self) -> None:
+        if self._date_granularity not in VALID_GRAINS_COMB:
+            raise ValueError(
+                f"Date granularity {self._date_granularity!r} is not registered "
+                f"in granularity combinations."
+            )
+        if self._offset_granularity not in VALID_GRAINS_COMB[self._date_granularity]:
+            raise ValueError(
+                f"Invalid offset granularity {self._offset_granularity!r} "
+                f"when date granularity is {self._date_granularity!r}"
+            )
+
+    def validate_date_range(self, start_date: datetime.date, end_date: datetime.date) -> None:
+        """
+        date range should be a complete one of date granularity, refer to 'DeLoreans.get'
+        """
+        if not isinstance(start_date, datetime.date) or not isinstance(end_date, datetime.date):
+            raise ValueError(
+                f'Invalid date range ({start_date!r}, {end_date!r}), should be datetime.date'
+            )
+        if end_date < start_date:
+            raise ValueError(
+                f'Invalid date range, '
+                f'the end one {end_date} should be equal or greater than the start one {start_date}'
+            )
+        self._date_granularity.validate_date_completion(start_date, end_date, self._firstweekday)
+
+    def get_start_period_index(self, start_date: datetime.date) -> int:
+        """
+        index of the date-granularity period starting from given date in its located period,
+        e.g. the day of month when it is month-over-month
+        """
+        return self._index_func(start_date, firstweekday=self._firstweekday)
+
+    def get_located_period_start(self, start_date: datetime.date, offset: int) -> datetime.date:
+        """
+        start date of the located period which is away from the one of given date by offset,
+        then the compared date range starts from the period with the same index in it
+        """
+        return self._located_func(start_date, offset, firstweekday=self._firstweekday)
+
+    def apply(
+        self,
+        start_date: datetime.date,
+        end_date: datetime.date,
+        trusted: bool = False,
+    ) -> Tuple[datetime.date, datetime.date]:
+        """
+        provide compared date range of given date range, refer to 'DeLoreans.get'
+
+        Args:
+            start_date (datetime.date): start date of date range
+            end_date (datetime.date): end date of date range
+            trusted (bool): skip validation of date range, which should be a complete one
+
+        Returns:
+            compared_start_date (datetime.date): start date of compared date range
+            compared_end_date (datetime.date): end date of compared date range
+        """
+        date_granularity = self._date_granularity
+        firstweekday = self._firstweekday
+        if not trusted:
+            self.validate_date_range(start_date, end_date)
+
+        date_range_length = date_granularity.get_date_range_length(
+            start_date,
+            end_date,
+            firstweekday,
+            trusted=True,
+        )
+        offset = self._offset * date_range_length if self._is_periodic else self._offset
+
+        start_period_index = self._index_func(start_date, firstweekday=firstweekday)
+        located_period_start_date = self._located_func(start_date, offset, firstweekday=firstweekday)
+        compared_start_date = self._with_index_func(
+            located_period_start_date,
+            start_period_index,
+            firstweekday=firstweekday,
+        )
+        # the compared start date is always the start date of period
+        compared_end_date = date_granularity.get_end_date(
+            compared_start_date,
+            date_range_length,
+            firstweekday,
+            trusted=True,
+        )
+        return compared_start_date, compared_end_date
+
+    def apply_offsets(
+        self,
+        start_date: datetime.date,
+        end_date: datetime.date,
+        offsets: Iterable[int],
+        trusted: bool = False,
+        errors: str = 'raise',
+    ) -> List[Optional[Tuple[datetime.date, datetime.date]]]:
+        """
+        provide compared date ranges of given date range with each of given offsets instead of the planned one,
+        the length and start period index of date range are computed once for all offsets
+
+        Args:
+            start_date (datetime.date): start date of date range
+            end_date (datetime.date): end date of date range
+            offsets (Iterable[int]): offsets away from given date range, e.g. range(-5, 0)
+            trusted (bool): skip validation of date range and offsets
+            errors (str): when 'coerce', the compared date range which doesn't exist would be None instead of raising
+
+        Returns:
+            compared_date_ranges (list): compared start date and end date of each offset, in the order of offsets
+        """
+        if errors not in ('raise', 'coerce'):
+            raise ValueError(f'Invalid errors {errors!r}, should be "raise" or "coerce"')
+        date_granularity = self._date_granularity
+        firstweekday = self._firstweekday
+        offsets = list(offsets)
+        if not trusted:
+            self.validate_date_range(start_date, end_date)
+            for offset in offsets:
+                if not isinstance(offset, int):
+                    raise TypeError(f'Invalid offset {offset!r}, should be int')
+
+        date_range_length = date_granularity.get_date_range_length(
+            start_date,
+            end_date,
+            firstweekday,
+            trusted=True,
+        )
+        start_period_index = self._index_func(start_date, firstweekday=firstweekday)
+        located_func = self._located_func
+        with_index_func = self._with_index_func
+        get_end_date = date_granularity.get_end_date
+        is_periodic = self._is_periodic
+
+        compared_date_ranges: List[Optional[Tuple[datetime.date, datetime.date]]] = []
+        for offset in offsets:
+            try:
+                compared_start_date = with_index_func(
+                    located_func(
+                        start_date,
+                        offset * date_range_length if is_periodic else offset,
+                        firstweekday=firstweekday,
+                    ),
+                    start_period_index,
+                    firstweekday=firstweekday,
+                )
+                compared_end_date = get_end_date(compared_start_date, date_range_length, firstweekday, trusted=True)
+            except (ValueError, OverflowError):
+                # the compared date range is out of the calendar
+                if errors == 'raise':
+                    raise
+                compared_date_ranges.append(None)
+                continue
+            compared_date_ranges.append((compared_start_date, compared_end_date))
+        return compared_date_ranges
@@ -0,0 +1,151 @@
+"""
+deloreans.rolling_window
+
+This module provides compared date ranges of a window rolling over a date range period by period,
+e.g. the 4-week windows of each week in recent years, for trend charts
+
+Consecutive windows in the same located period, e.g. the days of a month when it is month-over-month,
+have consecutive start period indexes and so do their compared windows.
+Then the index and located period are computed with the date utilities only when the window
+crosses the boundary of located period, and each window within it is a step on period keys
+"""
+from __future__ import annotations
+import datetime
+from collections import namedtuple
+from typing import Iterator, Tuple
+
+from deloreans.date_utils import DateGranularity, OffsetGranularity
+from deloreans.date_utils.period_key import get_period_key, get_period_start
+from deloreans.date_utils.period_sequence import get_last_key
+from deloreans.plan import ComparisonPlan
+
+
+class RollingWindow(
+    namedtuple('RollingWindow', ['start_date', 'end_date', 'compared_start_date', 'compared_end_date']),
+):
+    """
+    Args:
+        start_date (datetime.date): start date of base window
+        end_date (datetime.date): end date of base window
+        compared_start_date (Optional[datetime.date]): start date of compared window,
+                                                       None when compared window doesn't exist
+        compared_end_date (Optional[datetime.date]): end date of compared window,
+                                                     None when compared window doesn't exist
+    """
+    __slots__ = ()
+
+
+def get_located_last_key(
+    date_granularity: DateGranularity,
+    located_granularity: DateGranularity,
+    start_ordinal: int,
+    firstweekday: int,
+) -> int:
+    """
+    key of the last date-granularity period in the located period of the one starting from given ordinal
+    """
+    # a week is located in the month or year of its fourth day
+    anchor_ordinal = start_ordinal + 3 if date_granularity == DateGranularity.WEEKLY else start_ordinal
+    located_key = get_period_key(located_granularity, anchor_ordinal, firstweekday)
+    located_end_ordinal = get_period_start(located_granularity, located_key + 1, firstweekday) - 1
+    return get_last_key(date_granularity, located_end_ordinal, firstweekday)
+
+
+def rolling(
+    start_date: datetime.date,
+    end_date: datetime.date,
+    window_length: int,
+    date_granularity: DateGranularity,
+    offset: int,
+    offset_granularity: OffsetGranularity,
+    firstweekday: int = 0,
+) -> Iterator[RollingWindow]:
+    """
+    provide the windows of given length rolling over the date range period by period,
+    with compared window of each, refer to 'DeLoreans.get'
+
+        >>> for window in deloreans.rolling(
+        ...     datetime.date(2024, 1, 1), datetime.date(2024, 12, 31), 7,
+        ...     DateGranularity.DAILY, -1, OffsetGranularity.YEARLY,
+        ... ):
+        ...     window.start_date, window.compared_start_date
+
+    Args:
+        start_date (datetime.date): start date of date range which windows roll over
+        end_date (datetime.date): end date of date range which windows roll over
+        window_length (int): count of date-granularity periods of each window
+        date_granularity (DateGranularity): granularity of window and rolling step, e.g. daily, weekly
+        offset (int): away from each window, to the future when positive
+        offset_granularity (OffsetGranularity): granularity of offset period, e.g. year-over-year
+        firstweekday (int): define the start date's weekday of week, 0 is Monday, 6 is Sunday
+
+    Returns:
+        windows (Iterator[RollingWindow]): windows in the order of start date, which are computed lazily
+    """
+    plan = ComparisonPlan(date_granularity, offset, offset_granularity, firstweekday)
+    plan.validate_date_range(start_date, end_date)
+    if not isinstance(window_length, int):
+        raise TypeError(f'Invalid window length {window_length!r}, should be int')
+    if window_length < 1:
+        raise ValueError(f'Invalid window length {window_length!r}, should be positive')
+    # validate eagerly, and roll lazily
+    return _roll(plan, start_date, end_date, window_length)
+
+
+def _roll(
+    plan: ComparisonPlan,
+    start_date: datetime.date,
+    end_date: datetime.date,
+    window_length: int,
+) -> Iterator[RollingWindow]:
+    date_granularity = plan.date_granularity
+    offset = plan.offset
+    offset_granularity = plan.offset_granularity
+    firstweekday = plan.firstweekday
+    fromordinal = datetime.date.fromordinal
+
+    def get_bounds(key: int) -> Tuple[datetime.date, datetime.date]:
+        return (
+            fromordinal(get_period_start(date_granularity, key, firstweekday)),
+            fromordinal(get_period_start(date_granularity, key + window_length, firstweekday) - 1),
+        )
+
+    first_key = get_period_key(date_granularity, start_date.toordinal(), firstweekday)
+    last_key = get_period_key(date_granularity, end_date.toordinal(), firstweekday) - window_length + 1
+
+    if offset_granularity == OffsetGranularity.PERIODIC:
+        located_granularity = date_granularity
+        offset *= window_length
+    else:
+        located_granularity = DateGranularity[offset_granularity.name]
+    if located_granularity == date_granularity:
+        # every period is a located period, then compared window is always away by the offset
+        for key in range(first_key, last_key + 1):
+            yield RollingWindow(*get_bounds(key), *get_bounds(key + offset))
+        return
+
+    key = first_key
+    while key <= last_key:
+        # the window crosses the boundary of located period
+        start_ordinal = get_period_start(date_granularity, key, firstweekday)
+        window_start_date = fromordinal(start_ordinal)
+        start_period_index = plan.get_start_period_index(window_start_date)
+        located_period_start_ordinal = plan.get_located_period_start(window_start_date, offset).toordinal()
+        located_last_key = get_located_last_key(date_granularity, located_granularity, start_ordinal, firstweekday)
+        compared_located_last_key = get_located_last_key(
+            date_granularity,
+            located_granularity,
+            located_period_start_ordinal,
+            firstweekday,
+        )
+        # compared window keeps the distance of key to the one of base window, until next located period
+        shift = get_period_key(date_granularity, located_period_start_ordinal, firstweekday) + start_period_index - key
+
+        for key in range(key, min(located_last_key, last_key) + 1):
+            compared_key = key + shift
+            if compared_key > compared_located_last_key:
+                # e.g. the 31st day of a month doesn't exist in the next month
+                yield RollingWindow(*get_bounds(key), None, None)
+            else:
+                yield RollingWindow(*get_bounds(key), *get_bounds(compared_key))
+        key += 1
@@ -0,0 +1,341 @@
+"""
+deloreans.server
+
+This module provides a local HTTP/JSON service of 'deloreans.get' on asyncio, without outside dependencies
+
+    > python -m deloreans.server --port 8000
+
+    POST /compare   body is a JSON object with the fields of 'python -m deloreans' records, e.g.
+                    {"start_date": "2024-06-01", "end_date": "2024-06-30", "date_granularity": "monthly",
+                     "offset": -1, "offset_granularity": "yearly"}
+                    responds {"compared_start_date": "2023-06-01", "compared_end_date": "2023-06-30"}
+    GET  /stats     responds counters and latency percentiles
+
+Requests arriving within a small window are coalesced into one 'deloreans.get_many' batch,
+and identical requests in flight share a single computation
+"""
+from __future__ import annotations
+import argparse
+import asyncio
+import json
+import sys
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Hashable, List, Optional, Sequence, Tuple
+
+from deloreans.api import get, get_many
+from deloreans.cache import make_key
+from deloreans.cli import FIELDS, parse_request
+
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8000
+DEFAULT_WINDOW = 0.002
+DEFAULT_MAX_BATCH_SIZE = 1024
+DEFAULT_LATENCY_SAMPLES = 10000
+
+# request body larger than it is rejected
+_MAX_BODY_SIZE = 1 << 16
+
+_DEFAULTS = (None, None, None, None, None, 0)
+
+_INVALID_REQUEST_EXCEPTIONS = (ValueError, TypeError, AttributeError, NotImplementedError, OverflowError)
+
+_REASONS = {
+    200: 'OK',
+    400: 'Bad Request',
+    404: 'Not Found',
+    405: 'Method Not Allowed',
+    413: 'Payload Too Large',
+    500: 'Internal Server Error',
+}
+
+
+class LatencyStats:
+    """
+    Latencies of the latest requests, with percentiles computed on demand
+
+    Args:
+        maxlen (int): amount of latest latencies kept
+    """
+
+    def __init__(self, maxlen: int = DEFAULT_LATENCY_SAMPLES) -> None:
+        self._latencies_ns: Deque[int] = deque(maxlen=maxlen)
+
+    def record(self, latency_ns: int) -> None:
+        self._latencies_ns.append(latency_ns)
+
+    def percentile(self, percent: float) -> Optional[float]:
+        """
+        nearest-rank percentile of kept latencies in milliseconds, None when nothing is recorded
+        """
+        if not self._latencies_ns:
+            return None
+        latencies_ns = sorted(self._latencies_ns)
+        rank = max(int(-(-percent * len(latencies_ns) // 100)), 1)
+        return latencies_ns[rank - 1] / 1e6
+
+
+class Batcher:
+    """
+    Coalesce requests arriving within a window into one batch computation,
+    and share the computation among identical requests in flight
+
+    Args:
+        window (float): seconds to wait for more requests after the first one of a batch
+        max_batch_size (int): compute the batch at once when it has so many distinct requests
+    """
+
+    def __init__(
+        self,
+        window: float = DEFAULT_WINDOW,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+    ) -> None:
+        if window < 0:
+            raise ValueError(f'Invalid window {window!r}, should not be negative')
+        if max_batch_size < 1:
+            raise ValueError(f'Invalid max batch size {max_batch_size!r}, should be positive')
+        self.window = window
+        self.max_batch_size = max_batch_size
+        self._in_flight: Dict[Hashable, asyncio.Future] = {}
+        self._batch: List[Tuple[Hashable, Tuple[Any, ...]]] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self.requests = 0
+        self.collapsed_requests = 0
+        self.batches = 0
+
+    async def submit(self, params: Sequence[Any]) -> Tuple[Any, Any]:
+        """
+        Args:
+            params (Sequence): parameters in the order of 'deloreans.get' arguments
+
+        Returns:
+            compared_date_range (tuple): compared start date and end date
+        """
+        self.requests += 1
+        key = make_key(*params)
+        future = self._in_flight.get(key)
+        if future is not None:
+            self.collapsed_requests += 1
+            return await asyncio.shield(future)
+
+        loop = asyncio.get_running_loop()
+        future = self._in_flight[key] = loop.create_future()
+        self._batch.append((key, tuple(params)))
+        if len(self._batch) >= self.max_batch_size:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.window, self._flush)
+        return await asyncio.shield(future)
+
+    def _flush(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        batch, self._batch = self._batch, []
+        if not batch:
+            return
+        self.batches += 1
+
+        results: List[Any] = []
+        try:
+            try:
+                results = get_many([params for _, params in batch])
+            except Exception:
+                # locate the failed ones request by request
+                results = []
+                for _, params in batch:
+                    try:
+                        results.append(get(*params))
+                    except Exception as error:
+                        results.append(error)
+        finally:
+            # every request in the batch is resolved and leaves in-flight ones, even if computation is interrupted
+            for position, (key, _) in enumerate(batch):
+                future = self._in_flight.pop(key)
+                if future.done():
+                    continue
+                if position >= len(results):
+                    future.set_exception(RuntimeError('Comparison is interrupted'))
+                elif isinstance(results[position], Exception):
+                    future.set_exception(results[position])
+                else:
+                    future.set_result(results[position])
+
+
+class _HttpError(Exception):
+
+    def __init__(self, status: int, message: str) -> None:
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+class Server:
+    """
+    HTTP/1.1 JSON service of 'deloreans.get' with keep-alive connections
+
+    Args:
+        host (str): address to bind, only localhost by default
+        port (int): port to bind, 0 for any free one
+        window (float): seconds of micro-batching window
+        max_batch_size (int): maximum distinct requests in a batch
+    """
+
+    def __init__(
+        self,
+        host: str = DEFAULT_HOST,
+        port: int = DEFAULT_PORT,
+        window: float = DEFAULT_WINDOW,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+    ) -> None:
+        self.host = host
+        self.port = port
+        self.batcher = Batcher(window, max_batch_size)
+        self.latency = LatencyStats()
+        self.errors = 0
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    async def start(self) -> None:
+        self._server = await asyncio.start_server(self._handle_connection, self.host, self.port)
+        # resolve the port actually bound when given 0
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def close(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def serve_forever(self) -> None:
+        if self._server is None:
+            await self.start()
+        async with self._server:  # type: ignore[union-attr]
+            await self._server.serve_forever()  # type: ignore[union-attr]
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            'requests': self.batcher.requests,
+            'batches': self.batcher.batches,
+            'collapsed_requests': self.batcher.collapsed_requests,
+            'errors': self.errors,
+            'latency_p50_ms': self.latency.percentile(50),
+            'latency_p99_ms': self.latency.percentile(99),
+        }
+
+    async def _compare(self, body: bytes) -> Dict[str, Any]:
+        started_ns = time.perf_counter_ns()
+        try:
+            record = json.loads(body)
+            if not isinstance(record, dict):
+                raise TypeError('Request body should be a JSON object')
+            params = parse_request([record.get(field) for field in FIELDS], _DEFAULTS)
+            compared_start_date, compared_end_date = await self.batcher.submit(params)
+        except _INVALID_REQUEST_EXCEPTIONS as error:
+            self.errors += 1
+            raise _HttpError(400, f'{error.__class__.__name__}: {error}')
+        except Exception as error:
+            self.errors += 1
+            raise _HttpError(500, f'{error.__class__.__name__}: {error}')
+        finally:
+            self.latency.record(time.perf_counter_ns() - started_ns)
+        return {
+            'compared_start_date': compared_start_date.isoformat(),
+            'compared_end_date': compared_end_date.isoformat(),
+        }
+
+    async def _route(self, method: str, path: str, body: bytes) -> Dict[str, Any]:
+        if path == '/compare':
+            if method != 'POST':
+                raise _HttpError(405, f'{method} is not allowed')
+            return await self._compare(body)
+        if path == '/stats':
+            if method != 'GET':
+                raise _HttpError(405, f'{method} is not allowed')
+            return self.stats()
+        raise _HttpError(404, f'{path} is not found')
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line.strip():
+                    break
+                method, path, version = request_line.decode('latin-1').split()
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if not line.strip():
+                        break
+                    name, _, value = line.decode('latin-1').partition(':')
+                    headers[name.strip().lower()] = value.strip()
+                keep_alive = (
+                    headers.get('connection', '').lower() != 'close'
+                    if version == 'HTTP/1.1'
+                    else headers.get('connection', '').lower() == 'keep-alive'
+                )
+
+                content_length = int(headers.get('content-length', 0))
+                try:
+                    if content_length > _MAX_BODY_SIZE:
+                        keep_alive = False
+                        raise _HttpError(413, f'Request body is larger than {_MAX_BODY_SIZE} bytes')
+                    body = await reader.readexactly(content_length)
+                    status, payload = 200, await self._route(method, path.split('?', 1)[0], body)
+                except _HttpError as error:
+                    status, payload = error.status, {'error': error.message}
+
+                content = json.dumps(payload).encode()
+                writer.write(
+                    f'{version} {status} {_REASONS[status]}\r\n'
+                    f'Content-Type: application/json\r\n'
+                    f'Content-Length: {len(content)}\r\n'
+                    f'Connection: {"keep-alive" if keep_alive else "close"}\r\n'
+                    f'\r\n'.encode('latin-1')
+                    + content
+                )
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ValueError, ConnectionError, asyncio.IncompleteReadError):
+            # malformed request or connection lost, drop the connection
+            pass
+        finally:
+            writer.close()
+
+
+def _parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog='python -m deloreans.server',
+        description='Serve deloreans.get as HTTP/JSON with request micro-batching',
+    )
+    parser.add_argument('--host', default=DEFAULT_HOST)
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    parser.add_argument(
+        '--window-ms',
+        type=float,
+        default=DEFAULT_WINDOW * 1000,
+        help='milliseconds to wait for more requests of a batch',
+    )
+    parser.add_argument('--max-batch-size', type=int, default=DEFAULT_MAX_BATCH_SIZE)
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    args = _parse_args(argv)
+    server = Server(args.host, args.port, args.window_ms / 1000, args.max_batch_size)
+
+    async def serve() -> None:
+        await server.start()
+        print(f'Serving on http://{server.host}:{server.port}', file=sys.stderr, flush=True)
+        await server.serve_forever()
+
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,185 @@
+"""
+deloreans.stream
+
+This module provides a stateful component 'StreamComparator',
+which tags each date of an unbounded stream with its counterpart in the compared period,
+refer to 'deloreans.vectorized.shift_dates'
+
+    >>> comparator = deloreans.StreamComparator(DateGranularity.WEEKLY, -1, OffsetGranularity.YEARLY)
+    >>> comparator.feed(event_dates)
+    >>> comparator.info()
+    StreamInfo(events=..., period_changes=..., recomputations=...)
+
+Dates of a stream usually come in rough order, so that the current period, its located period
+and their compared ones are cached. Within the located period, the compared period of each period
+is a step on period keys, and the date utilities run only when a date crosses the located period's boundary
+"""
+from __future__ import annotations
+import datetime
+import sys
+from collections import namedtuple
+from typing import Iterable, List, Optional
+
+from deloreans.date_utils import DateGranularity, OffsetGranularity
+from deloreans.date_utils.period_key import get_period_key, get_period_start
+from deloreans.plan import ComparisonPlan
+from deloreans.rolling_window import get_located_last_key
+
+
+class StreamInfo(namedtuple('StreamInfo', ['events', 'period_changes', 'recomputations'])):
+    """
+    Args:
+        events (int): count of compared dates
+        period_changes (int): count of dates which cross the boundary of cached date-granularity period
+        recomputations (int): count of dates which cross the boundary of cached located period,
+                              then the date utilities recompute the compared located period
+    """
+    __slots__ = ()
+
+
+class StreamComparator:
+    """
+    Counterparts of streaming dates in the compared periods on fixed parameters,
+    whose cost is amortized O(1) for each date of roughly ordered stream
+    """
+
+    __slots__ = (
+        '_plan',
+        '_located_granularity',
+        '_start_ordinal',
+        '_end_ordinal',
+        '_compared_start_ordinal',
+        '_compared_end_ordinal',
+        '_located_start_ordinal',
+        '_located_end_ordinal',
+        '_shift',
+        '_compared_located_last_key',
+        '_events',
+        '_period_changes',
+        '_recomputations',
+    )
+
+    def __init__(
+        self,
+        date_granularity: DateGranularity,
+        offset: int,
+        offset_granularity: OffsetGranularity,
+        firstweekday: int = 0,
+    ) -> None:
+        self._plan = ComparisonPlan(date_granularity, offset, offset_granularity, firstweekday)
+        if offset_granularity == OffsetGranularity.PERIODIC:
+            self._located_granularity = date_granularity
+        else:
+            self._located_granularity = DateGranularity[offset_granularity.name]
+        # empty periods, then the first date crosses their boundaries
+        self._start_ordinal = self._located_start_ordinal = 1
+        self._end_ordinal = self._located_end_ordinal = 0
+        self._compared_start_ordinal: Optional[int] = None
+        self._compared_end_ordinal = 0
+        self._shift = 0
+        self._compared_located_last_key = 0
+        self._events = 0
+        self._period_changes = 0
+        self._recomputations = 0
+
+    @property
+    def plan(self) -> ComparisonPlan:
+        return self._plan
+
+    def info(self) -> StreamInfo:
+        return StreamInfo(self._events, self._period_changes, self._recomputations)
+
+    def _recompute(self, ordinal: int) -> None:
+        """
+        cache the located period which given ordinal locates, with its compared one
+        """
+        self._recomputations += 1
+        plan = self._plan
+        date_granularity = plan.date_granularity
+        located_granularity = self._located_granularity
+        firstweekday = plan.firstweekday
+
+        if located_granularity == date_granularity:
+            # every period is a located period, then compared period is always away by the offset
+            self._located_start_ordinal = 1
+            self._located_end_ordinal = datetime.date.max.toordinal()
+            self._shift = plan.offset
+            self._compared_located_last_key = sys.maxsize
+            return
+
+        key = get_period_key(date_granularity, ordinal, firstweekday)
+        start_ordinal = get_period_start(date_granularity, key, firstweekday)
+        start_date = datetime.date.fromordinal(start_ordinal)
+        located_first_key = key - plan.get_start_period_index(start_date)
+        located_last_key = get_located_last_key(date_granularity, located_granularity, start_ordinal, firstweekday)
+        compared_located_start_ordinal = plan.get_located_period_start(start_date, plan.offset).toordinal()
+
+        self._located_start_ordinal = get_period_start(date_granularity, located_first_key, firstweekday)
+        self._located_end_ordinal = get_period_start(date_granularity, located_last_key + 1, firstweekday) - 1
+        # compared period keeps the distance of key to the one of base period, within the located period
+        self._shift = get_period_key(date_granularity, compared_located_start_ordinal, firstweekday) - located_first_key
+        self._compared_located_last_key = get_located_last_key(
+            date_granularity,
+            located_granularity,
+            compared_located_start_ordinal,
+            firstweekday,
+        )
+
+    def _move(self, ordinal: int) -> None:
+        """
+        cache the date-granularity period which given ordinal locates, with its compared one
+        """
+        self._period_changes += 1
+        if not self._located_start_ordinal <= ordinal <= self._located_end_ordinal:
+            self._recompute(ordinal)
+        date_granularity = self._plan.date_granularity
+        firstweekday = self._plan.firstweekday
+
+        key = get_period_key(date_granularity, ordinal, firstweekday)
+        self._start_ordinal = get_period_start(date_granularity, key, firstweekday)
+        self._end_ordinal = get_period_start(date_granularity, key + 1, firstweekday) - 1
+        compared_key = key + self._shift
+        if compared_key > self._compared_located_last_key:
+            # e.g. the 53rd week of a year doesn't exist in the year before
+            self._compared_start_ordinal = None
+            return
+        self._compared_start_ordinal = get_period_start(date_granularity, compared_key, firstweekday)
+        self._compared_end_ordinal = get_period_start(date_granularity, compared_key + 1, firstweekday) - 1
+
+    def compare(self, a_date: datetime.date, errors: str = 'raise') -> Optional[datetime.date]:
+        """
+        provide the counterpart of given date at the same position of compared period
+
+        Args:
+            a_date (datetime.date): date of stream
+            errors (str): when 'coerce', the counterpart which doesn't exist would be None instead of raising,
+                          e.g. 29th February in the monthly February a year before
+
+        Returns:
+            compared_date (datetime.date): counterpart of given date
+        """
+        if errors not in ('raise', 'coerce'):
+            raise ValueError(f'Invalid errors {errors!r}, should be "raise" or "coerce"')
+        if not isinstance(a_date, datetime.date):
+            raise ValueError(f'Invalid date {a_date!r}, should be datetime.date')
+
+        ordinal = a_date.toordinal()
+        if not self._start_ordinal <= ordinal <= self._end_ordinal:
+            self._move(ordinal)
+        self._events += 1
+
+        compared_start_ordinal = self._compared_start_ordinal
+        if compared_start_ordinal is not None:
+            compared_ordinal = compared_start_ordinal + ordinal - self._start_ordinal
+            if compared_ordinal <= self._compared_end_ordinal:
+                return datetime.date.fromordinal(compared_ordinal)
+        if errors == 'raise':
+            raise ValueError(f'Date {a_date!r} has no counterpart in compared period')
+        return None
+
+    def feed(self, dates: Iterable[datetime.date], errors: str = 'raise') -> List[Optional[datetime.date]]:
+        """
+        provide the counterparts of a micro-batch of dates, in the order of dates, refer to 'compare'
+        """
+        compare = self.compare
+        return [compare(a_date, errors) for a_date in dates]
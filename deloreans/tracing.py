@@ -0,0 +1,56 @@
+"""
+deloreans.tracing
+
+This module provides an opt-in tracing hook of 'DeLoreans.get',
+which reports each phase with its resolved date utility, intermediate values and elapsed time
+
+    >>> def tracer(event):
+    ...     print(event.phase, event.func.__name__, event.elapsed_ns)
+    >>> deloreans.set_tracer(tracer)
+    >>> deloreans.get(...)
+    start_period_index get_weekly_index_of_yearly 1375
+    ...
+
+Only the phases run by 'DeLoreans.get' are traced, so results served from the comparison cache
+and comparisons by 'deloreans.compile' or 'deloreans.get_many' are not reported
+"""
+from __future__ import annotations
+from collections import namedtuple
+from typing import Any, Callable, Optional
+
+
+class TraceEvent(namedtuple('TraceEvent', ['phase', 'func', 'values', 'elapsed_ns'])):
+    """
+    Args:
+        phase (str): 'start_period_index', 'date_range_length', 'located_period_start_date',
+                     'compared_start_date' or 'compared_end_date', which are reported in this order
+        func (Callable): the date utility which the phase is resolved to
+        values (dict): arguments and result of the phase, keyed by name
+        elapsed_ns (int): elapsed nanoseconds of the phase
+    """
+    __slots__ = ()
+
+
+# callback receiving each phase
+Tracer = Callable[[TraceEvent], Any]
+
+_tracer: Optional[Tracer] = None
+
+
+def set_tracer(tracer: Optional[Tracer]) -> Optional[Tracer]:
+    """
+    install the callback which receives a 'TraceEvent' per phase of 'DeLoreans.get',
+    or uninstall it with None
+
+    Returns:
+        previous_tracer (Optional[Callable]): the tracer installed before, for restoring it
+    """
+    global _tracer
+    if tracer is not None and not callable(tracer):
+        raise TypeError(f'Invalid tracer {tracer!r}, should be callable')
+    previous_tracer, _tracer = _tracer, tracer
+    return previous_tracer
+
+
+def get_tracer() -> Optional[Tracer]:
+    return _tracer
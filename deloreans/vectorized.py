@@ -0,0 +1,1217 @@
+"""
+deloreans.vectorized
+
+This module provides array counterparts of the date utilities, powered by NumPy,
+which compute compared date ranges of date range arrays with array arithmetic
+
+Dates are numpy.datetime64[D] arrays, or integer arrays of days since 1970-01-01 (epoch days).
+Each function returns the same kind of dates as given, and NumPy is an optional dependency
+which should be installed before importing this module
+"""
+from typing import Any, Callable, Tuple
+
+try:
+    import numpy as np  # type: ignore[import]
+except ImportError:  # pragma: no cover
+    raise ImportError(
+        'deloreans.vectorized requires NumPy, please install it by "python -m pip install numpy"'
+    )
+
+from deloreans.date_utils import (
+    DateGranularity,
+    OffsetGranularity,
+    VALID_GRAINS_COMB,
+)
+
+
+# days between 0000-03-01 and 1970-01-01 in proleptic Gregorian calendar
+_EPOCH_SHIFT = 719468
+_DAYS_PER_ERA = 146097
+
+# 1970-01-01 is Thursday
+_EPOCH_WEEKDAY = 3
+
+# epoch days of 0001-01-01 and 9999-12-31, the calendar which 'datetime.date' supports
+_MIN_DAYS = -719162
+_MAX_DAYS = 2932896
+# no compared date range in the calendar is away by more periods than its days
+_MAX_OFFSET = _MAX_DAYS - _MIN_DAYS
+
+# minimum amount of keys to evaluate with tabulation
+_TABULATE_MIN_SIZE = 64
+
+# epoch days within about 5.8 million years are representable,
+# and arithmetic on 32-bit integers is faster than 64-bit ones
+_DAYS_DTYPE = np.int32
+
+
+def _as_int32(array: Any, description: str) -> Any:
+    """
+    cast given integer array into int32,
+    raise ValueError on the value out of its range instead of wrapping it silently
+    """
+    if not np.can_cast(array.dtype, _DAYS_DTYPE) and array.size:
+        info = np.iinfo(_DAYS_DTYPE)
+        if array.min() < info.min or array.max() > info.max:
+            raise ValueError(f'Invalid {description}, should be in the range of int32')
+    return array.astype(_DAYS_DTYPE, copy=False)
+
+
+def as_days(dates: Any) -> Tuple[Any, bool]:
+    """
+    convert given dates into int32 epoch days,
+    with whether they were numpy.datetime64 or not, which is given back to 'restore_dates'
+
+    Args:
+        dates (array): datetime64 dates or integer epoch days
+
+    Returns:
+        days (np.ndarray): int32 epoch days
+        is_datetime (bool): whether given dates are datetime64
+    """
+    array = np.asarray(dates)
+    if array.dtype.kind == 'M':
+        return _as_int32(array.astype('datetime64[D]').astype(np.int64), 'dates'), True
+    if array.dtype.kind in ('i', 'u'):
+        return _as_int32(array, 'epoch days'), False
+    raise ValueError(
+        f'Invalid dates with dtype {array.dtype}, should be datetime64 or integer'
+    )
+
+
+def as_offsets(offset: Any) -> Any:
+    """
+    convert given offsets into int32 array, raise TypeError on non-integer ones as 'deloreans.get' does
+
+    Args:
+        offset (int or array): integer offsets
+    """
+    offset = np.asarray(offset)
+    if offset.dtype.kind not in ('i', 'u'):
+        raise TypeError(f'Invalid offset with dtype {offset.dtype}, should be integer')
+    return _as_int32(offset, 'offset')
+
+
+def restore_dates(days: Any, is_datetime: bool) -> Any:
+    """
+    convert epoch days back into the kind of dates given to 'as_days'
+    """
+    if is_datetime:
+        return days.astype('datetime64[D]')
+    return days
+
+
+def _broadcast_valid(valid: Any, days: Any) -> Any:
+    """
+    boolean array of whether each index is valid, with the same shape as broadcast dates
+    """
+    return np.logical_or(valid, np.zeros(np.broadcast(valid, days).shape, dtype=bool))
+
+
+def _tabulate(func: Callable[[Any], Any], keys: Any) -> Any:
+    """
+    Dates of large arrays usually concentrate in decades,
+    when the span of keys is not greater than their amount,
+    evaluate 'func' on each key of the span once, then gather results by keys
+    """
+    keys = np.asarray(keys, dtype=_DAYS_DTYPE)
+    if keys.size < _TABULATE_MIN_SIZE:
+        return func(keys)
+    low, high = int(keys.min()), int(keys.max())
+    if high - low >= keys.size:
+        return func(keys)
+    positions = np.subtract(keys, low, dtype=np.intp)
+    results = func(np.arange(low, high + 1, dtype=_DAYS_DTYPE))
+    if isinstance(results, tuple):
+        return tuple(np.take(result, positions) for result in results)
+    return np.take(results, positions)
+
+
+def _civil_from_days(days: Any) -> Tuple[Any, Any, Any]:
+    """
+    refer to: https://howardhinnant.github.io/date_algorithms.html#civil_from_days
+    """
+    days = days + _EPOCH_SHIFT
+    era = days // _DAYS_PER_ERA
+    day_of_era = days - era * _DAYS_PER_ERA
+    year_of_era = (
+        day_of_era - day_of_era // 1460 + day_of_era // 36524 - day_of_era // 146096
+    ) // 365
+    day_of_year = day_of_era - (365 * year_of_era + year_of_era // 4 - year_of_era // 100)
+    # month index counted from March
+    shifted_month = (5 * day_of_year + 2) // 153
+    day = day_of_year - (153 * shifted_month + 2) // 5 + 1
+    month = shifted_month + 3 - 12 * (shifted_month // 10)
+    year = year_of_era + era * 400 + shifted_month // 10
+    return year, month, day
+
+
+def days_to_civil(days: Any) -> Tuple[Any, Any, Any]:
+    """
+    convert epoch days into (year, month, day) arrays
+    """
+    return _tabulate(_civil_from_days, days)
+
+
+def civil_to_days(year: Any, month: Any, day: Any) -> Any:
+    """
+    convert (year, month, day) arrays into epoch days,
+    refer to: https://howardhinnant.github.io/date_algorithms.html#days_from_civil
+    """
+    year = np.asarray(year, dtype=_DAYS_DTYPE)
+    month = np.asarray(month, dtype=_DAYS_DTYPE)
+    # month index counted from March
+    shifted_month = (month + 9) % 12
+    year = year - shifted_month // 10
+    era = year // 400
+    year_of_era = year - era * 400
+    day_of_year = (153 * shifted_month + 2) // 5 + day - 1
+    day_of_era = year_of_era * 365 + year_of_era // 4 - year_of_era // 100 + day_of_year
+    return era * _DAYS_PER_ERA + day_of_era - _EPOCH_SHIFT
+
+
+def _get_year(days: Any) -> Any:
+    return _tabulate(lambda a_days: _civil_from_days(a_days)[0], days)
+
+
+def _get_month(days: Any) -> Any:
+    return _tabulate(lambda a_days: _civil_from_days(a_days)[1], days)
+
+
+def _get_day(days: Any) -> Any:
+    return _tabulate(lambda a_days: _civil_from_days(a_days)[2], days)
+
+
+def _month_serial(days: Any) -> Any:
+    """
+    month serial is the count of months since 0000-01, which is 'year * 12 + month - 1'
+    """
+    def _get_month_serial(a_days: Any) -> Any:
+        year, month, _ = _civil_from_days(a_days)
+        return year * 12 + month - 1
+
+    return _tabulate(_get_month_serial, days)
+
+
+def _month_serial_start(month_serial: Any) -> Any:
+    return _tabulate(
+        lambda serial: civil_to_days(serial // 12, serial % 12 + 1, 1),
+        month_serial,
+    )
+
+
+def _year_start(year: Any) -> Any:
+    return _tabulate(lambda a_year: civil_to_days(a_year, 1, 1), year)
+
+
+def get_weekday(dates: Any) -> Any:
+    """
+    get the weekday of given dates, 0 is Monday, 6 is Sunday
+    """
+    days, _ = as_days(dates)
+    return (days + _EPOCH_WEEKDAY) % 7
+
+
+def get_weekly_start_date(dates: Any, firstweekday: int = 0) -> Any:
+    """
+    get the start date of week which given dates located
+    """
+    days, is_datetime = as_days(dates)
+    return restore_dates(days - (days + _EPOCH_WEEKDAY - firstweekday) % 7, is_datetime)
+
+
+def get_week_anchor_date(dates: Any, firstweekday: int = 0) -> Any:
+    """
+    The fourth day of week determine the year and month that week located
+    """
+    days, is_datetime = as_days(dates)
+    return restore_dates(get_weekly_start_date(days, firstweekday) + 3, is_datetime)
+
+
+def _start_weekly_of_month_start(daily_start_days: Any, firstweekday: int = 0) -> Any:
+    week_start_days = daily_start_days - (daily_start_days + _EPOCH_WEEKDAY - firstweekday) % 7
+    # the week represented by anchor date is in previous month
+    # so that the first week should be the next one
+    return week_start_days + 7 * (daily_start_days > week_start_days + 3)
+
+
+def get_start_weekly_of_month(year: Any, month: Any, firstweekday: int = 0) -> Any:
+    """
+    get the start week of given months in epoch days,
+    which is represented by week's start date
+    """
+    return _start_weekly_of_month_start(civil_to_days(year, month, 1), firstweekday)
+
+
+def _get_start_weekly_of_month_serial(month_serial: Any, firstweekday: int = 0) -> Any:
+    return _tabulate(
+        lambda serial: _start_weekly_of_month_start(
+            civil_to_days(serial // 12, serial % 12 + 1, 1),
+            firstweekday,
+        ),
+        month_serial,
+    )
+
+
+def _get_start_weekly_of_year(year: Any, firstweekday: int = 0) -> Any:
+    return _tabulate(
+        lambda a_year: _start_weekly_of_month_start(civil_to_days(a_year, 1, 1), firstweekday),
+        year,
+    )
+
+
+def _get_weeks_of_month_serial(month_serial: Any, firstweekday: int = 0) -> Any:
+    return _tabulate(
+        lambda serial: (
+            _get_start_weekly_of_month_serial(serial + 1, firstweekday)
+            - _get_start_weekly_of_month_serial(serial, firstweekday)
+        ) // 7,
+        month_serial,
+    )
+
+
+def _get_weeks_of_year(year: Any, firstweekday: int = 0) -> Any:
+    return _tabulate(
+        lambda a_year: (
+            _get_start_weekly_of_year(a_year + 1, firstweekday)
+            - _get_start_weekly_of_year(a_year, firstweekday)
+        ) // 7,
+        year,
+    )
+
+
+# ==========================================================================================================
+#
+#   Series of functions which provide start period of a unit date period,
+#   refer to the same series in 'deloreans.date_utils.common'
+#
+# ==========================================================================================================
+
+
+def get_start_daily_of_daily(dates: Any, firstweekday: int = 0) -> Any:
+    days, is_datetime = as_days(dates)
+    return restore_dates(days, is_datetime)
+
+
+def get_start_daily_of_weekly(dates: Any, firstweekday: int = 0) -> Any:
+    return get_weekly_start_date(dates, firstweekday)
+
+
+def get_start_daily_of_monthly(dates: Any, firstweekday: int = 0) -> Any:
+    days, is_datetime = as_days(dates)
+    day = _get_day(days)
+    return restore_dates(days - day + 1, is_datetime)
+
+
+def get_start_daily_of_yearly(dates: Any, firstweekday: int = 0) -> Any:
+    days, is_datetime = as_days(dates)
+    year = _get_year(days)
+    return restore_dates(_year_start(year), is_datetime)
+
+
+def get_start_weekly_of_weekly(dates: Any, firstweekday: int = 0) -> Any:
+    return get_weekly_start_date(dates, firstweekday)
+
+
+def get_start_weekly_of_monthly(dates: Any, firstweekday: int = 0) -> Any:
+    days, is_datetime = as_days(dates)
+    month_serial = _month_serial(get_week_anchor_date(days, firstweekday))
+    return restore_dates(_get_start_weekly_of_month_serial(month_serial, firstweekday), is_datetime)
+
+
+def get_start_weekly_of_yearly(dates: Any, firstweekday: int = 0) -> Any:
+    days, is_datetime = as_days(dates)
+    year = _get_year(get_week_anchor_date(days, firstweekday))
+    return restore_dates(_get_start_weekly_of_year(year, firstweekday), is_datetime)
+
+
+def get_start_monthly_of_monthly(dates: Any, firstweekday: int = 0) -> Any:
+    return get_start_daily_of_monthly(dates)
+
+
+def get_start_monthly_of_yearly(dates: Any, firstweekday: int = 0) -> Any:
+    return get_start_daily_of_yearly(dates)
+
+
+def get_start_yearly_of_yearly(dates: Any, firstweekday: int = 0) -> Any:
+    return get_start_daily_of_yearly(dates)
+
+
+# =================================================================================================
+#
+#   Series of functions which provide period's index of a unit date period,
+#   refer to the same series in 'deloreans.date_utils.common'
+#
+# =================================================================================================
+
+
+def get_daily_index_of_daily(dates: Any, firstweekday: int = 0) -> Any:
+    days, _ = as_days(dates)
+    return np.zeros_like(days)
+
+
+def get_daily_index_of_weekly(dates: Any, firstweekday: int = 0) -> Any:
+    days, _ = as_days(dates)
+    return (days + _EPOCH_WEEKDAY - firstweekday) % 7
+
+
+def get_daily_index_of_monthly(dates: Any, firstweekday: int = 0) -> Any:
+    days, _ = as_days(dates)
+    day = _get_day(days)
+    return day - 1
+
+
+def get_daily_index_of_yearly(dates: Any, firstweekday: int = 0) -> Any:
+    days, _ = as_days(dates)
+    year = _get_year(days)
+    return days - _year_start(year)
+
+
+def get_weekly_index_of_weekly(dates: Any, firstweekday: int = 0) -> Any:
+    days, _ = as_days(dates)
+    return np.zeros_like(days)
+
+
+def get_weekly_index_of_monthly(dates: Any, firstweekday: int = 0) -> Any:
+    days, _ = as_days(dates)
+    located_start_days = get_start_weekly_of_monthly(days, firstweekday)
+    return (get_weekly_start_date(days, firstweekday) - located_start_days) // 7
+
+
+def get_weekly_index_of_yearly(dates: Any, firstweekday: int = 0) -> Any:
+    days, _ = as_days(dates)
+    located_start_days = get_start_weekly_of_yearly(days, firstweekday)
+    return (get_weekly_start_date(days, firstweekday) - located_start_days) // 7
+
+
+def get_monthly_index_of_monthly(dates: Any, firstweekday: int = 0) -> Any:
+    days, _ = as_days(dates)
+    return np.zeros_like(days)
+
+
+def get_monthly_index_of_yearly(dates: Any, firstweekday: int = 0) -> Any:
+    days, _ = as_days(dates)
+    month = _get_month(days)
+    return month - 1
+
+
+def get_yearly_index_of_yearly(dates: Any, firstweekday: int = 0) -> Any:
+    days, _ = as_days(dates)
+    return np.zeros_like(days)
+
+
+# =================================================================================================
+#
+#   Series of functions which provide unit date period which compared start period located,
+#   refer to the same series in 'deloreans.date_utils.common'
+#
+#   offset could be either an integer or an integer array
+#
+# =================================================================================================
+
+
+def get_compared_start_daily_located_daily(dates: Any, offset: Any, firstweekday: int = 0) -> Any:
+    days, is_datetime = as_days(dates)
+    return restore_dates(days + offset, is_datetime)
+
+
+def get_compared_start_daily_located_weekly(dates: Any, offset: Any, firstweekday: int = 0) -> Any:
+    days, is_datetime = as_days(dates)
+    return restore_dates(get_weekly_start_date(days, firstweekday) + 7 * offset, is_datetime)
+
+
+def get_compared_start_daily_located_monthly(dates: Any, offset: Any, firstweekday: int = 0) -> Any:
+    days, is_datetime = as_days(dates)
+    return restore_dates(_month_serial_start(_month_serial(days) + offset), is_datetime)
+
+
+def get_compared_start_daily_located_yearly(dates: Any, offset: Any, firstweekday: int = 0) -> Any:
+    days, is_datetime = as_days(dates)
+    year = _get_year(days)
+    return restore_dates(_year_start(year + offset), is_datetime)
+
+
+def get_compared_start_weekly_located_weekly(dates: Any, offset: Any, firstweekday: int = 0) -> Any:
+    return get_compared_start_daily_located_weekly(dates, offset, firstweekday)
+
+
+def get_compared_start_weekly_located_monthly(dates: Any, offset: Any, firstweekday: int = 0) -> Any:
+    days, is_datetime = as_days(dates)
+    month_serial = _month_serial(get_week_anchor_date(days, firstweekday)) + offset
+    return restore_dates(
+        _get_start_weekly_of_month_serial(month_serial, firstweekday),
+        is_datetime,
+    )
+
+
+def get_compared_start_weekly_located_yearly(dates: Any, offset: Any, firstweekday: int = 0) -> Any:
+    days, is_datetime = as_days(dates)
+    year = _get_year(get_week_anchor_date(days, firstweekday))
+    return restore_dates(_get_start_weekly_of_year(year + offset, firstweekday), is_datetime)
+
+
+def get_compared_start_monthly_located_monthly(dates: Any, offset: Any, firstweekday: int = 0) -> Any:
+    return get_compared_start_daily_located_monthly(dates, offset)
+
+
+def get_compared_start_monthly_located_yearly(dates: Any, offset: Any, firstweekday: int = 0) -> Any:
+    return get_compared_start_daily_located_yearly(dates, offset)
+
+
+def get_compared_start_yearly_located_yearly(dates: Any, offset: Any, firstweekday: int = 0) -> Any:
+    return get_compared_start_daily_located_yearly(dates, offset)
+
+
+# =================================================================================================
+#
+#   Series of functions which provide date period with index in located unit date period,
+#   refer to the same series in 'deloreans.date_utils.common'
+#
+#   Instead of raising exception on the index out of located period's capacity,
+#   each function returns the start dates with a boolean array of whether the index is valid,
+#   values of start dates with invalid index are meaningless
+#
+# =================================================================================================
+
+
+def get_daily_with_index_in_daily(dates: Any, index: Any, firstweekday: int = 0) -> Tuple[Any, Any]:
+    days, is_datetime = as_days(dates)
+    return restore_dates(days, is_datetime), _broadcast_valid(index == 0, days)
+
+
+def get_daily_with_index_in_weekly(dates: Any, index: Any, firstweekday: int = 0) -> Tuple[Any, Any]:
+    days, is_datetime = as_days(dates)
+    start_days = get_weekly_start_date(days, firstweekday) + index
+    return restore_dates(start_days, is_datetime), _broadcast_valid((0 <= index) & (index < 7), days)
+
+
+def get_daily_with_index_in_monthly(dates: Any, index: Any, firstweekday: int = 0) -> Tuple[Any, Any]:
+    days, is_datetime = as_days(dates)
+    month_serial = _month_serial(days)
+    month_start_days = _month_serial_start(month_serial)
+    capacity = _month_serial_start(month_serial + 1) - month_start_days
+    valid = _broadcast_valid((0 <= index) & (index < capacity), days)
+    return restore_dates(month_start_days + index, is_datetime), valid
+
+
+def get_daily_with_index_in_yearly(dates: Any, index: Any, firstweekday: int = 0) -> Tuple[Any, Any]:
+    days, is_datetime = as_days(dates)
+    year = _get_year(days)
+    year_start_days = _year_start(year)
+    capacity = _year_start(year + 1) - year_start_days
+    valid = _broadcast_valid((0 <= index) & (index < capacity), days)
+    return restore_dates(year_start_days + index, is_datetime), valid
+
+
+def get_weekly_with_index_in_weekly(dates: Any, index: Any, firstweekday: int = 0) -> Tuple[Any, Any]:
+    days, is_datetime = as_days(dates)
+    return restore_dates(get_weekly_start_date(days, firstweekday), is_datetime), _broadcast_valid(index == 0, days)
+
+
+def get_weekly_with_index_in_monthly(dates: Any, index: Any, firstweekday: int = 0) -> Tuple[Any, Any]:
+    days, is_datetime = as_days(dates)
+    month_serial = _month_serial(get_week_anchor_date(days, firstweekday))
+    start_days = _get_start_weekly_of_month_serial(month_serial, firstweekday) + 7 * index
+    # each month has different amount of weeks
+    capacity = _get_weeks_of_month_serial(month_serial, firstweekday)
+    return restore_dates(start_days, is_datetime), _broadcast_valid((0 <= index) & (index < capacity), days)
+
+
+def get_weekly_with_index_in_yearly(dates: Any, index: Any, firstweekday: int = 0) -> Tuple[Any, Any]:
+    days, is_datetime = as_days(dates)
+    year = _get_year(get_week_anchor_date(days, firstweekday))
+    start_days = _get_start_weekly_of_year(year, firstweekday) + 7 * index
+    # each year has different amount of weeks
+    capacity = _get_weeks_of_year(year, firstweekday)
+    return restore_dates(start_days, is_datetime), _broadcast_valid((0 <= index) & (index < capacity), days)
+
+
+def get_monthly_with_index_in_monthly(dates: Any, index: Any, firstweekday: int = 0) -> Tuple[Any, Any]:
+    days, is_datetime = as_days(dates)
+    return restore_dates(get_start_daily_of_monthly(days), is_datetime), _broadcast_valid(index == 0, days)
+
+
+def get_monthly_with_index_in_yearly(dates: Any, index: Any, firstweekday: int = 0) -> Tuple[Any, Any]:
+    days, is_datetime = as_days(dates)
+    year = _get_year(days)
+    start_days = civil_to_days(year, 1 + np.clip(index, 0, 11), 1)
+    return restore_dates(start_days, is_datetime), _broadcast_valid((0 <= index) & (index < 12), days)
+
+
+def get_yearly_with_index_in_yearly(dates: Any, index: Any, firstweekday: int = 0) -> Tuple[Any, Any]:
+    days, is_datetime = as_days(dates)
+    return restore_dates(get_start_daily_of_yearly(days), is_datetime), _broadcast_valid(index == 0, days)
+
+
+# =================================================================================================
+#
+#   Array counterparts of 'DateGranularity' methods
+#
+# =================================================================================================
+
+
+def _get_period_key(date_granularity: DateGranularity, days: Any, firstweekday: int = 0) -> Any:
+    """
+    dense integer identity of the period which given days located
+    """
+    if date_granularity == DateGranularity.DAILY:
+        return days
+    if date_granularity == DateGranularity.WEEKLY:
+        return (days + _EPOCH_WEEKDAY - firstweekday) // 7
+    if date_granularity == DateGranularity.MONTHLY:
+        return _month_serial(days)
+    if date_granularity == DateGranularity.YEARLY:
+        year = _get_year(days)
+        return year
+    raise ValueError(
+        f'Invalid date granularity {date_granularity!r}, should be DateGranularity'
+    )
+
+
+def _get_period_start(date_granularity: DateGranularity, period_key: Any, firstweekday: int = 0) -> Any:
+    """
+    start epoch day of the period with given dense integer identity
+    """
+    if date_granularity == DateGranularity.DAILY:
+        return period_key
+    if date_granularity == DateGranularity.WEEKLY:
+        return 7 * period_key - _EPOCH_WEEKDAY + firstweekday
+    if date_granularity == DateGranularity.MONTHLY:
+        return _month_serial_start(period_key)
+    if date_granularity == DateGranularity.YEARLY:
+        return _year_start(period_key)
+    raise ValueError(
+        f'Invalid date granularity {date_granularity!r}, should be DateGranularity'
+    )
+
+
+def _bucket_days(
+    days: Any,
+    date_granularity: DateGranularity,
+    located_granularity: DateGranularity,
+    firstweekday: int,
+) -> Tuple[Any, Any, Any]:
+    keys = _get_period_key(date_granularity, days, firstweekday)
+    if date_granularity == DateGranularity.WEEKLY:
+        # the fourth day of week determine the month and year which the week located
+        anchor_days = days - (days + _EPOCH_WEEKDAY - firstweekday) % 7 + 3
+        located_keys = _get_period_key(located_granularity, anchor_days, firstweekday)
+        first_days = _start_weekly_of_month_start(
+            _get_period_start(located_granularity, located_keys, firstweekday),
+            firstweekday,
+        )
+    else:
+        located_keys = _get_period_key(located_granularity, days, firstweekday)
+        first_days = _get_period_start(located_granularity, located_keys, firstweekday)
+    indexes = keys - _get_period_key(date_granularity, first_days, firstweekday)
+    return keys, located_keys, indexes.astype(keys.dtype, copy=False)
+
+
+def bucket(
+    dates: Any,
+    date_granularity: DateGranularity,
+    located_granularity: DateGranularity,
+    firstweekday: int = 0,
+) -> Tuple[Any, Any, Any]:
+    """
+    assign each date to the date-granularity period it locates, and that period to its located period,
+    where a week is located in the month or year of its fourth day for any firstweekday
+
+        >>> keys, month_serials, indexes = deloreans.vectorized.bucket(
+        ...     event_dates, DateGranularity.WEEKLY, DateGranularity.MONTHLY, firstweekday=6,
+        ... )
+
+    Args:
+        dates (array): dates to assign
+        date_granularity (DateGranularity): granularity of periods, e.g. weekly
+        located_granularity (DateGranularity): granularity of located periods, e.g. monthly
+        firstweekday (int): define the start date's weekday of week, 0 is Monday, 6 is Sunday
+
+    Returns:
+        keys (array): key of date-granularity period, refer to 'deloreans.date_utils.period_key'
+        located_keys (array): key of located period
+        indexes (array): index of date-granularity period in located period,
+                         the same as 'get_%(date_granularity)s_index_of_%(located_granularity)s'
+    """
+    for granularity in (date_granularity, located_granularity):
+        if not isinstance(granularity, DateGranularity):
+            raise ValueError(f'Invalid granularity {granularity!r}, should be DateGranularity')
+    located_names = {
+        offset_granularity.name
+        for offset_granularity in VALID_GRAINS_COMB[date_granularity]
+        if offset_granularity != OffsetGranularity.PERIODIC
+    }
+    if located_granularity.name not in located_names:
+        raise ValueError(
+            f'Invalid located granularity {located_granularity!r} when date granularity is {date_granularity!r}'
+        )
+    if not isinstance(firstweekday, int):
+        raise TypeError
+    if not 0 <= firstweekday < 7:
+        raise ValueError
+    days, _ = as_days(dates)
+    # all of keys are functions of days, which are computed once for each day of the span
+    return _tabulate(
+        lambda a_days: _bucket_days(a_days, date_granularity, located_granularity, firstweekday),
+        days,
+    )
+
+
+def is_complete(
+    date_granularity: DateGranularity,
+    start_dates: Any,
+    end_dates: Any,
+    firstweekday: int = 0,
+) -> Any:
+    """
+    whether each date range is composed of complete date-granularity periods
+    """
+    start_days, _ = as_days(start_dates)
+    end_days, _ = as_days(end_dates)
+    return _is_complete(
+        date_granularity,
+        start_days,
+        end_days,
+        _get_period_key(date_granularity, start_days, firstweekday),
+        _get_period_key(date_granularity, end_days, firstweekday),
+        firstweekday,
+    )
+
+
+def _is_complete(
+    date_granularity: DateGranularity,
+    start_days: Any,
+    end_days: Any,
+    start_keys: Any,
+    end_keys: Any,
+    firstweekday: int = 0,
+) -> Any:
+    # start date is the start of its period and end date is the end of its period,
+    # then end date is not less than start date when end period is not before start period
+    return (
+        (start_keys <= end_keys)
+        & (_get_period_start(date_granularity, start_keys, firstweekday) == start_days)
+        & (_get_period_start(date_granularity, end_keys + 1, firstweekday) == end_days + 1)
+    )
+
+
+def get_date_range_length(
+    date_granularity: DateGranularity,
+    start_dates: Any,
+    end_dates: Any,
+    firstweekday: int = 0,
+) -> Any:
+    """
+    Provide the count of date periods with given granularity of each complete date range
+    """
+    start_days, _ = as_days(start_dates)
+    end_days, _ = as_days(end_dates)
+    if np.any(start_days > end_days):
+        raise ValueError
+    return (
+        _get_period_key(date_granularity, end_days, firstweekday)
+        - _get_period_key(date_granularity, start_days, firstweekday)
+        + 1
+    )
+
+
+def get_end_date(
+    date_granularity: DateGranularity,
+    start_dates: Any,
+    date_range_length: Any,
+    firstweekday: int = 0,
+) -> Any:
+    """
+    Provide the end date of each date range with given start period and length
+    """
+    start_days, is_datetime = as_days(start_dates)
+    start_keys = _get_period_key(date_granularity, start_days, firstweekday)
+    if np.any(_get_period_start(date_granularity, start_keys, firstweekday) != start_days):
+        raise ValueError
+    if np.any(np.asarray(date_range_length) < 1):
+        raise ValueError
+    end_days = _get_period_start(date_granularity, start_keys + date_range_length, firstweekday) - 1
+    return restore_dates(end_days, is_datetime)
+
+
+def _get_placeholder(date_granularity: DateGranularity, firstweekday: int = 0) -> Tuple[Any, Any]:
+    """
+    the date-granularity period which 1970-01-01 located,
+    as a complete date range standing for missing values, e.g. nulls
+    """
+    date_grain_name = date_granularity.name.lower()
+    start_days = globals()[f'get_start_daily_of_{date_grain_name}'](0, firstweekday)
+    return start_days, get_end_date(date_granularity, start_days, 1, firstweekday)
+
+
+# =================================================================================================
+#
+#   Compared date ranges of date range arrays
+#
+# =================================================================================================
+
+
+def _resolve(func_name: str, description: str) -> Callable[..., Any]:
+    try:
+        return globals()[func_name]
+    except KeyError:
+        raise NotImplementedError(f'{description} has not been implemented')
+
+
+def validate_params(
+    date_granularity: DateGranularity,
+    offset_granularity: OffsetGranularity,
+    firstweekday: int,
+) -> None:
+    """
+    validate parameters shared by vectorized comparisons, raise as 'DeLoreans' does on invalid ones
+    """
+    if not isinstance(date_granularity, DateGranularity):
+        raise ValueError(
+            f'Invalid date granularity {date_granularity!r}, should be DateGranularity'
+        )
+    if not isinstance(offset_granularity, OffsetGranularity):
+        raise TypeError(
+            f'Invalid offset granularity {offset_granularity!r}, should be OffsetGranularity'
+        )
+    if not isinstance(firstweekday, int):
+        raise TypeError
+    if not 0 <= firstweekday < 7:
+        raise ValueError
+    if offset_granularity not in VALID_GRAINS_COMB[date_granularity]:
+        raise ValueError(
+            f"Invalid offset granularity {offset_granularity!r} "
+            f"when date granularity is {date_granularity!r}"
+        )
+
+
+def _resolve_date_utils(
+    date_granularity: DateGranularity,
+    offset_granularity: OffsetGranularity,
+) -> Tuple[Callable[..., Any], Callable[..., Any], Callable[..., Any]]:
+    """
+    index, located and with-index functions of the granularity combination
+    """
+    date_grain_name = date_granularity.name.lower()
+    offset_grain_name = offset_granularity.name.lower()
+    if offset_granularity == OffsetGranularity.PERIODIC:
+        located_grain_name = date_grain_name
+    else:
+        located_grain_name = offset_grain_name
+    return (
+        _resolve(
+            f'get_{date_grain_name}_index_of_{located_grain_name}',
+            f'{date_grain_name} period\'s index in {offset_grain_name} period',
+        ),
+        _resolve(
+            f'get_compared_start_{date_grain_name}_located_{located_grain_name}',
+            f'start {date_grain_name} period in {offset_grain_name} period',
+        ),
+        _resolve(
+            f'get_{date_grain_name}_with_index_in_{located_grain_name}',
+            f'{date_grain_name} period with index in {offset_grain_name} period',
+        ),
+    )
+
+
+def _get_complete_date_ranges(
+    start_dates: Any,
+    end_dates: Any,
+    date_granularity: DateGranularity,
+    firstweekday: int,
+) -> Tuple[Any, bool, Any]:
+    """
+    epoch days of start dates, whether they were numpy.datetime64, and length of each date range
+    """
+    start_days, is_datetime = as_days(start_dates)
+    end_days, _ = as_days(end_dates)
+    start_keys = _get_period_key(date_granularity, start_days, firstweekday)
+    end_keys = _get_period_key(date_granularity, end_days, firstweekday)
+    if not np.all(_is_complete(date_granularity, start_days, end_days, start_keys, end_keys, firstweekday)):
+        raise ValueError('Invalid date ranges, should be complete periods of date granularity')
+    return start_days, is_datetime, end_keys - start_keys + 1
+
+
+def _compare_days(
+    start_days: Any,
+    date_range_length: Any,
+    start_period_index: Any,
+    date_granularity: DateGranularity,
+    offset: Any,
+    offset_granularity: OffsetGranularity,
+    firstweekday: int,
+    located_func: Callable[..., Any],
+    with_index_func: Callable[..., Any],
+) -> Tuple[Any, Any, Any]:
+    """
+    compared start days, end days and validity, broadcast among date ranges and offsets
+
+    Compared date ranges out of the calendar are invalid, as 'deloreans.get' raises on them
+    """
+    offset = as_offsets(offset).astype(np.int64)
+    if offset_granularity == OffsetGranularity.PERIODIC:
+        offset = offset * np.asarray(date_range_length, dtype=np.int64)
+    # offsets farther than the calendar are invalid anyway, clipping them keeps int32 arithmetic from wrapping
+    in_calendar = np.abs(offset) <= _MAX_OFFSET
+    offset = np.clip(offset, -_MAX_OFFSET, _MAX_OFFSET).astype(_DAYS_DTYPE)
+    located_period_start_days = located_func(start_days, offset, firstweekday)
+    compared_start_days, valid = with_index_func(
+        located_period_start_days,
+        start_period_index,
+        firstweekday,
+    )
+    compared_end_days = (
+        _get_period_start(
+            date_granularity,
+            _get_period_key(date_granularity, compared_start_days, firstweekday) + date_range_length,
+            firstweekday,
+        )
+        - 1
+    )
+    in_calendar = in_calendar & (compared_start_days >= _MIN_DAYS) & (compared_end_days <= _MAX_DAYS)
+    return compared_start_days, compared_end_days, _broadcast_valid(valid, compared_start_days) & in_calendar
+
+
+def compare(
+    start_dates: Any,
+    end_dates: Any,
+    date_granularity: DateGranularity,
+    offset: Any,
+    offset_granularity: OffsetGranularity,
+    firstweekday: int = 0,
+) -> Tuple[Any, Any, Any]:
+    """
+    provide compared date ranges of given date ranges, refer to 'DeLoreans.get'
+
+    Args:
+        start_dates (array): start dates of date ranges
+        end_dates (array): end dates of date ranges
+        date_granularity (DateGranularity): granularity of date ranges, e.g. daily, weekly
+        offset (int or array): away from given date ranges, to the future when positive
+        offset_granularity (OffsetGranularity): granularity of offset period, e.g. year-over-year
+        firstweekday (int): define the start date's weekday of week, 0 is Monday, 6 is Sunday
+
+    Returns:
+        compared_start_dates (array): start dates of compared date ranges
+        compared_end_dates (array): end dates of compared date ranges
+        valid (array): whether compared date range exists,
+                       e.g. the 366th day of a leap year doesn't exist in previous year,
+                       and neither does the one beyond 0001-01-01 to 9999-12-31
+    """
+    validate_params(date_granularity, offset_granularity, firstweekday)
+    start_days, is_datetime, date_range_length = _get_complete_date_ranges(
+        start_dates,
+        end_dates,
+        date_granularity,
+        firstweekday,
+    )
+    index_func, located_func, with_index_func = _resolve_date_utils(date_granularity, offset_granularity)
+    compared_start_days, compared_end_days, valid = _compare_days(
+        start_days,
+        date_range_length,
+        index_func(start_days, firstweekday),
+        date_granularity,
+        offset,
+        offset_granularity,
+        firstweekday,
+        located_func,
+        with_index_func,
+    )
+    return (
+        restore_dates(compared_start_days, is_datetime),
+        restore_dates(compared_end_days, is_datetime),
+        valid,
+    )
+
+
+def compare_offsets(
+    start_dates: Any,
+    end_dates: Any,
+    date_granularity: DateGranularity,
+    offsets: Any,
+    offset_granularity: OffsetGranularity,
+    firstweekday: int = 0,
+) -> Tuple[Any, Any, Any]:
+    """
+    provide compared date ranges of each given date range with each offset,
+    whose length and start period index are computed once for all offsets
+
+    Args:
+        start_dates (array): 1-D start dates of date ranges
+        end_dates (array): 1-D end dates of date ranges
+        date_granularity (DateGranularity): granularity of date ranges, e.g. daily, weekly
+        offsets (array): 1-D offsets, e.g. range(-5, 0) for the same period of the 5 previous years
+        offset_granularity (OffsetGranularity): granularity of offset period, e.g. year-over-year
+        firstweekday (int): define the start date's weekday of week, 0 is Monday, 6 is Sunday
+
+    Returns:
+        compared_start_dates (array): start dates of compared date ranges, whose shape is (date ranges, offsets)
+        compared_end_dates (array): end dates of compared date ranges, whose shape is (date ranges, offsets)
+        valid (array): whether compared date range exists, whose shape is (date ranges, offsets)
+    """
+    validate_params(date_granularity, offset_granularity, firstweekday)
+    start_days, is_datetime, date_range_length = _get_complete_date_ranges(
+        start_dates,
+        end_dates,
+        date_granularity,
+        firstweekday,
+    )
+    offsets = np.asarray(offsets)
+    if start_days.ndim != 1 or offsets.ndim != 1:
+        raise ValueError(
+            f'Invalid shapes of date ranges {start_days.shape} and offsets {offsets.shape}, should be 1-D arrays'
+        )
+    index_func, located_func, with_index_func = _resolve_date_utils(date_granularity, offset_granularity)
+    # date ranges along the first axis, and offsets along the second one
+    start_days = start_days[:, np.newaxis]
+    compared_start_days, compared_end_days, valid = _compare_days(
+        start_days,
+        date_range_length[:, np.newaxis],
+        index_func(start_days, firstweekday),
+        date_granularity,
+        offsets[np.newaxis, :],
+        offset_granularity,
+        firstweekday,
+        located_func,
+        with_index_func,
+    )
+    return (
+        restore_dates(compared_start_days, is_datetime),
+        restore_dates(compared_end_days, is_datetime),
+        valid,
+    )
+
+
+def rolling(
+    start_date: Any,
+    end_date: Any,
+    window_length: int,
+    date_granularity: DateGranularity,
+    offset: Any,
+    offset_granularity: OffsetGranularity,
+    firstweekday: int = 0,
+) -> Tuple[Any, Any, Any, Any, Any]:
+    """
+    provide the windows of given length rolling over the date range period by period,
+    with compared window of each, refer to 'deloreans.rolling'
+
+    Args:
+        start_date (scalar): start date of date range which windows roll over
+        end_date (scalar): end date of date range which windows roll over
+        window_length (int): count of date-granularity periods of each window
+        date_granularity (DateGranularity): granularity of window and rolling step, e.g. daily, weekly
+        offset (int): away from each window, to the future when positive
+        offset_granularity (OffsetGranularity): granularity of offset period, e.g. year-over-year
+        firstweekday (int): define the start date's weekday of week, 0 is Monday, 6 is Sunday
+
+    Returns:
+        start_dates (array): start dates of windows
+        end_dates (array): end dates of windows
+        compared_start_dates (array): start dates of compared windows
+        compared_end_dates (array): end dates of compared windows
+        valid (array): whether compared window exists
+    """
+    validate_params(date_granularity, offset_granularity, firstweekday)
+    if not isinstance(window_length, (int, np.integer)) or window_length < 1:
+        raise ValueError(f'Invalid window length {window_length!r}, should be positive integer')
+    start_days, is_datetime, date_range_length = _get_complete_date_ranges(
+        start_date,
+        end_date,
+        date_granularity,
+        firstweekday,
+    )
+    if start_days.ndim != 0:
+        raise ValueError(f'Invalid date range with shape {start_days.shape}, should be scalar dates')
+    first_key = _get_period_key(date_granularity, start_days, firstweekday)
+    keys = np.arange(first_key, first_key + date_range_length - window_length + 1, dtype=_DAYS_DTYPE)
+    start_days = _get_period_start(date_granularity, keys, firstweekday)
+    end_days = _get_period_start(date_granularity, keys + window_length, firstweekday) - 1
+    index_func, located_func, with_index_func = _resolve_date_utils(date_granularity, offset_granularity)
+    compared_start_days, compared_end_days, valid = _compare_days(
+        start_days,
+        window_length,
+        index_func(start_days, firstweekday),
+        date_granularity,
+        offset,
+        offset_granularity,
+        firstweekday,
+        located_func,
+        with_index_func,
+    )
+    return (
+        restore_dates(start_days, is_datetime),
+        restore_dates(end_days, is_datetime),
+        restore_dates(compared_start_days, is_datetime),
+        restore_dates(compared_end_days, is_datetime),
+        valid,
+    )
+
+
+def align_positions(
+    dates: Any,
+    date_granularity: DateGranularity,
+    offset: Any,
+    offset_granularity: OffsetGranularity,
+    firstweekday: int = 0,
+) -> Tuple[Any, Any]:
+    """
+    provide the position of compared period of each period in given sorted dates,
+    which maps a time series onto itself, e.g. the same month of the year before
+
+    Args:
+        dates (array): 1-D sorted and unique start dates of date-granularity periods
+        date_granularity (DateGranularity): granularity of periods, e.g. daily, weekly
+        offset (int or array): away from given periods, to the future when positive
+        offset_granularity (OffsetGranularity): granularity of offset period, e.g. year-over-year
+        firstweekday (int): define the start date's weekday of week, 0 is Monday, 6 is Sunday
+
+    Returns:
+        positions (array): position of compared period in given dates, -1 when it is missing
+        valid (array): whether compared period exists and is in given dates
+    """
+    validate_params(date_granularity, offset_granularity, firstweekday)
+    days, _ = as_days(dates)
+    if days.ndim != 1:
+        raise ValueError(f'Invalid dates with shape {days.shape}, should be 1-D array')
+    if np.any(days[1:] <= days[:-1]):
+        raise ValueError('Invalid dates, should be sorted and unique')
+    keys = _get_period_key(date_granularity, days, firstweekday)
+    if np.any(_get_period_start(date_granularity, keys, firstweekday) != days):
+        raise ValueError('Invalid dates, should be start dates of date-granularity periods')
+
+    index_func, located_func, with_index_func = _resolve_date_utils(date_granularity, offset_granularity)
+    compared_start_days, _, valid = _compare_days(
+        days,
+        1,
+        index_func(days, firstweekday),
+        date_granularity,
+        offset,
+        offset_granularity,
+        firstweekday,
+        located_func,
+        with_index_func,
+    )
+    # compared period is in given dates when the date at its insertion point is itself
+    positions = np.searchsorted(days, compared_start_days)
+    in_dates = positions < days.size
+    in_dates[in_dates] = days[positions[in_dates]] == compared_start_days[in_dates]
+    valid = valid & in_dates
+    return np.where(valid, positions, -1), valid
+
+
+def align(
+    dates: Any,
+    values: Any,
+    date_granularity: DateGranularity,
+    offset: Any,
+    offset_granularity: OffsetGranularity,
+    firstweekday: int = 0,
+) -> Tuple[Any, Any, Any]:
+    """
+    provide base and compared values of a time series aligned period by period, refer to 'align_positions'
+
+        >>> base_values, compared_values, valid = deloreans.vectorized.align(
+        ...     months, revenues, DateGranularity.MONTHLY, -1, OffsetGranularity.YEARLY,
+        ... )
+        >>> growth = np.divide(base_values, compared_values, where=valid) - 1
+
+    Args:
+        dates (array): 1-D sorted and unique start dates of date-granularity periods
+        values (array): values of periods along the first axis
+        date_granularity (DateGranularity): granularity of periods, e.g. daily, weekly
+        offset (int or array): away from given periods, to the future when positive
+        offset_granularity (OffsetGranularity): granularity of offset period, e.g. year-over-year
+        firstweekday (int): define the start date's weekday of week, 0 is Monday, 6 is Sunday
+
+    Returns:
+        base_values (array): given values
+        compared_values (array): values of compared periods, which are undefined where not valid
+        valid (array): whether compared period exists and is in given dates
+    """
+    values = np.asarray(values)
+    positions, valid = align_positions(dates, date_granularity, offset, offset_granularity, firstweekday)
+    if values.ndim == 0 or len(values) != len(positions):
+        raise ValueError(f'Mismatched lengths of dates {len(positions)} and values with shape {values.shape}')
+    return values, values.take(positions, axis=0), valid
+
+
+def shift_dates(
+    dates: Any,
+    date_granularity: DateGranularity,
+    offset: Any,
+    offset_granularity: OffsetGranularity,
+    firstweekday: int = 0,
+) -> Tuple[Any, Any]:
+    """
+    provide the counterpart of each date in the compared period of the date-granularity period it locates,
+    at the same position, e.g. each day of 2024-W10 is mapped to the same weekday of 2023-W10
+
+        >>> shifted_dates, valid = deloreans.vectorized.shift_dates(
+        ...     event_dates, DateGranularity.WEEKLY, -1, OffsetGranularity.YEARLY,
+        ... )
+
+    Args:
+        dates (array): dates to shift, which can be any date of periods
+        date_granularity (DateGranularity): granularity of periods, e.g. daily, weekly
+        offset (int or array): away from given dates, to the future when positive
+        offset_granularity (OffsetGranularity): granularity of offset period, e.g. year-over-year
+        firstweekday (int): define the start date's weekday of week, 0 is Monday, 6 is Sunday
+
+    Returns:
+        shifted_dates (array): counterparts of dates, which are meaningless where not valid
+        valid (array): whether counterpart exists, which is out of range
+                       when compared period doesn't exist, e.g. the 53rd week of year in a 52-week year,
+                       or it is shorter than the period, e.g. 29th February in the monthly February a year before
+    """
+    validate_params(date_granularity, offset_granularity, firstweekday)
+    days, is_datetime = as_days(dates)
+    start_days = _get_period_start(
+        date_granularity,
+        _get_period_key(date_granularity, days, firstweekday),
+        firstweekday,
+    )
+    index_func, located_func, with_index_func = _resolve_date_utils(date_granularity, offset_granularity)
+    compared_start_days, compared_end_days, valid = _compare_days(
+        start_days,
+        1,
+        index_func(start_days, firstweekday),
+        date_granularity,
+        offset,
+        offset_granularity,
+        firstweekday,
+        located_func,
+        with_index_func,
+    )
+    shifted_days = compared_start_days + (days - start_days)
+    return restore_dates(shifted_days, is_datetime), valid & (shifted_days <= compared_end_days)
+
+
+def get(
+    start_dates: Any,
+    end_dates: Any,
+    date_granularity: DateGranularity,
+    offset: Any,
+    offset_granularity: OffsetGranularity,
+    firstweekday: int = 0,
+) -> Tuple[Any, Any]:
+    """
+    provide compared date ranges of given date ranges,
+    raise ValueError as 'deloreans.get' does when any compared date range doesn't exist
+
+    Returns:
+        compared_start_dates (array): start dates of compared date ranges
+        compared_end_dates (array): end dates of compared date ranges
+    """
+    compared_start_dates, compared_end_dates, valid = compare(
+        start_dates,
+        end_dates,
+        date_granularity,
+        offset,
+        offset_granularity,
+        firstweekday,
+    )
+    if not np.all(valid):
+        raise ValueError(
+            f'{np.size(valid) - np.count_nonzero(valid)} date ranges have no compared date range'
+        )
+    return compared_start_dates, compared_end_dates
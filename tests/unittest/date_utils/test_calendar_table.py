@@ -0,0 +1,97 @@
+import datetime
+from unittest import TestCase
+
+import deloreans.date_utils.common as common_date_utils
+from deloreans.date_utils import calendar_table
+from deloreans.date_utils.calendar_table import CalendarTable
+
+
+class CalendarTableTestCase(TestCase):
+
+    def test_consistent_with_date_arithmetic(self):
+        for firstweekday in range(7):
+            table = CalendarTable(firstweekday, 2019, 2021)
+            a_date = datetime.date(2019, 1, 1)
+            while a_date <= datetime.date(2021, 12, 31):
+                ordinal = a_date.toordinal()
+                anchor_date = common_date_utils.get_week_anchor_date(a_date, firstweekday)
+                self.assertEqual(
+                    table.get_week_start(ordinal),
+                    common_date_utils.get_weekly_start_date(a_date, firstweekday).toordinal(),
+                )
+                self.assertEqual(table.get_anchor_month(ordinal), (anchor_date.year, anchor_date.month))
+                self.assertEqual(
+                    table.get_week_index_of_month(ordinal),
+                    (a_date - common_date_utils.get_start_weekly_of_monthly(
+                        a_date,
+                        firstweekday=firstweekday,
+                    )).days // 7,
+                )
+                self.assertEqual(
+                    table.get_week_index_of_year(ordinal),
+                    (a_date - common_date_utils.get_start_weekly_of_yearly(
+                        a_date,
+                        firstweekday=firstweekday,
+                    )).days // 7,
+                )
+                a_date += datetime.timedelta(days=1)
+
+    def test_weeks_of_month_and_year(self):
+        table = CalendarTable(0, 2019, 2021)
+        self.assertEqual(table.get_weeks_of_year(2020), 53)
+        self.assertEqual(table.get_weeks_of_year(2021), 52)
+        # ISO weeks of January 2020 start from 2019-12-30
+        self.assertEqual(
+            table.get_start_weekly_of_month(2020 * 12),
+            datetime.date(2019, 12, 30).toordinal(),
+        )
+        self.assertEqual(table.get_weeks_of_month(2020 * 12), 5)
+        self.assertEqual(table.get_weeks_of_month(2020 * 12 + 1), 4)
+
+    def test_out_of_window(self):
+        table = CalendarTable(6, 2019, 2021)
+        self.assertIsNone(table.get_week_start(datetime.date(2018, 12, 31).toordinal()))
+        self.assertIsNone(table.get_anchor_month(datetime.date(2022, 1, 1).toordinal()))
+        self.assertIsNone(table.get_week_index_of_month(datetime.date(2022, 1, 1).toordinal()))
+        self.assertIsNone(table.get_week_index_of_year(datetime.date(2022, 1, 1).toordinal()))
+        self.assertIsNone(table.get_start_weekly_of_month(2023 * 12))
+        self.assertIsNone(table.get_weeks_of_year(2022))
+
+    def test_invalid_year_window(self):
+        with self.assertRaises(ValueError):
+            CalendarTable(0, 2021, 2019)
+        with self.assertRaises(ValueError):
+            CalendarTable(0, datetime.MINYEAR, 2019)
+
+
+class YearWindowTestCase(TestCase):
+
+    def tearDown(self):
+        calendar_table.set_year_window(
+            calendar_table.DEFAULT_MIN_YEAR,
+            calendar_table.DEFAULT_MAX_YEAR,
+        )
+
+    def test_set_year_window(self):
+        calendar_table.set_year_window(2000, 2001)
+        self.assertEqual(calendar_table.get_year_window(), (2000, 2001))
+        table = calendar_table.get_calendar_table(13)
+        self.assertEqual(table.firstweekday, 6)
+        self.assertEqual((table.min_year, table.max_year), (2000, 2001))
+        self.assertIs(calendar_table.get_calendar_table(6), table)
+
+    def test_date_utils_out_of_window(self):
+        calendar_table.set_year_window(2000, 2001)
+        a_date = datetime.date(2024, 12, 30)
+        self.assertEqual(common_date_utils.get_weekly_index_of_yearly(a_date, firstweekday=6), 0)
+        self.assertEqual(common_date_utils.get_weekly_index_of_monthly(a_date, firstweekday=6), 0)
+        self.assertEqual(
+            common_date_utils.get_weekly_with_index_in_yearly(a_date, 51, firstweekday=0),
+            datetime.date(2025, 12, 22),
+        )
+        with self.assertRaises(ValueError):
+            common_date_utils.get_weekly_with_index_in_monthly(a_date, 5, firstweekday=0)
+        self.assertEqual(
+            common_date_utils.get_compared_start_weekly_located_yearly(a_date, -1, firstweekday=0),
+            datetime.date(2024, 1, 1),
+        )
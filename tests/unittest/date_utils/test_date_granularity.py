@@ -1,6 +1,7 @@
 import datetime
 from unittest import TestCase
 
+from deloreans.date_utils import VALID_GRAINS_COMB, OffsetGranularity
 from deloreans.date_utils.date_granularity import DateGranularity
 
 
@@ -192,6 +193,13 @@ class DateGranularityWeeklyTestCase(TestCase):
             datetime.date(2024, 8, 10),
         )
 
+    def test_get_end_date_trusted(self):
+        # validation is skipped, even though start date is not the start of week
+        self.assertEqual(
+            self.granularity.get_end_date(datetime.date(2024, 6, 24), 1, 6, trusted=True),
+            datetime.date(2024, 6, 30),
+        )
+
 
 class DateGranularityMonthlyTestCase(TestCase):
 
@@ -322,3 +330,11 @@ class DateGranularityYearlyTestCase(TestCase):
         date_range_length = 0
         with self.assertRaises(ValueError):
             self.granularity.get_end_date(start_date, date_range_length)
+
+
+class ValidGrainsCombTestCase(TestCase):
+
+    def test_each_date_granularity_registered(self):
+        self.assertEqual(set(VALID_GRAINS_COMB), set(DateGranularity))
+        for date_granularity, offset_granularities in VALID_GRAINS_COMB.items():
+            self.assertIn(OffsetGranularity.PERIODIC, offset_granularities)
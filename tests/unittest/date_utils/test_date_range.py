@@ -1,4 +1,6 @@
+import copy
 import datetime
+import pickle
 from unittest import TestCase
 
 from deloreans.date_utils import (
@@ -109,3 +111,50 @@ class DateRangeTestCase(TestCase):
                 date_granularity,
                 firstweekday,
             )
+
+    def test_length(self):
+        date_range = DateRange(
+            datetime.date(2024, 2, 11),
+            datetime.date(2024, 2, 24),
+            DateGranularity.WEEKLY,
+            6,
+        )
+        self.assertEqual(date_range.length, 2)
+
+    def test_immutable(self):
+        date_range = DateRange(datetime.date(2024, 6, 10), datetime.date(2024, 6, 10), DateGranularity.DAILY)
+        with self.assertRaises(AttributeError):
+            date_range._start_date = datetime.date(2024, 6, 11)
+        with self.assertRaises(AttributeError):
+            date_range.end_date = datetime.date(2024, 6, 11)  # NOQA
+
+    def test_pickle_and_copy(self):
+        date_range = DateRange(datetime.date(2024, 2, 11), datetime.date(2024, 2, 24), DateGranularity.WEEKLY, 6)
+        for restored in (
+            pickle.loads(pickle.dumps(date_range)),
+            copy.copy(date_range),
+            copy.deepcopy(date_range),
+        ):
+            self.assertEqual(restored, date_range)
+            self.assertEqual(restored.firstweekday, 6)
+            self.assertEqual(restored.length, 2)
+            with self.assertRaises(AttributeError):
+                restored._start_date = datetime.date(2024, 2, 4)
+
+    def test_hashable(self):
+        date_range = DateRange(datetime.date(2024, 6, 1), datetime.date(2024, 6, 30), DateGranularity.MONTHLY)
+        same_date_range = DateRange(datetime.date(2024, 6, 1), datetime.date(2024, 6, 30), DateGranularity.MONTHLY)
+        other_date_range = DateRange(datetime.date(2024, 6, 1), datetime.date(2024, 6, 30), DateGranularity.DAILY)
+        self.assertEqual(date_range, same_date_range)
+        self.assertNotEqual(date_range, other_date_range)
+        self.assertEqual(len({date_range, same_date_range, other_date_range}), 2)
+
+    def test_trusted(self):
+        # incomplete weeks are not validated when trusted
+        date_range = DateRange(
+            datetime.date(2024, 2, 11),
+            datetime.date(2024, 2, 24),
+            DateGranularity.WEEKLY,
+            trusted=True,
+        )
+        self.assertEqual(date_range.start_date, datetime.date(2024, 2, 11))
@@ -1,3 +1,5 @@
+import copy
+import pickle
 from unittest import TestCase
 
 from deloreans.date_utils.offset_granularity import DatePeriodOffset, OffsetGranularity
@@ -32,3 +34,29 @@ class DatePeriodOffsetTestCase(TestCase):
 
         with self.assertRaises(TypeError):
             DatePeriodOffset(sample_offset, sample_offset_granularity)  # NOQA
+
+    def test_immutable(self):
+        date_period_offset = DatePeriodOffset(1, OffsetGranularity.DAILY)
+        with self.assertRaises(AttributeError):
+            date_period_offset._offset = 2
+
+    def test_pickle_and_copy(self):
+        date_period_offset = DatePeriodOffset(-3, OffsetGranularity.YEARLY)
+        for restored in (
+            pickle.loads(pickle.dumps(date_period_offset)),
+            copy.copy(date_period_offset),
+            copy.deepcopy(date_period_offset),
+        ):
+            self.assertEqual(restored, date_period_offset)
+            with self.assertRaises(AttributeError):
+                restored._offset = 2
+
+    def test_hashable(self):
+        date_period_offset = DatePeriodOffset(1, OffsetGranularity.DAILY)
+        self.assertEqual(date_period_offset, DatePeriodOffset(1, OffsetGranularity.DAILY))
+        self.assertNotEqual(date_period_offset, DatePeriodOffset(1, OffsetGranularity.WEEKLY))
+        self.assertEqual(len({date_period_offset, DatePeriodOffset(1, OffsetGranularity.DAILY)}), 1)
+
+    def test_trusted(self):
+        date_period_offset = DatePeriodOffset('1', OffsetGranularity.DAILY, trusted=True)  # NOQA
+        self.assertEqual(date_period_offset.offset, '1')
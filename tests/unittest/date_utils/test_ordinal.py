@@ -0,0 +1,155 @@
+import datetime
+import itertools
+from unittest import TestCase
+
+import deloreans.date_utils.common as common_date_utils
+import deloreans.date_utils.ordinal as ordinal_date_utils
+from deloreans.date_utils.ordinal import (
+    get_days_of_month,
+    get_days_of_year,
+    get_month_serial,
+    get_month_start,
+    get_ordinal,
+    get_start_weekly_of_month,
+    get_weeks_of_month,
+    get_weeks_of_year,
+    get_year_month_day,
+    to_date,
+)
+
+
+GRAINS = ('daily', 'weekly', 'monthly', 'yearly')
+
+
+def _call(func, *args, **kwargs):
+    try:
+        result = func(*args, **kwargs)
+    except (ValueError, OverflowError):
+        # date arithmetic overflows when the invalid index is large
+        return ValueError
+    if isinstance(result, datetime.date):
+        return result.toordinal()
+    return result
+
+
+class CivilConversionTestCase(TestCase):
+
+    def test_get_ordinal(self):
+        self.assertEqual(get_ordinal(1), 1)
+        self.assertEqual(get_ordinal(2024, 2, 29), datetime.date(2024, 2, 29).toordinal())
+        self.assertEqual(get_ordinal(9999, 12, 31), datetime.date.max.toordinal())
+
+    def test_get_ordinal_out_of_range(self):
+        with self.assertRaises(ValueError):
+            get_ordinal(0)
+        with self.assertRaises(ValueError):
+            get_ordinal(10000)
+        with self.assertRaises(ValueError):
+            get_ordinal(2024, 13)
+
+    def test_get_year_month_day(self):
+        a_date = datetime.date(1, 1, 1)
+        while a_date < datetime.date(2401, 3, 1):
+            self.assertEqual(
+                get_year_month_day(a_date.toordinal()),
+                (a_date.year, a_date.month, a_date.day),
+            )
+            a_date += datetime.timedelta(days=13)
+        self.assertEqual(get_year_month_day(datetime.date.max.toordinal()), (9999, 12, 31))
+
+    def test_month_serial(self):
+        ordinal = datetime.date(2024, 6, 20).toordinal()
+        self.assertEqual(get_month_serial(ordinal), 2024 * 12 + 5)
+        self.assertEqual(to_date(get_month_start(2024 * 12 + 5)), datetime.date(2024, 6, 1))
+        # month rollover
+        self.assertEqual(to_date(get_month_start(2024 * 12 + 12)), datetime.date(2025, 1, 1))
+        self.assertEqual(to_date(get_month_start(2024 * 12 - 1)), datetime.date(2023, 12, 1))
+
+    def test_capacity(self):
+        self.assertEqual(get_days_of_month(2024, 2), 29)
+        self.assertEqual(get_days_of_month(1900, 2), 28)
+        self.assertEqual(get_days_of_month(2000, 2), 29)
+        self.assertEqual(get_days_of_month(2024, 4), 30)
+        self.assertEqual(get_days_of_year(2024), 366)
+        self.assertEqual(get_days_of_year(2100), 365)
+
+
+class WeekTestCase(TestCase):
+
+    def test_get_start_weekly_of_month(self):
+        self.assertEqual(to_date(get_start_weekly_of_month(2024 * 12)), datetime.date(2024, 1, 1))
+        self.assertEqual(to_date(get_start_weekly_of_month(2021 * 12)), datetime.date(2021, 1, 4))
+        self.assertEqual(
+            to_date(get_start_weekly_of_month(2024 * 12 + 5, firstweekday=6)),
+            datetime.date(2024, 6, 2),
+        )
+
+    def test_get_start_weekly_of_month_out_of_calendar_table(self):
+        self.assertEqual(to_date(get_start_weekly_of_month(2400 * 12)), datetime.date(2400, 1, 3))
+
+    def test_weeks(self):
+        self.assertEqual(get_weeks_of_year(2020), 53)
+        self.assertEqual(get_weeks_of_year(2021), 52)
+        self.assertEqual(get_weeks_of_year(2404), 53)
+        self.assertEqual(get_weeks_of_month(2024 * 12 + 4), 5)
+        self.assertEqual(get_weeks_of_month(2404 * 12 + 1), 4)
+
+
+class ConsistencyTestCase(TestCase):
+    """
+    each date utility of ordinal kernel is consistent with the one in 'deloreans.date_utils.common'
+    """
+
+    def _assert_consistent(self, a_date, firstweekday):
+        ordinal = a_date.toordinal()
+        kwargs = {'firstweekday': firstweekday}
+        for date_grain, located_grain in itertools.combinations_with_replacement(GRAINS, 2):
+            func_name = f'get_{date_grain}_index_of_{located_grain}'
+            self.assertEqual(
+                _call(getattr(ordinal_date_utils, func_name), ordinal, **kwargs),
+                _call(getattr(common_date_utils, func_name), a_date, **kwargs),
+                (func_name, a_date, firstweekday),
+            )
+            for offset in (-13, -1, 2):
+                func_name = f'get_compared_start_{date_grain}_located_{located_grain}'
+                self.assertEqual(
+                    _call(getattr(ordinal_date_utils, func_name), ordinal, offset, **kwargs),
+                    _call(getattr(common_date_utils, func_name), a_date, offset, **kwargs),
+                    (func_name, a_date, offset, firstweekday),
+                )
+            for index in (-1, 0, 4, 11, 12, 28, 30, 31, 51, 52, 53, 365):
+                func_name = f'get_{date_grain}_with_index_in_{located_grain}'
+                self.assertEqual(
+                    _call(getattr(ordinal_date_utils, func_name), ordinal, index, **kwargs),
+                    _call(getattr(common_date_utils, func_name), a_date, index, **kwargs),
+                    (func_name, a_date, index, firstweekday),
+                )
+
+    def test_consistent_in_calendar_table(self):
+        a_date = datetime.date(2019, 12, 1)
+        while a_date < datetime.date(2021, 2, 1):
+            for firstweekday in (0, 3, 6):
+                self._assert_consistent(a_date, firstweekday)
+            a_date += datetime.timedelta(days=3)
+
+    def test_consistent_out_of_calendar_table(self):
+        for a_date in (
+            datetime.date(20, 6, 15),
+            datetime.date(1899, 12, 31),
+            datetime.date(2100, 1, 1),
+            datetime.date(2404, 12, 31),
+            datetime.date(9998, 6, 15),
+        ):
+            for firstweekday in range(7):
+                self._assert_consistent(a_date, firstweekday)
+
+    def test_get_start(self):
+        a_date = datetime.date(2024, 12, 30)
+        for date_grain, located_grain in itertools.combinations_with_replacement(GRAINS, 2):
+            func_name = f'get_start_{date_grain}_of_{located_grain}'
+            kwargs = {'firstweekday': 6} if 'weekly' in (date_grain, located_grain) else {}
+            self.assertEqual(
+                getattr(ordinal_date_utils, func_name)(a_date.toordinal(), **kwargs),
+                getattr(common_date_utils, func_name)(a_date, **kwargs).toordinal(),
+                func_name,
+            )
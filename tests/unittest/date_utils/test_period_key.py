@@ -0,0 +1,81 @@
+import datetime
+from unittest import TestCase, skipIf
+
+from deloreans.date_utils import DateGranularity
+from deloreans.date_utils.period_key import from_key, from_keys, to_key, to_keys
+import deloreans.date_utils.common as common_date_utils
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+
+def get_period_start_date(granularity, a_date, firstweekday):
+    if granularity == DateGranularity.DAILY:
+        return a_date
+    if granularity == DateGranularity.WEEKLY:
+        return common_date_utils.get_weekly_start_date(a_date, firstweekday)
+    if granularity == DateGranularity.MONTHLY:
+        return a_date.replace(day=1)
+    return a_date.replace(month=1, day=1)
+
+
+class PeriodKeyTestCase(TestCase):
+
+    def test_keys(self):
+        a_date = datetime.date(2024, 6, 15)
+        self.assertEqual(to_key(DateGranularity.DAILY, datetime.date(1970, 1, 1)), 0)
+        self.assertEqual(to_key(DateGranularity.DAILY, a_date), 19889)
+        # 1970-01-01 is Thursday, which is in the week 0 unless week starts from Friday, Saturday or Sunday
+        self.assertEqual(to_key(DateGranularity.WEEKLY, datetime.date(1970, 1, 1)), 0)
+        self.assertEqual(to_key(DateGranularity.WEEKLY, datetime.date(1970, 1, 1), 4), -1)
+        self.assertEqual(to_key(DateGranularity.MONTHLY, a_date), 2024 * 12 + 5)
+        self.assertEqual(to_key(DateGranularity.YEARLY, a_date), 2024)
+
+    def test_round_trip(self):
+        for granularity in DateGranularity:
+            for firstweekday in range(7):
+                a_date = datetime.date(1999, 12, 20)
+                previous_key = None
+                while a_date < datetime.date(2001, 3, 10):
+                    key = to_key(granularity, a_date, firstweekday)
+                    start_date = from_key(granularity, key, firstweekday)
+                    self.assertEqual(start_date, get_period_start_date(granularity, a_date, firstweekday))
+                    self.assertEqual(to_key(granularity, start_date, firstweekday), key)
+                    # keys of consecutive periods are consecutive
+                    if previous_key is not None:
+                        self.assertIn(key - previous_key, (0, 1))
+                    previous_key = key
+                    a_date += datetime.timedelta(days=1)
+
+    def test_date_range_length_and_end_date_by_keys(self):
+        start_date = datetime.date(2023, 12, 31)
+        self.assertEqual(DateGranularity.WEEKLY.to_key(start_date, 6) + 9, DateGranularity.WEEKLY.to_key(
+            DateGranularity.WEEKLY.get_end_date(start_date, 10, 6),
+            6,
+        ))
+        self.assertEqual(
+            DateGranularity.MONTHLY.get_date_range_length(datetime.date(2023, 11, 1), datetime.date(2024, 2, 29)),
+            DateGranularity.MONTHLY.to_key(datetime.date(2024, 2, 29))
+            - DateGranularity.MONTHLY.to_key(datetime.date(2023, 11, 1))
+            + 1,
+        )
+
+
+@skipIf(np is None, 'NumPy is not installed')
+class PeriodKeysTestCase(TestCase):
+
+    def test_consistent_with_scalar(self):
+        dates = np.arange('1999-12-20', '2001-03-10', dtype='datetime64[D]')
+        for granularity in DateGranularity:
+            for firstweekday in (0, 3, 6):
+                keys = to_keys(granularity, dates, firstweekday)
+                self.assertEqual(
+                    keys.tolist(),
+                    [to_key(granularity, a_date, firstweekday) for a_date in dates.tolist()],
+                )
+                self.assertEqual(
+                    from_keys(granularity, keys, firstweekday).tolist(),
+                    [from_key(granularity, int(key), firstweekday) for key in keys],
+                )
@@ -0,0 +1,142 @@
+import datetime
+from unittest import TestCase
+
+import deloreans
+from deloreans.date_utils import DateGranularity, DateRange, PeriodSequence
+import deloreans.date_utils.common as common_date_utils
+
+
+class PeriodSequenceTestCase(TestCase):
+
+    def test_daily(self):
+        periods = PeriodSequence(datetime.date(2020, 1, 1), datetime.date(2024, 12, 31), DateGranularity.DAILY)
+        self.assertEqual(len(periods), 1827)
+        self.assertEqual(periods[0], datetime.date(2020, 1, 1))
+        self.assertEqual(periods[-1], datetime.date(2024, 12, 31))
+        self.assertEqual(periods[59], datetime.date(2020, 2, 29))
+        self.assertEqual(
+            list(periods),
+            [datetime.date(2020, 1, 1) + datetime.timedelta(days=days) for days in range(1827)],
+        )
+
+    def test_weekly_consistent_with_week_of_month(self):
+        for firstweekday in range(7):
+            for year in (2020, 2024, 2025):
+                for month in range(1, 13):
+                    month_start = datetime.date(year, month, 1)
+                    month_end = DateGranularity.MONTHLY.get_end_date(month_start, 1)
+                    periods = PeriodSequence(month_start, month_end, DateGranularity.WEEKLY, firstweekday)
+                    first_week_start = common_date_utils.get_start_weekly_of_month(year, month, firstweekday)
+                    next_first_week_start = common_date_utils.get_start_weekly_of_month(
+                        year + month // 12,
+                        month % 12 + 1,
+                        firstweekday,
+                    )
+                    self.assertEqual(periods[0], first_week_start)
+                    self.assertEqual(len(periods), (next_first_week_start - first_week_start).days // 7)
+                    for week_start in periods:
+                        self.assertEqual(
+                            common_date_utils.get_start_weekly_of_monthly(week_start, firstweekday=firstweekday),
+                            first_week_start,
+                        )
+
+    def test_weekly_of_weekly_range(self):
+        start_date = datetime.date(2024, 2, 11)
+        end_date = DateGranularity.WEEKLY.get_end_date(start_date, 3, 6)
+        periods = PeriodSequence(start_date, end_date, DateGranularity.WEEKLY, 6, bounds=True)
+        self.assertEqual(
+            list(periods),
+            [
+                (datetime.date(2024, 2, 11), datetime.date(2024, 2, 17)),
+                (datetime.date(2024, 2, 18), datetime.date(2024, 2, 24)),
+                (datetime.date(2024, 2, 25), datetime.date(2024, 3, 2)),
+            ],
+        )
+
+    def test_monthly_and_yearly(self):
+        periods = PeriodSequence(
+            datetime.date(2023, 11, 15),
+            datetime.date(2024, 3, 1),
+            DateGranularity.MONTHLY,
+            bounds=True,
+        )
+        self.assertEqual(
+            list(periods),
+            [
+                (datetime.date(2023, 12, 1), datetime.date(2023, 12, 31)),
+                (datetime.date(2024, 1, 1), datetime.date(2024, 1, 31)),
+                (datetime.date(2024, 2, 1), datetime.date(2024, 2, 29)),
+                (datetime.date(2024, 3, 1), datetime.date(2024, 3, 31)),
+            ],
+        )
+        periods = PeriodSequence(datetime.date(2020, 1, 1), datetime.date(2024, 12, 31), DateGranularity.YEARLY)
+        self.assertEqual(list(periods), [datetime.date(year, 1, 1) for year in range(2020, 2025)])
+
+    def test_bounds_of_last_periods_in_calendar(self):
+        expected = {
+            DateGranularity.DAILY: (datetime.date(9999, 12, 31), datetime.date(9999, 12, 31)),
+            DateGranularity.WEEKLY: (datetime.date(9999, 12, 27), datetime.date(9999, 12, 31)),
+            DateGranularity.MONTHLY: (datetime.date(9999, 12, 1), datetime.date(9999, 12, 31)),
+            DateGranularity.YEARLY: (datetime.date(9999, 1, 1), datetime.date(9999, 12, 31)),
+        }
+        for granularity, last_period in expected.items():
+            periods = PeriodSequence(datetime.date(9999, 1, 1), datetime.date.max, granularity, bounds=True)
+            self.assertEqual(periods[-1], last_period)
+            self.assertEqual(list(reversed(periods))[0], last_period)
+
+    def test_first_week_in_calendar(self):
+        # 0001-01-01 is Monday, then the first week starting on Sunday starts one day before the calendar
+        periods = PeriodSequence(datetime.date.min, datetime.date(1, 1, 31), DateGranularity.WEEKLY, 6)
+        self.assertEqual(len(periods), 5)
+        self.assertEqual(periods[0], datetime.date.min)
+        self.assertEqual(list(periods)[1:], [datetime.date(1, 1, 7) + datetime.timedelta(weeks=i) for i in range(4)])
+        bounded_periods = PeriodSequence(datetime.date.min, datetime.date(1, 1, 31), DateGranularity.WEEKLY, 6, True)
+        self.assertEqual(bounded_periods[0], (datetime.date.min, datetime.date(1, 1, 6)))
+        self.assertEqual(list(reversed(bounded_periods))[-1], (datetime.date.min, datetime.date(1, 1, 6)))
+
+    def test_empty(self):
+        periods = PeriodSequence(datetime.date(2024, 6, 2), datetime.date(2024, 6, 30), DateGranularity.MONTHLY)
+        self.assertEqual(len(periods), 0)
+        self.assertEqual(list(periods), [])
+        with self.assertRaises(IndexError):
+            periods[0]
+
+    def test_slice(self):
+        periods = PeriodSequence(datetime.date(1, 1, 1), datetime.date(9999, 12, 31), DateGranularity.DAILY)
+        self.assertEqual(len(periods), 3652059)
+        sliced = periods[-10::3]
+        self.assertIsInstance(sliced, PeriodSequence)
+        self.assertEqual(
+            list(sliced),
+            [datetime.date(9999, 12, 22), datetime.date(9999, 12, 25), datetime.date(9999, 12, 28),
+             datetime.date(9999, 12, 31)],
+        )
+        self.assertEqual(list(reversed(periods[:3])), [datetime.date(1, 1, day) for day in (3, 2, 1)])
+
+    def test_invalid_parameters(self):
+        start_date, end_date = datetime.date(2024, 6, 1), datetime.date(2024, 6, 30)
+        with self.assertRaises(ValueError):
+            PeriodSequence(end_date, start_date, DateGranularity.DAILY)
+        with self.assertRaises(ValueError):
+            PeriodSequence('2024-06-01', end_date, DateGranularity.DAILY)
+        with self.assertRaises(ValueError):
+            PeriodSequence(start_date, end_date, 'daily')
+        with self.assertRaises(ValueError):
+            PeriodSequence(start_date, end_date, DateGranularity.WEEKLY, 7)
+        with self.assertRaises(TypeError):
+            PeriodSequence(start_date, end_date, DateGranularity.WEEKLY, '0')
+
+    def test_compared_date_range(self):
+        compared_start_date, compared_end_date = deloreans.get(
+            datetime.date(2024, 4, 1),
+            datetime.date(2024, 6, 30),
+            DateGranularity.MONTHLY,
+            -1,
+            deloreans.OffsetGranularity.YEARLY,
+        )
+        periods = deloreans.iter_periods(compared_start_date, compared_end_date, DateGranularity.MONTHLY)
+        self.assertEqual(list(periods), [datetime.date(2023, month, 1) for month in (4, 5, 6)])
+
+        date_range = DateRange(compared_start_date, compared_end_date, DateGranularity.MONTHLY)
+        self.assertEqual(list(date_range.iter_periods()), list(periods))
+        self.assertEqual(len(date_range.iter_periods(DateGranularity.DAILY)), 91)
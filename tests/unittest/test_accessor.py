@@ -0,0 +1,211 @@
+import datetime
+from unittest import TestCase, skipIf
+
+from deloreans import DateGranularity, OffsetGranularity
+
+try:
+    import numpy as np
+    import pandas as pd
+    import deloreans.accessor  # NOQA
+except ImportError:  # pragma: no cover
+    pd = None
+
+# columns of non-nanosecond units are supported by pandas 2.0 or above
+NON_NANO_SUPPORTED = pd is not None and int(pd.__version__.split('.')[0]) >= 2
+
+
+@skipIf(pd is None, 'pandas is not installed')
+class DataFrameAccessorTestCase(TestCase):
+
+    def setUp(self):
+        self.df = pd.DataFrame({
+            'start_date': pd.to_datetime(['2024-06-01', None, '2024-02-01']),
+            'end_date': pd.to_datetime(['2024-06-30', '2024-03-31', '2024-02-29']),
+        }, index=['a', 'b', 'c'])
+
+    def test_compare(self):
+        compared = self.df.deloreans.compare(
+            'start_date',
+            'end_date',
+            DateGranularity.MONTHLY,
+            -1,
+            OffsetGranularity.YEARLY,
+        )
+        self.assertEqual(list(compared.index), ['a', 'b', 'c'])
+        self.assertEqual(
+            compared.loc['a'].tolist(),
+            [pd.Timestamp(2023, 6, 1), pd.Timestamp(2023, 6, 30)],
+        )
+        self.assertTrue(compared.loc['b'].isna().all())
+        self.assertEqual(
+            compared.loc['c'].tolist(),
+            [pd.Timestamp(2023, 2, 1), pd.Timestamp(2023, 2, 28)],
+        )
+
+    def test_compare_with_incomplete_date_range(self):
+        self.df.loc['a', 'end_date'] = pd.Timestamp(2024, 6, 29)
+        with self.assertRaises(ValueError):
+            self.df.deloreans.compare(
+                'start_date',
+                'end_date',
+                DateGranularity.MONTHLY,
+                -1,
+                OffsetGranularity.YEARLY,
+            )
+
+    def test_compare_without_compared_date_range(self):
+        df = pd.DataFrame({
+            'start_date': pd.to_datetime(['2024-12-31', '2024-12-30']),
+            'end_date': pd.to_datetime(['2024-12-31', '2024-12-30']),
+        })
+        with self.assertRaises(ValueError):
+            df.deloreans.compare('start_date', 'end_date', DateGranularity.DAILY, -1, OffsetGranularity.YEARLY)
+
+        compared = df.deloreans.compare(
+            'start_date',
+            'end_date',
+            DateGranularity.DAILY,
+            -1,
+            OffsetGranularity.YEARLY,
+            errors='coerce',
+        )
+        self.assertTrue(compared.iloc[0].isna().all())
+        self.assertEqual(compared.iloc[1].tolist(), [pd.Timestamp(2023, 12, 31), pd.Timestamp(2023, 12, 31)])
+
+    def test_compare_with_period_columns(self):
+        df = pd.DataFrame({
+            'start_month': pd.PeriodIndex(['2024-04', '2024-01'], freq='M'),
+            'end_month': pd.PeriodIndex(['2024-06', '2024-01'], freq='M'),
+        })
+        compared = df.deloreans.compare(
+            'start_month',
+            'end_month',
+            DateGranularity.MONTHLY,
+            -1,
+            OffsetGranularity.PERIODIC,
+        )
+        self.assertEqual(
+            compared['compared_start_date'].tolist(),
+            [pd.Period('2024-01', freq='M'), pd.Period('2023-12', freq='M')],
+        )
+        self.assertEqual(
+            compared['compared_end_date'].tolist(),
+            [pd.Period('2024-03', freq='M'), pd.Period('2023-12', freq='M')],
+        )
+
+    @skipIf(not NON_NANO_SUPPORTED, 'non-nanosecond unit is not supported')
+    def test_compare_with_second_unit_columns(self):
+        # 1500-01-01 is out of the bounds of nanoseconds
+        df = pd.DataFrame({
+            'start_date': np.array(['1500-01-01', '2024-02-01'], dtype='datetime64[s]'),
+            'end_date': np.array(['1500-01-31', '2024-02-29'], dtype='datetime64[s]'),
+        })
+        compared = df.deloreans.compare('start_date', 'end_date', DateGranularity.MONTHLY, -1, OffsetGranularity.YEARLY)
+        self.assertEqual(compared.dtypes.tolist(), [np.dtype('datetime64[s]')] * 2)
+        self.assertEqual(
+            compared.iloc[0].tolist(),
+            [pd.Timestamp(datetime.date(1499, 1, 1)), pd.Timestamp(datetime.date(1499, 1, 31))],
+        )
+        self.assertEqual(
+            compared.iloc[1].tolist(),
+            [pd.Timestamp(datetime.date(2023, 2, 1)), pd.Timestamp(datetime.date(2023, 2, 28))],
+        )
+
+    def test_compare_with_compared_date_out_of_nanosecond_bounds(self):
+        df = pd.DataFrame({
+            'start_date': pd.to_datetime(['2262-01-01']).astype('datetime64[ns]'),
+            'end_date': pd.to_datetime(['2262-01-31']).astype('datetime64[ns]'),
+        })
+        # instead of wrapping silently
+        with self.assertRaises(pd.errors.OutOfBoundsDatetime):
+            df.deloreans.compare('start_date', 'end_date', DateGranularity.MONTHLY, 1, OffsetGranularity.YEARLY)
+
+    def test_compare_with_period_columns_out_of_nanosecond_bounds(self):
+        df = pd.DataFrame({
+            'start_month': pd.PeriodIndex(['1500-01', '2262-06'], freq='M'),
+            'end_month': pd.PeriodIndex(['1500-03', '2262-06'], freq='M'),
+        })
+        compared = df.deloreans.compare(
+            'start_month',
+            'end_month',
+            DateGranularity.MONTHLY,
+            1,
+            OffsetGranularity.YEARLY,
+        )
+        self.assertEqual(compared.iloc[0].tolist(), [pd.Period('1501-01', freq='M'), pd.Period('1501-03', freq='M')])
+        self.assertEqual(compared.iloc[1].tolist(), [pd.Period('2263-06', freq='M')] * 2)
+
+    def test_compare_with_invalid_column_type(self):
+        df = pd.DataFrame({'start_date': ['2024-06-01'], 'end_date': ['2024-06-30']})
+        with self.assertRaises(ValueError):
+            df.deloreans.compare('start_date', 'end_date', DateGranularity.MONTHLY, -1, OffsetGranularity.YEARLY)
+
+
+@skipIf(pd is None, 'pandas is not installed')
+class SeriesAccessorTestCase(TestCase):
+
+    def test_compare_single_periods(self):
+        series = pd.Series(pd.to_datetime(['2023-12-31', None, '2024-02-11']))
+        compared = series.deloreans.compare(
+            DateGranularity.WEEKLY,
+            -9,
+            OffsetGranularity.YEARLY,
+            firstweekday=6,
+        )
+        self.assertEqual(
+            compared.iloc[0].tolist(),
+            [pd.Timestamp(datetime.date(2015, 1, 4)), pd.Timestamp(datetime.date(2015, 1, 10))],
+        )
+        self.assertTrue(compared.iloc[1].isna().all())
+        self.assertEqual(
+            compared.iloc[2].tolist(),
+            [pd.Timestamp(datetime.date(2015, 2, 15)), pd.Timestamp(datetime.date(2015, 2, 21))],
+        )
+
+    def test_compare_with_end(self):
+        series = pd.Series(pd.to_datetime(['2024-01-01']))
+        compared = series.deloreans.compare(
+            DateGranularity.WEEKLY,
+            -9,
+            OffsetGranularity.YEARLY,
+            end=pd.Series(pd.to_datetime(['2024-03-31'])),
+        )
+        self.assertEqual(
+            compared.iloc[0].tolist(),
+            [pd.Timestamp(datetime.date(2014, 12, 29)), pd.Timestamp(datetime.date(2015, 3, 29))],
+        )
+
+    def test_compare_periods(self):
+        series = pd.Series(pd.PeriodIndex(['2024', None], freq='Y'))
+        compared = series.deloreans.compare(DateGranularity.YEARLY, -2, OffsetGranularity.YEARLY)
+        self.assertEqual(compared.iloc[0].tolist(), [pd.Period('2022', freq='Y')] * 2)
+        self.assertTrue(compared.iloc[1].isna().all())
+
+    def test_align(self):
+        series = pd.Series(range(30), index=pd.period_range('2022-01', periods=30, freq='M'), name='revenue')
+        aligned = series.deloreans.align(DateGranularity.MONTHLY, -1, OffsetGranularity.YEARLY)
+        self.assertEqual(aligned.columns.tolist(), ['base', 'compared'])
+        self.assertTrue(aligned.index.equals(series.index))
+        self.assertEqual(aligned['base'].tolist(), list(range(30)))
+        self.assertTrue(aligned['compared'].iloc[:12].isna().all())
+        self.assertEqual(aligned['compared'].iloc[12:].tolist(), list(range(18)))
+
+    def test_align_with_extension_dtype(self):
+        series = pd.Series([1, None, 3], index=pd.period_range('2023-12', periods=3, freq='M'), dtype='Int64')
+        aligned = series.deloreans.align(DateGranularity.MONTHLY, -1, OffsetGranularity.MONTHLY)
+        self.assertEqual(aligned['compared'].dtype, series.dtype)
+        self.assertTrue(aligned['compared'].iloc[[0, 2]].isna().all())
+        self.assertEqual(aligned['compared'].iloc[1], 1)
+
+    def test_align_with_datetime_index(self):
+        series = pd.Series(
+            [1.0, 2.0, 3.0],
+            index=pd.to_datetime(['2024-02-01', '2024-03-01', '2024-03-31']).tz_localize('UTC'),
+        )
+        aligned = series.deloreans.align(DateGranularity.DAILY, -1, OffsetGranularity.MONTHLY)
+        self.assertTrue(aligned['compared'].iloc[[0, 2]].isna().all())
+        self.assertEqual(aligned['compared'].iloc[1], 1.0)
+
+    def test_align_with_invalid_index(self):
+        with self.assertRaises(ValueError):
+            pd.Series([1, 2]).deloreans.align(DateGranularity.DAILY, -1, OffsetGranularity.MONTHLY)
@@ -0,0 +1,110 @@
+import datetime
+from unittest import TestCase
+
+import deloreans
+from deloreans import DateGranularity, OffsetGranularity
+
+
+class GetManyTestCase(TestCase):
+
+    def test_get_many_in_input_order(self):
+        requests = [
+            (
+                datetime.date(2024, 6, 1),
+                datetime.date(2024, 6, 30),
+                DateGranularity.MONTHLY,
+                -1,
+                OffsetGranularity.YEARLY,
+            ),
+            {
+                'start_date': datetime.date(2023, 12, 31),
+                'end_date': datetime.date(2024, 3, 30),
+                'date_granularity': DateGranularity.WEEKLY,
+                'offset': -9,
+                'offset_granularity': OffsetGranularity.YEARLY,
+                'firstweekday': 6,
+            },
+            (
+                datetime.date(2024, 4, 1),
+                datetime.date(2024, 6, 30),
+                DateGranularity.MONTHLY,
+                -1,
+                OffsetGranularity.PERIODIC,
+            ),
+            (
+                datetime.date(2024, 2, 1),
+                datetime.date(2024, 2, 29),
+                DateGranularity.MONTHLY,
+                -2,
+                OffsetGranularity.YEARLY,
+            ),
+        ]
+        expected = [
+            deloreans.get(*request) if isinstance(request, tuple) else deloreans.get(**request)
+            for request in requests
+        ]
+        self.assertEqual(deloreans.get_many(requests), expected)
+        self.assertEqual(deloreans.get_many(iter(requests)), expected)
+
+    def test_get_many_with_empty_requests(self):
+        self.assertEqual(deloreans.get_many([]), [])
+
+    def test_get_many_with_invalid_grain_comb(self):
+        requests = [
+            (
+                datetime.date(2024, 1, 1),
+                datetime.date(2024, 12, 31),
+                DateGranularity.YEARLY,
+                -1,
+                OffsetGranularity.MONTHLY,
+            ),
+        ]
+        with self.assertRaises(ValueError):
+            deloreans.get_many(requests)
+
+    def test_get_many_with_missing_parameters(self):
+        requests = [
+            (
+                datetime.date(2024, 1, 1),
+                datetime.date(2024, 12, 31),
+                DateGranularity.YEARLY,
+            ),
+        ]
+        with self.assertRaises(TypeError):
+            deloreans.get_many(requests)
+
+
+class GetOffsetsTestCase(TestCase):
+
+    def test_get_offsets(self):
+        start_date, end_date = datetime.date(2024, 2, 11), datetime.date(2024, 3, 9)
+        offsets = range(-5, 0)
+        self.assertEqual(
+            deloreans.get_offsets(start_date, end_date, DateGranularity.WEEKLY, offsets, OffsetGranularity.YEARLY, 6),
+            [
+                deloreans.get(start_date, end_date, DateGranularity.WEEKLY, offset, OffsetGranularity.YEARLY, 6)
+                for offset in offsets
+            ],
+        )
+
+    def test_get_offsets_with_empty_offsets(self):
+        self.assertEqual(
+            deloreans.get_offsets(
+                datetime.date(2024, 6, 1),
+                datetime.date(2024, 6, 30),
+                DateGranularity.MONTHLY,
+                [],
+                OffsetGranularity.YEARLY,
+            ),
+            [],
+        )
+
+    def test_get_offsets_with_invalid_grain_comb(self):
+        with self.assertRaises(ValueError):
+            deloreans.get_offsets(
+                datetime.date(2024, 1, 1),
+                datetime.date(2024, 12, 31),
+                DateGranularity.YEARLY,
+                [-1],
+                OffsetGranularity.MONTHLY,
+            )
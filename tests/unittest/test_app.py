@@ -62,3 +62,37 @@ class DeLoreansTestCase(TestCase):
             executor.get(),
             (datetime.date(2023, 12, 10), datetime.date(2023, 12, 23))
         )
+
+    def test_get_periodic_compared_date_range_with_given_firstweekday(self):
+        start_date = datetime.date(2033, 9, 14)
+        end_date = datetime.date(2033, 9, 20)
+        date_granularity = DateGranularity.WEEKLY
+        offset = -1
+        offset_granularity = OffsetGranularity.PERIODIC
+        firstweekday = 2
+        executor = DeLoreans(
+            start_date,
+            end_date,
+            date_granularity,
+            offset,
+            offset_granularity,
+            firstweekday,
+        )
+        self.assertEqual(
+            executor.get(),
+            (datetime.date(2033, 9, 7), datetime.date(2033, 9, 13))
+        )
+
+    def test_get_trusted(self):
+        params = (
+            datetime.date(2024, 2, 11),
+            datetime.date(2024, 2, 24),
+            DateGranularity.WEEKLY,
+            -1,
+            OffsetGranularity.PERIODIC,
+            6,
+        )
+        self.assertEqual(
+            DeLoreans(*params, trusted=True).get(),
+            DeLoreans(*params).get(),
+        )
@@ -0,0 +1,145 @@
+import datetime
+from unittest import TestCase, skipIf
+
+import deloreans
+from deloreans.date_utils import DateGranularity, OffsetGranularity
+
+try:
+    import numpy as np
+    import pyarrow as pa
+    import deloreans.arrow as arrow
+except ImportError:  # pragma: no cover
+    pa = None
+
+
+@skipIf(pa is None, 'pyarrow is not installed')
+class ArrowTestCase(TestCase):
+
+    def setUp(self):
+        self.start_dates = [
+            datetime.date(2024, 6, 1),
+            None,
+            datetime.date(2024, 2, 1),
+            datetime.date(2023, 12, 1),
+            datetime.date(2024, 1, 1),
+        ]
+        self.end_dates = [
+            datetime.date(2024, 6, 30),
+            datetime.date(2024, 6, 30),
+            datetime.date(2024, 2, 29),
+            datetime.date(2024, 2, 29),
+            datetime.date(2024, 1, 31),
+        ]
+        self.start = pa.array(self.start_dates, pa.date32())
+        self.end = pa.array(self.end_dates, pa.date32())
+
+    def _expected(self, date_granularity, offset, offset_granularity):
+        expected = []
+        for start_date, end_date in zip(self.start_dates, self.end_dates):
+            if start_date is None:
+                expected.append((None, None))
+            else:
+                expected.append(deloreans.get(start_date, end_date, date_granularity, offset, offset_granularity))
+        return expected
+
+    def test_compare(self):
+        for offset_granularity in (OffsetGranularity.PERIODIC, OffsetGranularity.MONTHLY, OffsetGranularity.YEARLY):
+            compared_start, compared_end = arrow.compare(
+                self.start,
+                self.end,
+                DateGranularity.MONTHLY,
+                -1,
+                offset_granularity,
+            )
+            self.assertEqual(compared_start.type, pa.date32())
+            self.assertEqual(
+                list(zip(compared_start.to_pylist(), compared_end.to_pylist())),
+                self._expected(DateGranularity.MONTHLY, -1, offset_granularity),
+            )
+
+    def test_zero_copy(self):
+        days, validity, offset = arrow.to_days(self.start)
+        self.assertEqual(days.ctypes.data, self.start.buffers()[1].address)
+        self.assertEqual(validity.address, self.start.buffers()[0].address)
+        self.assertEqual(offset, 0)
+
+        compared_start, compared_end = arrow.compare(
+            self.start,
+            self.end,
+            DateGranularity.MONTHLY,
+            1,
+            OffsetGranularity.YEARLY,
+        )
+        # null bitmap of start dates is kept as it is
+        self.assertEqual(compared_start.buffers()[0].address, self.start.buffers()[0].address)
+        self.assertEqual(compared_start.null_count, 1)
+
+    def test_sliced_arrays(self):
+        compared_start, compared_end = arrow.compare(
+            self.start.slice(1),
+            self.end.slice(1),
+            DateGranularity.MONTHLY,
+            -1,
+            OffsetGranularity.YEARLY,
+        )
+        self.assertEqual(
+            list(zip(compared_start.to_pylist(), compared_end.to_pylist())),
+            self._expected(DateGranularity.MONTHLY, -1, OffsetGranularity.YEARLY)[1:],
+        )
+
+    def test_chunked_arrays(self):
+        compared_start, compared_end = arrow.compare(
+            pa.chunked_array([self.start[:2], self.start[2:]]),
+            pa.chunked_array([self.end[:3], self.end[3:]]),
+            DateGranularity.MONTHLY,
+            -1,
+            OffsetGranularity.YEARLY,
+        )
+        self.assertIsInstance(compared_start, pa.ChunkedArray)
+        self.assertEqual([len(chunk) for chunk in compared_start.chunks], [2, 3])
+        self.assertEqual(
+            list(zip(compared_start.to_pylist(), compared_end.to_pylist())),
+            self._expected(DateGranularity.MONTHLY, -1, OffsetGranularity.YEARLY),
+        )
+
+        # end dates which are not chunked are sliced along chunks of start dates
+        for end in (self.end, np.asarray(self.end.cast(pa.int32()))):
+            compared_start, compared_end = arrow.compare(
+                pa.chunked_array([self.start[:2], self.start[2:]]),
+                end,
+                DateGranularity.MONTHLY,
+                -1,
+                OffsetGranularity.YEARLY,
+            )
+            self.assertEqual([len(chunk) for chunk in compared_end.chunks], [2, 3])
+            self.assertEqual(
+                list(zip(compared_start.to_pylist(), compared_end.to_pylist())),
+                self._expected(DateGranularity.MONTHLY, -1, OffsetGranularity.YEARLY),
+            )
+
+    def test_int32_buffer(self):
+        days = np.array([0, 59], dtype=np.int32)
+        compared_start, compared_end = arrow.compare(
+            days.tobytes(),
+            memoryview(days),
+            DateGranularity.DAILY,
+            -1,
+            OffsetGranularity.YEARLY,
+        )
+        self.assertEqual(compared_start.to_pylist(), [datetime.date(1969, 1, 1), datetime.date(1969, 3, 1)])
+        self.assertEqual(compared_start.null_count, 0)
+
+    def test_errors(self):
+        # the 366th day of leap year 2024 doesn't exist in 2023
+        start = pa.array([datetime.date(2024, 12, 31)], pa.date32())
+        with self.assertRaises(ValueError):
+            arrow.compare(start, start, DateGranularity.DAILY, -1, OffsetGranularity.YEARLY)
+        compared_start, compared_end = arrow.compare(
+            start, start, DateGranularity.DAILY, -1, OffsetGranularity.YEARLY, errors='coerce',
+        )
+        self.assertEqual(compared_start.to_pylist(), [None])
+        self.assertEqual(compared_end.to_pylist(), [None])
+        with self.assertRaises(ValueError):
+            arrow.compare(start, start, DateGranularity.DAILY, -1, OffsetGranularity.YEARLY, errors='ignore')
+        with self.assertRaises(ValueError):
+            arrow.compare(pa.array(['2024-12-31']), start, DateGranularity.DAILY, -1, OffsetGranularity.YEARLY)
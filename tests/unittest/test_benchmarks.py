@@ -0,0 +1,57 @@
+import os
+import tempfile
+from unittest import TestCase
+
+from benchmarks import baseline
+from benchmarks.suite import BenchmarkCase, BenchmarkResult, get_batch, iter_cases, run_case
+from deloreans import DateGranularity, OffsetGranularity
+from deloreans.date_utils import VALID_GRAINS_COMB
+
+
+class SuiteTestCase(TestCase):
+
+    def test_iter_cases(self):
+        cases = list(iter_cases(offsets=(-1,), batch_sizes=(1,), firstweekdays=(0,)))
+        self.assertEqual(len(cases), sum(len(item) for item in VALID_GRAINS_COMB.values()))
+
+        cases = list(iter_cases(combinations=['weekly/yearly']))
+        self.assertTrue(all(case.date_granularity == DateGranularity.WEEKLY for case in cases))
+        self.assertEqual(len(cases), 7 * 3 * 3)
+
+    def test_get_batch(self):
+        case = BenchmarkCase(DateGranularity.DAILY, OffsetGranularity.YEARLY, 6, -1, 400)
+        batch = get_batch(case)
+        self.assertEqual(len(batch), 400)
+        # 2024-12-31 has no compared date in 2023
+        self.assertTrue(all(params[0].timetuple().tm_yday != 366 for params in batch))
+
+    def test_run_case(self):
+        case = BenchmarkCase(DateGranularity.WEEKLY, OffsetGranularity.MONTHLY, 6, -1, 2)
+        result = run_case(case, repeat=1, min_calls=2)
+        self.assertGreater(result.ns_per_call, 0)
+        self.assertGreater(result.peak_bytes_per_call, 0)
+        self.assertEqual(result.case.key, 'weekly/monthly/fw6/offset-1/batch2')
+
+
+class BaselineTestCase(TestCase):
+
+    def setUp(self):
+        self.case = BenchmarkCase(DateGranularity.MONTHLY, OffsetGranularity.YEARLY, 0, -1, 1)
+
+    def test_dump_and_load(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'baseline.json')
+            baseline.dump([BenchmarkResult(self.case, 1000.0, 512)], path)
+            self.assertEqual(baseline.load(path), {self.case.key: 1000.0})
+
+    def test_compare(self):
+        comparisons = baseline.compare(
+            [BenchmarkResult(self.case, 1300.0, 512), BenchmarkResult(self.case._replace(offset=1), 1300.0, 512)],
+            {self.case.key: 1000.0},
+            threshold=0.2,
+        )
+        self.assertAlmostEqual(comparisons[0].change, 0.3)
+        self.assertTrue(comparisons[0].is_regression)
+        # no baseline of new case
+        self.assertIsNone(comparisons[1].change)
+        self.assertFalse(comparisons[1].is_regression)
@@ -0,0 +1,125 @@
+import datetime
+from unittest import TestCase
+
+import deloreans
+from deloreans import DateGranularity, OffsetGranularity
+from deloreans.cache import CacheInfo, ComparisonCache, make_key
+
+
+class ComparisonCacheTestCase(TestCase):
+
+    def setUp(self):
+        self.cache = ComparisonCache(maxsize=2)
+        self.params = (
+            datetime.date(2024, 6, 1),
+            datetime.date(2024, 6, 30),
+            DateGranularity.MONTHLY,
+            -1,
+            OffsetGranularity.YEARLY,
+        )
+
+    def test_hits_and_misses(self):
+        expected = (datetime.date(2023, 6, 1), datetime.date(2023, 6, 30))
+        self.assertEqual(self.cache.get(*self.params), expected)
+        self.assertEqual(self.cache.get(*self.params), expected)
+        self.assertEqual(self.cache.info(), CacheInfo(hits=1, misses=1, evictions=0, maxsize=2, currsize=1))
+
+    def test_canonical_firstweekday(self):
+        self.cache.get(*self.params, 0)
+        self.cache.get(*self.params, 6)
+        self.assertEqual(self.cache.info().hits, 1)
+
+        weekly_params = (
+            datetime.date(2024, 1, 1),
+            datetime.date(2024, 1, 7),
+            DateGranularity.DAILY,
+            -1,
+            OffsetGranularity.WEEKLY,
+        )
+        self.cache.get(*weekly_params, 0)
+        self.cache.get(*weekly_params, 6)
+        self.assertEqual(self.cache.info().hits, 1)
+        self.assertEqual(self.cache.info().misses, 3)
+
+    def test_make_key(self):
+        self.assertEqual(make_key(*self.params, 0), make_key(*self.params, 6))
+        self.assertEqual(make_key(*self.params), make_key(*self.params, 6))
+        weekly_params = (
+            datetime.date(2024, 1, 1),
+            datetime.date(2024, 1, 7),
+            DateGranularity.WEEKLY,
+            -1,
+            OffsetGranularity.YEARLY,
+        )
+        self.assertNotEqual(make_key(*weekly_params, 0), make_key(*weekly_params, 6))
+        # equal but differently typed inputs don't share a key
+        self.assertNotEqual(make_key(*self.params, 0), make_key(*self.params, 0.0))  # NOQA
+
+    def test_lru_eviction(self):
+        other_params = (datetime.date(2024, 5, 1), datetime.date(2024, 5, 31)) + self.params[2:]
+        another_params = (datetime.date(2024, 4, 1), datetime.date(2024, 4, 30)) + self.params[2:]
+        self.cache.get(*self.params)
+        self.cache.get(*other_params)
+        self.cache.get(*self.params)
+        self.cache.get(*another_params)
+        self.assertEqual(self.cache.info().evictions, 1)
+
+        # the least recently used one has been evicted
+        self.cache.get(*self.params)
+        self.assertEqual(self.cache.info().hits, 2)
+        self.cache.get(*other_params)
+        self.assertEqual(self.cache.info().misses, 4)
+
+    def test_negative_entries(self):
+        params = (datetime.date(2024, 6, 1), datetime.date(2024, 6, 29)) + self.params[2:]
+        for _ in range(2):
+            with self.assertRaises(ValueError):
+                self.cache.get(*params)
+        self.assertEqual(self.cache.info(), CacheInfo(hits=1, misses=1, evictions=0, maxsize=2, currsize=1))
+
+    def test_invalid_firstweekday_not_canonicalized(self):
+        self.cache.get(*self.params)
+        with self.assertRaises(TypeError):
+            self.cache.get(*self.params, 0.0)  # NOQA
+
+    def test_unhashable_inputs(self):
+        with self.assertRaises(ValueError):
+            self.cache.get([2024, 6, 1], *self.params[1:])  # NOQA
+        self.assertEqual(self.cache.info().currsize, 0)
+
+    def test_clear(self):
+        self.cache.get(*self.params)
+        self.cache.clear()
+        self.assertEqual(self.cache.info(), CacheInfo(hits=0, misses=0, evictions=0, maxsize=2, currsize=0))
+
+    def test_invalid_maxsize(self):
+        with self.assertRaises(ValueError):
+            ComparisonCache(maxsize=0)
+
+
+class CachedGetTestCase(TestCase):
+
+    def tearDown(self):
+        deloreans.disable_cache()
+
+    def test_cache_disabled(self):
+        self.assertIsNone(deloreans.cache_info())
+
+    def test_cached_get(self):
+        deloreans.enable_cache(maxsize=8)
+        kwargs = {
+            'start_date': datetime.date(2024, 6, 1),
+            'end_date': datetime.date(2024, 6, 30),
+            'date_granularity': DateGranularity.MONTHLY,
+            'offset': -1,
+            'offset_granularity': OffsetGranularity.YEARLY,
+        }
+        for _ in range(3):
+            self.assertEqual(
+                deloreans.get(**kwargs),
+                (datetime.date(2023, 6, 1), datetime.date(2023, 6, 30)),
+            )
+        self.assertEqual(deloreans.cache_info(), CacheInfo(hits=2, misses=1, evictions=0, maxsize=8, currsize=1))
+
+        deloreans.cache_clear()
+        self.assertEqual(deloreans.cache_info().currsize, 0)
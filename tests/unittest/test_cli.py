@@ -0,0 +1,160 @@
+import io
+import json
+import os
+import tempfile
+from contextlib import redirect_stderr
+from unittest import TestCase
+from unittest.mock import patch
+
+from deloreans.cli import main, Transformer
+
+
+CSV_INPUT = (
+    'id,start_date,end_date\n'
+    'a,2024-06-01,2024-06-30\n'
+    'b,2024-02-01,2024-02-29\n'
+    'c,2024-01-01,2024-03-31\n'
+)
+YEAR_OVER_YEAR = ['--date-granularity', 'monthly', '--offset', '-1', '--offset-granularity', 'yearly']
+
+
+class CliTestCase(TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+    def _write(self, name, content):
+        path = os.path.join(self.directory.name, name)
+        with open(path, 'w', newline='') as f:
+            f.write(content)
+        return path
+
+    def _run(self, argv, stdin=''):
+        stdout, stderr = io.StringIO(), io.StringIO()
+        with patch('sys.stdin', io.StringIO(stdin)), patch('sys.stdout', stdout), redirect_stderr(stderr):
+            exit_code = main(argv)
+        return exit_code, stdout.getvalue(), stderr.getvalue()
+
+    def test_csv_file(self):
+        input_path = self._write('exports.csv', CSV_INPUT)
+        output_path = os.path.join(self.directory.name, 'compared.csv')
+        # chunk size smaller than input, so that records are written in several chunks
+        exit_code, _, _ = self._run([input_path, '-o', output_path, '--chunk-size', '2', *YEAR_OVER_YEAR])
+        self.assertEqual(exit_code, 0)
+        with open(output_path) as f:
+            self.assertEqual(
+                f.read(),
+                'id,start_date,end_date,compared_start_date,compared_end_date\n'
+                'a,2024-06-01,2024-06-30,2023-06-01,2023-06-30\n'
+                'b,2024-02-01,2024-02-29,2023-02-01,2023-02-28\n'
+                'c,2024-01-01,2024-03-31,2023-01-01,2023-03-31\n',
+            )
+
+    def test_csv_fields_override_defaults(self):
+        stdin = (
+            'start_date,end_date,date_granularity,offset,offset_granularity,firstweekday\n'
+            '2024-02-11,2024-02-24,weekly,-1,periodic,6\n'
+            '2024-06-01,2024-06-30,,,,\n'
+        )
+        exit_code, stdout, _ = self._run(YEAR_OVER_YEAR, stdin)
+        self.assertEqual(exit_code, 0)
+        self.assertEqual(
+            stdout.splitlines()[1:],
+            [
+                '2024-02-11,2024-02-24,weekly,-1,periodic,6,2024-01-28,2024-02-10',
+                '2024-06-01,2024-06-30,,,,,2023-06-01,2023-06-30',
+            ],
+        )
+
+    def test_jsonl(self):
+        input_path = self._write(
+            'exports.jsonl',
+            json.dumps({'start_date': '2024-06-01', 'end_date': '2024-06-30', 'date_granularity': 'monthly'}) + '\n'
+            '\n'
+            + json.dumps({'start_date': '2024-04-01', 'end_date': '2024-06-30', 'offset_granularity': 'periodic'}),
+        )
+        exit_code, stdout, _ = self._run([input_path, *YEAR_OVER_YEAR])
+        self.assertEqual(exit_code, 0)
+        first, second = [json.loads(line) for line in stdout.splitlines()]
+        self.assertEqual(
+            (first['compared_start_date'], first['compared_end_date']),
+            ('2023-06-01', '2023-06-30'),
+        )
+        self.assertEqual(
+            (second['compared_start_date'], second['compared_end_date']),
+            ('2024-01-01', '2024-03-31'),
+        )
+
+    def test_invalid_record(self):
+        stdin = CSV_INPUT + 'd,2024-02-02,2024-02-29\n'
+        exit_code, stdout, stderr = self._run(YEAR_OVER_YEAR, stdin)
+        self.assertEqual(exit_code, 1)
+        self.assertIn('record 4', stderr)
+
+    def test_skip_invalid_record(self):
+        stdin = 'start_date,end_date\n2024-02-02,2024-02-29\nnot a date,2024-02-29\n2024-06-01,2024-06-30\n'
+        exit_code, stdout, stderr = self._run([*YEAR_OVER_YEAR, '--skip-invalid'], stdin)
+        self.assertEqual(exit_code, 0)
+        self.assertEqual(
+            stdout.splitlines()[1:],
+            [
+                '2024-02-02,2024-02-29,,',
+                'not a date,2024-02-29,,',
+                '2024-06-01,2024-06-30,2023-06-01,2023-06-30',
+            ],
+        )
+        self.assertIn('skipped 2 invalid record(s) of 3', stderr)
+
+    def test_missing_parameter(self):
+        exit_code, _, stderr = self._run([], 'start_date,end_date\n2024-06-01,2024-06-30\n')
+        self.assertEqual(exit_code, 1)
+        self.assertIn('date_granularity', stderr)
+
+    def test_invalid_json(self):
+        exit_code, _, stderr = self._run(['--format', 'jsonl', *YEAR_OVER_YEAR], '[1]\n')
+        self.assertEqual(exit_code, 1)
+        self.assertIn('record 1', stderr)
+
+    def test_skip_invalid_json(self):
+        stdin = (
+            '{"start_date": "2024-06-01", "end_date": "2024-06-30"}\n'
+            '{"start_date": \n'
+            '[1]\n'
+            '{"start_date": "2023-06-01", "end_date": "2023-06-30"}\n'
+        )
+        exit_code, stdout, stderr = self._run(['--format', 'jsonl', *YEAR_OVER_YEAR, '--skip-invalid'], stdin)
+        self.assertEqual(exit_code, 0)
+        lines = stdout.splitlines()
+        self.assertEqual(lines[1:3], ['{"start_date": ', '[1]'])
+        first, last = json.loads(lines[0]), json.loads(lines[3])
+        self.assertEqual((first['compared_start_date'], first['compared_end_date']), ('2023-06-01', '2023-06-30'))
+        self.assertEqual((last['compared_start_date'], last['compared_end_date']), ('2022-06-01', '2022-06-30'))
+        self.assertIn('skipped 2 invalid record(s) of 4', stderr)
+
+    def test_overflowing_record(self):
+        stdin = 'start_date,end_date\n9999-12-31,9999-12-31\n'
+        argv = ['--date-granularity', 'daily', '--offset', '1', '--offset-granularity', 'periodic']
+        exit_code, _, stderr = self._run(argv, stdin)
+        self.assertEqual(exit_code, 1)
+        self.assertIn('record 1', stderr)
+        exit_code, stdout, _ = self._run([*argv, '--skip-invalid'], stdin)
+        self.assertEqual(exit_code, 0)
+        self.assertEqual(stdout.splitlines()[1:], ['9999-12-31,9999-12-31,,'])
+
+    def test_inaccessible_files(self):
+        missing_path = os.path.join(self.directory.name, 'missing.csv')
+        exit_code, _, stderr = self._run([missing_path, *YEAR_OVER_YEAR])
+        self.assertEqual(exit_code, 1)
+        self.assertTrue(stderr.startswith('deloreans: '))
+        self.assertIn('missing.csv', stderr)
+
+        input_path = self._write('exports.csv', CSV_INPUT)
+        unwritable_path = os.path.join(self.directory.name, 'missing', 'compared.csv')
+        exit_code, _, stderr = self._run([input_path, '-o', unwritable_path, *YEAR_OVER_YEAR])
+        self.assertEqual(exit_code, 1)
+        self.assertIn('compared.csv', stderr)
+
+    def test_invalid_chunk_size(self):
+        with self.assertRaises(ValueError):
+            Transformer((None,) * 6, chunk_size=0)
@@ -0,0 +1,287 @@
+import datetime
+from unittest import TestCase
+
+import deloreans
+from deloreans.date_utils import (
+    DateGranularity,
+    OffsetGranularity,
+    PeriodSequence,
+    VALID_GRAINS_COMB,
+)
+from deloreans.inverse import get_base, get_base_ranges, get_covering_offsets
+from deloreans.plan import ComparisonPlan
+
+
+# approximate days of each granularity, to bound offsets of brute-force search
+_DAYS = {
+    'DAILY': 1,
+    'WEEKLY': 7,
+    'MONTHLY': 31,
+    'YEARLY': 366,
+}
+
+SAMPLE_START_DATES = [
+    datetime.date(2024, 2, 29),
+    datetime.date(2023, 12, 31),
+    datetime.date(2021, 1, 1),
+]
+
+SAMPLE_COVERED_DATES = [
+    (datetime.date(2024, 2, 29), datetime.date(2024, 2, 29)),
+    (datetime.date(2020, 12, 28), datetime.date(2021, 1, 10)),
+    (datetime.date(2022, 5, 31), datetime.date(2022, 7, 1)),
+]
+
+
+def _get_sample_date_ranges(date_granularity, firstweekday):
+    for a_date in SAMPLE_START_DATES:
+        periods = PeriodSequence(a_date, a_date + datetime.timedelta(days=1200), date_granularity, firstweekday)
+        for date_range_length in (1, 2):
+            start_date = periods[0]
+            end_date = date_granularity.get_end_date(start_date, date_range_length, firstweekday)
+            yield start_date, end_date
+
+
+class GetBaseTestCase(TestCase):
+
+    def test_inverse_of_get(self):
+        for date_granularity, offset_granularities in VALID_GRAINS_COMB.items():
+            for offset_granularity in offset_granularities:
+                for firstweekday in (0, 6):
+                    for start_date, end_date in _get_sample_date_ranges(date_granularity, firstweekday):
+                        for offset in (-3, -1, 1, 2):
+                            try:
+                                compared_date_range = deloreans.get(
+                                    start_date,
+                                    end_date,
+                                    date_granularity,
+                                    offset,
+                                    offset_granularity,
+                                    firstweekday,
+                                )
+                            except ValueError:
+                                continue
+                            self.assertEqual(
+                                get_base(
+                                    *compared_date_range,
+                                    date_granularity,
+                                    offset,
+                                    offset_granularity,
+                                    firstweekday,
+                                ),
+                                (start_date, end_date),
+                            )
+
+    def test_no_base(self):
+        # no date range is compared with the 366th day of 2024 year-over-year
+        with self.assertRaises(ValueError):
+            get_base(
+                datetime.date(2024, 12, 31),
+                datetime.date(2024, 12, 31),
+                DateGranularity.DAILY,
+                1,
+                OffsetGranularity.YEARLY,
+            )
+
+    def test_invalid_params(self):
+        with self.assertRaises(TypeError):
+            get_base(
+                datetime.date(2024, 6, 1),
+                datetime.date(2024, 6, 30),
+                DateGranularity.MONTHLY,
+                1.0,
+                OffsetGranularity.YEARLY,
+            )
+        with self.assertRaises(ValueError):
+            get_base(
+                datetime.date(2024, 6, 2),
+                datetime.date(2024, 6, 30),
+                DateGranularity.MONTHLY,
+                1,
+                OffsetGranularity.YEARLY,
+            )
+
+
+class GetBaseRangesTestCase(TestCase):
+
+    def test_consistent_with_brute_force(self):
+        for date_granularity, offset_granularities in VALID_GRAINS_COMB.items():
+            for offset_granularity in offset_granularities:
+                for firstweekday in (0, 6):
+                    for date_range_length in (1, 2):
+                        for offset in (-2, 1):
+                            plan = ComparisonPlan(date_granularity, offset, offset_granularity, firstweekday)
+                            if offset_granularity == OffsetGranularity.PERIODIC:
+                                days = _DAYS[date_granularity.name] * date_range_length
+                            else:
+                                days = _DAYS[offset_granularity.name]
+                            span = datetime.timedelta(days=abs(offset) * days + 2 * 366 * date_range_length)
+                            for covered_start_date, covered_end_date in SAMPLE_COVERED_DATES:
+                                expected = []
+                                for start_date in PeriodSequence(
+                                    covered_start_date - span,
+                                    covered_end_date + span,
+                                    date_granularity,
+                                    firstweekday,
+                                ):
+                                    end_date = date_granularity.get_end_date(
+                                        start_date,
+                                        date_range_length,
+                                        firstweekday,
+                                    )
+                                    try:
+                                        compared_start_date, compared_end_date = plan.apply(start_date, end_date)
+                                    except ValueError:
+                                        continue
+                                    if (
+                                        covered_start_date <= compared_end_date
+                                        and compared_start_date <= covered_end_date
+                                    ):
+                                        expected.append((compared_start_date, (start_date, end_date)))
+                                expected.sort()
+                                self.assertEqual(
+                                    get_base_ranges(
+                                        covered_start_date,
+                                        covered_end_date,
+                                        date_granularity,
+                                        offset,
+                                        offset_granularity,
+                                        firstweekday,
+                                        date_range_length,
+                                    ),
+                                    [base_date_range for _, base_date_range in expected],
+                                )
+
+    def test_weeks_of_restated_dates(self):
+        self.assertEqual(
+            deloreans.get_base_ranges(
+                datetime.date(2023, 6, 10),
+                datetime.date(2023, 6, 12),
+                DateGranularity.WEEKLY,
+                -1,
+                OffsetGranularity.YEARLY,
+            ),
+            [
+                (datetime.date(2024, 6, 3), datetime.date(2024, 6, 9)),
+                (datetime.date(2024, 6, 10), datetime.date(2024, 6, 16)),
+            ],
+        )
+
+    def test_invalid_params(self):
+        with self.assertRaises(ValueError):
+            get_base_ranges(
+                datetime.date(2024, 6, 2),
+                datetime.date(2024, 6, 1),
+                DateGranularity.DAILY,
+                -1,
+                OffsetGranularity.YEARLY,
+            )
+        with self.assertRaises(ValueError):
+            get_base_ranges(
+                datetime.date(2024, 6, 1),
+                datetime.date(2024, 6, 1),
+                DateGranularity.DAILY,
+                -1,
+                OffsetGranularity.YEARLY,
+                date_range_length=0,
+            )
+
+
+class GetCoveringOffsetsTestCase(TestCase):
+
+    def test_consistent_with_brute_force(self):
+        for date_granularity, offset_granularities in VALID_GRAINS_COMB.items():
+            for offset_granularity in offset_granularities:
+                for firstweekday in (0, 6):
+                    plan = ComparisonPlan(date_granularity, 0, offset_granularity, firstweekday)
+                    for start_date, end_date in _get_sample_date_ranges(date_granularity, firstweekday):
+                        if offset_granularity == OffsetGranularity.PERIODIC:
+                            days = _DAYS[date_granularity.name] * date_granularity.get_date_range_length(
+                                start_date,
+                                end_date,
+                                firstweekday,
+                            )
+                        else:
+                            days = _DAYS[offset_granularity.name]
+                        offsets = range(-2500 // days, 2500 // days + 1)
+                        compared_date_ranges = plan.apply_offsets(start_date, end_date, offsets, errors='coerce')
+                        for covered_start_date, covered_end_date in SAMPLE_COVERED_DATES:
+                            expected = [
+                                offset
+                                for offset, compared_date_range in zip(offsets, compared_date_ranges)
+                                if compared_date_range is not None
+                                and compared_date_range[0] <= covered_end_date
+                                and compared_date_range[1] >= covered_start_date
+                            ]
+                            self.assertEqual(
+                                get_covering_offsets(
+                                    start_date,
+                                    end_date,
+                                    date_granularity,
+                                    offset_granularity,
+                                    covered_start_date,
+                                    covered_end_date,
+                                    firstweekday,
+                                ),
+                                expected,
+                            )
+
+    def test_covered_date(self):
+        self.assertEqual(
+            deloreans.get_covering_offsets(
+                datetime.date(2024, 6, 1),
+                datetime.date(2024, 6, 30),
+                DateGranularity.MONTHLY,
+                OffsetGranularity.YEARLY,
+                datetime.date(2020, 1, 1),
+                datetime.date(2023, 12, 31),
+            ),
+            [-4, -3, -2, -1],
+        )
+        # the 366th day of 2024 is compared with no day of 2023
+        self.assertEqual(
+            get_covering_offsets(
+                datetime.date(2024, 12, 31),
+                datetime.date(2024, 12, 31),
+                DateGranularity.DAILY,
+                OffsetGranularity.YEARLY,
+                datetime.date(2023, 12, 31),
+            ),
+            [],
+        )
+
+    def test_covered_date_at_calendar_bounds(self):
+        last_day = datetime.date(9999, 12, 31)
+        self.assertEqual(
+            get_covering_offsets(
+                last_day,
+                last_day,
+                DateGranularity.DAILY,
+                OffsetGranularity.PERIODIC,
+                datetime.date(9999, 12, 30),
+                last_day,
+            ),
+            [-1, 0],
+        )
+        # the compared date range of the last month in calendar doesn't exist
+        self.assertEqual(
+            get_covering_offsets(
+                datetime.date(9998, 12, 1),
+                datetime.date(9998, 12, 31),
+                DateGranularity.MONTHLY,
+                OffsetGranularity.YEARLY,
+                datetime.date(9999, 12, 1),
+                last_day,
+            ),
+            [],
+        )
+
+    def test_incomplete_date_range(self):
+        with self.assertRaises(ValueError):
+            get_covering_offsets(
+                datetime.date(2024, 6, 2),
+                datetime.date(2024, 6, 30),
+                DateGranularity.MONTHLY,
+                OffsetGranularity.YEARLY,
+                datetime.date(2023, 6, 1),
+            )
@@ -0,0 +1,63 @@
+import subprocess
+import sys
+import typing
+from unittest import TestCase
+
+import deloreans
+
+
+def _run(script):
+    completed = subprocess.run(
+        [sys.executable, '-c', script],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+        check=True,
+    )
+    return completed.stdout.split()
+
+
+class LazyImportTestCase(TestCase):
+
+    def test_import_without_submodules(self):
+        loaded = _run(
+            'import sys\n'
+            'import deloreans\n'
+            'print(len([name for name in sys.modules if name.startswith("deloreans.")]))\n'
+        )
+        self.assertEqual(loaded, ['0'])
+
+    def test_load_on_first_access(self):
+        loaded = _run(
+            'import sys\n'
+            'import deloreans\n'
+            'deloreans.get\n'
+            'print("deloreans.api" in sys.modules, "deloreans.server" in sys.modules)\n'
+        )
+        self.assertEqual(loaded, ['True', 'False'])
+
+    def test_submodules(self):
+        loaded = _run(
+            'import deloreans\n'
+            'print(deloreans.api.__name__, deloreans.app.__name__, deloreans.date_utils.__name__)\n'
+        )
+        self.assertEqual(loaded, ['deloreans.api', 'deloreans.app', 'deloreans.date_utils'])
+
+    def test_type_hints(self):
+        import deloreans.api
+
+        self.assertIs(typing.get_type_hints(deloreans.api.get)['date_granularity'], deloreans.DateGranularity)
+
+    def test_public_attributes(self):
+        from deloreans.api import get
+        from deloreans.plan import ComparisonPlan
+
+        self.assertIs(deloreans.get, get)
+        self.assertIs(deloreans.ComparisonPlan, ComparisonPlan)
+        self.assertTrue(set(deloreans.__all__) <= set(dir(deloreans)))
+        for name in deloreans.__all__:
+            self.assertIsNotNone(getattr(deloreans, name))
+
+    def test_unknown_attribute(self):
+        with self.assertRaises(AttributeError):
+            deloreans.unknown_attribute  # NOQA
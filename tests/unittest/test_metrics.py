@@ -0,0 +1,120 @@
+import random
+from unittest import TestCase, skipIf
+
+from deloreans.date_utils import DateGranularity, OffsetGranularity
+
+try:
+    import numpy as np
+    from deloreans.metrics import Aggregates, MetricIndex
+    import deloreans.vectorized as vectorized
+except ImportError:  # pragma: no cover
+    np = None
+
+
+@skipIf(np is None, 'NumPy is not installed')
+class MetricIndexTestCase(TestCase):
+
+    def setUp(self):
+        rand = random.Random(0)
+        self.dates = np.array(
+            [
+                np.datetime64('2022-01-01') + rand.randint(0, 3 * 365)
+                for _ in range(2000)
+            ],
+            dtype='datetime64[D]',
+        )
+        self.values = np.array([rand.choice([rand.random(), np.nan]) for _ in range(2000)])
+
+    def _scan(self, start_date, end_date):
+        matched = (self.dates >= start_date) & (self.dates <= end_date) & ~np.isnan(self.values)
+        return self.values[matched].sum(), np.count_nonzero(matched)
+
+    def test_consistent_with_range_scan(self):
+        for date_granularity in (DateGranularity.DAILY, DateGranularity.WEEKLY, DateGranularity.MONTHLY):
+            for firstweekday in (0, 6):
+                index = MetricIndex(self.dates, self.values, date_granularity, firstweekday)
+                start_dates = vectorized.get_start_daily_of_weekly(
+                    np.arange('2021-12-01', '2025-03-01', 23, dtype='datetime64[D]'),
+                    firstweekday,
+                )
+                if date_granularity == DateGranularity.MONTHLY:
+                    start_dates = vectorized.get_start_daily_of_monthly(start_dates)
+                end_dates = vectorized.get_end_date(date_granularity, start_dates, 3, firstweekday)
+                base, compared, valid = index.compare(start_dates, end_dates, -1, OffsetGranularity.YEARLY)
+                compared_start_dates, compared_end_dates, _ = vectorized.compare(
+                    start_dates,
+                    end_dates,
+                    date_granularity,
+                    -1,
+                    OffsetGranularity.YEARLY,
+                    firstweekday,
+                )
+                self.assertEqual(index.aggregate(start_dates, end_dates).count.tolist(), base.count.tolist())
+                for position in range(len(start_dates)):
+                    expected_sum, expected_count = self._scan(start_dates[position], end_dates[position])
+                    self.assertAlmostEqual(base.sum[position], expected_sum)
+                    self.assertEqual(base.count[position], expected_count)
+                    if not valid[position]:
+                        continue
+                    expected_sum, expected_count = self._scan(
+                        compared_start_dates[position],
+                        compared_end_dates[position],
+                    )
+                    self.assertAlmostEqual(compared.sum[position], expected_sum)
+                    self.assertEqual(compared.count[position], expected_count)
+
+    def test_aggregate(self):
+        index = MetricIndex(
+            np.array(['2024-01-01', '2024-01-01', '2024-01-03', '2024-01-04'], dtype='datetime64[D]'),
+            [1.0, 2.0, np.nan, 6.0],
+        )
+        aggregates = index.aggregate(
+            np.array(['2024-01-01', '2024-01-02', '2023-12-01', '2024-01-05'], dtype='datetime64[D]'),
+            np.array(['2024-01-04', '2024-01-03', '2024-01-01', '2024-02-01'], dtype='datetime64[D]'),
+        )
+        self.assertIsInstance(aggregates, Aggregates)
+        self.assertEqual(aggregates.sum.tolist(), [9.0, 0.0, 3.0, 0.0])
+        self.assertEqual(aggregates.count.tolist(), [3, 0, 2, 0])
+        self.assertEqual(aggregates.mean[[0, 2]].tolist(), [3.0, 1.5])
+        self.assertTrue(np.all(np.isnan(aggregates.mean[[1, 3]])))
+
+    def test_compare(self):
+        index = MetricIndex(self.dates, self.values, DateGranularity.MONTHLY)
+        start_dates = np.array(['2024-02-01', '2024-06-01'], dtype='datetime64[D]')
+        end_dates = np.array(['2024-02-29', '2024-06-30'], dtype='datetime64[D]')
+        base, compared, valid = index.compare(start_dates, end_dates, np.array([[-1], [-2]]), OffsetGranularity.YEARLY)
+        self.assertEqual(valid.shape, (2, 2))
+        self.assertEqual(compared.sum.shape, (2, 2))
+        for row, offset in enumerate((-1, -2)):
+            self.assertEqual(
+                compared.count[row].tolist(),
+                index.aggregate(
+                    start_dates.astype('datetime64[M]') + 12 * offset,
+                    (end_dates.astype('datetime64[M]') + 12 * offset + 1).astype('datetime64[D]') - 1,
+                ).count.tolist(),
+            )
+
+    def test_invalid_params(self):
+        with self.assertRaises(ValueError):
+            MetricIndex(self.dates, self.values[:-1])
+        with self.assertRaises(ValueError):
+            MetricIndex(self.dates, self.values, OffsetGranularity.YEARLY)
+        with self.assertRaisesRegex(TypeError, 'Invalid firstweekday'):
+            MetricIndex(self.dates, self.values, DateGranularity.WEEKLY, 0.0)
+        with self.assertRaisesRegex(ValueError, 'Invalid firstweekday 7'):
+            MetricIndex(self.dates, self.values, DateGranularity.WEEKLY, 7)
+        index = MetricIndex(self.dates, self.values, DateGranularity.MONTHLY)
+        start_dates = np.array(['2024-06-02'], dtype='datetime64[D]')
+        end_dates = np.array(['2024-06-30'], dtype='datetime64[D]')
+        with self.assertRaises(ValueError):
+            index.aggregate(start_dates, end_dates)
+        with self.assertRaises(ValueError):
+            index.compare(start_dates, end_dates, -1, OffsetGranularity.YEARLY)
+
+    def test_empty_index(self):
+        index = MetricIndex(np.array([], dtype='datetime64[D]'), [])
+        aggregates = index.aggregate(
+            np.array(['2024-06-01'], dtype='datetime64[D]'),
+            np.array(['2024-06-30'], dtype='datetime64[D]'),
+        )
+        self.assertEqual((aggregates.sum.tolist(), aggregates.count.tolist()), ([0.0], [0]))
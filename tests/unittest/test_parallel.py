@@ -0,0 +1,143 @@
+import datetime
+import random
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from unittest import TestCase, skipIf
+
+import deloreans
+from deloreans.date_utils import DateGranularity, OffsetGranularity
+import deloreans.date_utils.common as common_date_utils
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+# shared memory is supported by Python 3.8 or above
+SHARED_MEMORY_SUPPORTED = sys.version_info >= (3, 8)
+if np is not None and SHARED_MEMORY_SUPPORTED:
+    import deloreans.parallel as parallel
+
+
+def sample_weekly_ranges(count, firstweekday, seed=0):
+    rand = random.Random(seed)
+    samples = []
+    for _ in range(count):
+        a_date = datetime.date(2000, 1, 1) + datetime.timedelta(days=rand.randrange(12000))
+        start_date = common_date_utils.get_weekly_start_date(a_date, firstweekday)
+        end_date = DateGranularity.WEEKLY.get_end_date(start_date, rand.randint(1, 5), firstweekday)
+        samples.append((start_date, end_date))
+    return samples
+
+
+@skipIf(np is None, 'NumPy is not installed')
+@skipIf(not SHARED_MEMORY_SUPPORTED, 'Shared memory requires Python 3.8 or above')
+class ParallelTestCase(TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.executor = ProcessPoolExecutor(max_workers=2)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.executor.shutdown()
+
+    def test_consistent_with_scalar_api(self):
+        firstweekday = 6
+        samples = sample_weekly_ranges(500, firstweekday)
+        start_dates = np.array(samples, dtype='datetime64[D]')[:, 0]
+        end_dates = np.array(samples, dtype='datetime64[D]')[:, 1]
+        for offset_granularity in (OffsetGranularity.PERIODIC, OffsetGranularity.MONTHLY):
+            compared_start_dates, compared_end_dates, valid = parallel.compare(
+                start_dates,
+                end_dates,
+                DateGranularity.WEEKLY,
+                -1,
+                offset_granularity,
+                firstweekday,
+                chunk_size=64,
+                executor=self.executor,
+            )
+            self.assertEqual(compared_start_dates.dtype, np.dtype('datetime64[D]'))
+            for (start_date, end_date), compared_start_date, compared_end_date, is_valid in zip(
+                samples,
+                compared_start_dates.tolist(),
+                compared_end_dates.tolist(),
+                valid.tolist(),
+            ):
+                try:
+                    expected = deloreans.get(
+                        start_date, end_date, DateGranularity.WEEKLY, -1, offset_granularity, firstweekday,
+                    )
+                except ValueError:
+                    self.assertFalse(is_valid)
+                else:
+                    self.assertTrue(is_valid)
+                    self.assertEqual((compared_start_date, compared_end_date), expected)
+
+    def test_offset_array(self):
+        days = np.arange(0, 1000, dtype=np.int32)
+        offsets = np.arange(1000) % 5 - 2
+        compared_start_days, compared_end_days = parallel.get(
+            days,
+            days,
+            DateGranularity.DAILY,
+            offsets,
+            OffsetGranularity.DAILY,
+            chunk_size=300,
+            processes=2,
+        )
+        self.assertEqual(compared_start_days.dtype, np.int32)
+        self.assertTrue(np.array_equal(compared_start_days, days + offsets))
+        self.assertTrue(np.array_equal(compared_end_days, days + offsets))
+
+    def test_single_chunk_in_process(self):
+        days = np.array([0, 31, 59], dtype=np.int32)
+        compared_start_days, compared_end_days = parallel.get(
+            days,
+            days + np.array([30, 27, 30]),
+            DateGranularity.MONTHLY,
+            1,
+            OffsetGranularity.YEARLY,
+        )
+        self.assertEqual(compared_start_days.tolist(), [365, 396, 424])
+        self.assertEqual(compared_end_days.tolist(), [395, 423, 454])
+
+    def test_failing_chunk(self):
+        days = np.arange(0, 700, 7, dtype=np.int32)
+        start_days = days.copy()
+        # 1970-01-01 is Thursday, so that the week from day 50 is not a complete one starting on Monday
+        start_days[50] += 1
+        with self.assertRaises(parallel.ChunkError) as context:
+            parallel.compare(
+                start_days - 3,
+                days + 3,
+                DateGranularity.WEEKLY,
+                -1,
+                OffsetGranularity.PERIODIC,
+                chunk_size=20,
+                executor=self.executor,
+            )
+        self.assertEqual((context.exception.start, context.exception.stop), (40, 60))
+        self.assertIsInstance(context.exception.__cause__, ValueError)
+
+    def test_invalid_input(self):
+        days = np.arange(10, dtype=np.int32)
+        with self.assertRaises(ValueError):
+            parallel.compare(days, days[:5], DateGranularity.DAILY, 1, OffsetGranularity.DAILY)
+        with self.assertRaises(ValueError):
+            parallel.compare(days, days, DateGranularity.DAILY, 1, OffsetGranularity.DAILY, chunk_size=0)
+        with self.assertRaises(ValueError):
+            parallel.compare(days, days, DateGranularity.DAILY, 1, OffsetGranularity.WEEKLY, firstweekday=7)
+
+    def test_invalid_offset(self):
+        days = np.arange(10, dtype=np.int32)
+        # offsets are rejected as 'deloreans.vectorized.compare' does, instead of truncated or wrapped in int32
+        for offset in (1.7, np.full(10, 1.0)):
+            with self.assertRaises(TypeError):
+                parallel.compare(days, days, DateGranularity.DAILY, offset, OffsetGranularity.DAILY)
+        for offset in (2 ** 32 + 5, np.full(10, 2 ** 32 + 5)):
+            with self.assertRaises(ValueError):
+                parallel.compare(days, days, DateGranularity.DAILY, offset, OffsetGranularity.DAILY)
+        with self.assertRaises(ValueError):
+            parallel.compare(days.astype(np.int64) + 2 ** 32, days, DateGranularity.DAILY, 1, OffsetGranularity.DAILY)
@@ -0,0 +1,198 @@
+import copy
+import datetime
+import pickle
+from unittest import TestCase
+
+import deloreans
+from deloreans.app import DeLoreans
+from deloreans.date_utils import (
+    DateGranularity,
+    OffsetGranularity,
+    VALID_GRAINS_COMB,
+)
+from deloreans.plan import ComparisonPlan
+
+
+SAMPLE_DATE_RANGES = {
+    DateGranularity.DAILY: [
+        (datetime.date(2024, 2, 29), datetime.date(2024, 3, 3)),
+        (datetime.date(2023, 12, 31), datetime.date(2023, 12, 31)),
+    ],
+    DateGranularity.WEEKLY: [
+        (datetime.date(2024, 1, 1), datetime.date(2024, 3, 31)),
+        (datetime.date(2020, 12, 28), datetime.date(2021, 1, 3)),
+    ],
+    DateGranularity.MONTHLY: [
+        (datetime.date(2024, 4, 1), datetime.date(2024, 6, 30)),
+        (datetime.date(2023, 12, 1), datetime.date(2023, 12, 31)),
+    ],
+    DateGranularity.YEARLY: [
+        (datetime.date(2024, 1, 1), datetime.date(2024, 12, 31)),
+        (datetime.date(2020, 1, 1), datetime.date(2022, 12, 31)),
+    ],
+}
+
+
+class ComparisonPlanTestCase(TestCase):
+
+    def test_apply_consistent_with_deloreans(self):
+        for date_granularity, offset_granularities in VALID_GRAINS_COMB.items():
+            for offset_granularity in offset_granularities:
+                for offset in (-2, -1, 1):
+                    plan = ComparisonPlan(date_granularity, offset, offset_granularity)
+                    for start_date, end_date in SAMPLE_DATE_RANGES[date_granularity]:
+                        try:
+                            expected = DeLoreans(
+                                start_date,
+                                end_date,
+                                date_granularity,
+                                offset,
+                                offset_granularity,
+                            ).get()
+                        except ValueError:
+                            with self.assertRaises(ValueError):
+                                plan.apply(start_date, end_date)
+                            continue
+                        self.assertEqual(plan.apply(start_date, end_date), expected)
+
+    def test_apply_with_given_firstweekday(self):
+        plan = deloreans.compile(
+            DateGranularity.WEEKLY,
+            -2,
+            OffsetGranularity.MONTHLY,
+            firstweekday=6,
+        )
+        self.assertEqual(
+            plan.apply(datetime.date(2024, 2, 11), datetime.date(2024, 2, 24)),
+            (datetime.date(2023, 12, 10), datetime.date(2023, 12, 23)),
+        )
+
+    def test_apply_is_reusable(self):
+        plan = deloreans.compile(DateGranularity.MONTHLY, -1, OffsetGranularity.YEARLY)
+        self.assertEqual(
+            plan.apply(datetime.date(2024, 6, 1), datetime.date(2024, 6, 30)),
+            (datetime.date(2023, 6, 1), datetime.date(2023, 6, 30)),
+        )
+        self.assertEqual(
+            plan.apply(datetime.date(2024, 2, 1), datetime.date(2024, 2, 29)),
+            (datetime.date(2023, 2, 1), datetime.date(2023, 2, 28)),
+        )
+
+    def test_apply_with_incomplete_date_range(self):
+        plan = deloreans.compile(DateGranularity.MONTHLY, -1, OffsetGranularity.YEARLY)
+        with self.assertRaises(ValueError):
+            plan.apply(datetime.date(2024, 6, 1), datetime.date(2024, 6, 29))
+
+    def test_apply_with_reversed_date_range(self):
+        plan = deloreans.compile(DateGranularity.DAILY, -1, OffsetGranularity.YEARLY)
+        with self.assertRaisesRegex(ValueError, 'should be equal or greater than the start one'):
+            plan.apply(datetime.date(2024, 6, 29), datetime.date(2024, 6, 1))
+        with self.assertRaisesRegex(ValueError, 'should be equal or greater than the start one'):
+            plan.apply_offsets(datetime.date(2024, 6, 29), datetime.date(2024, 6, 1), [-1])
+
+    def test_apply_with_invalid_date_type(self):
+        plan = deloreans.compile(DateGranularity.DAILY, -1, OffsetGranularity.YEARLY)
+        with self.assertRaises(ValueError):
+            plan.apply('2024-06-01', datetime.date(2024, 6, 29))  # NOQA
+
+    def test_apply_trusted(self):
+        plan = deloreans.compile(DateGranularity.WEEKLY, -1, OffsetGranularity.YEARLY, 6)
+        self.assertEqual(
+            plan.apply(datetime.date(2024, 2, 11), datetime.date(2024, 2, 24), trusted=True),
+            plan.apply(datetime.date(2024, 2, 11), datetime.date(2024, 2, 24)),
+        )
+
+    def test_hashable(self):
+        plan = deloreans.compile(DateGranularity.WEEKLY, -1, OffsetGranularity.YEARLY, 6)
+        same_plan = deloreans.compile(DateGranularity.WEEKLY, -1, OffsetGranularity.YEARLY, 6)
+        other_plan = deloreans.compile(DateGranularity.WEEKLY, -1, OffsetGranularity.YEARLY)
+        self.assertEqual(plan, same_plan)
+        self.assertNotEqual(plan, other_plan)
+        self.assertEqual(len({plan, same_plan, other_plan}), 2)
+
+    def test_located_period(self):
+        plan = deloreans.compile(DateGranularity.DAILY, -1, OffsetGranularity.MONTHLY)
+        self.assertEqual(plan.get_start_period_index(datetime.date(2024, 3, 15)), 14)
+        self.assertEqual(plan.get_located_period_start(datetime.date(2024, 3, 15), -1), datetime.date(2024, 2, 1))
+        self.assertEqual(plan.get_located_period_start(datetime.date(2024, 3, 15), 2), datetime.date(2024, 5, 1))
+        plan.validate_date_range(datetime.date(2024, 3, 15), datetime.date(2024, 3, 15))
+        with self.assertRaises(ValueError):
+            plan.validate_date_range(datetime.date(2024, 3, 15), datetime.date(2024, 3, 14))
+
+    def test_immutable(self):
+        plan = deloreans.compile(DateGranularity.WEEKLY, -1, OffsetGranularity.YEARLY, 6)
+        with self.assertRaises(AttributeError):
+            plan._offset = 1
+        with self.assertRaises(AttributeError):
+            del plan._firstweekday
+        self.assertEqual(hash(plan), hash(deloreans.compile(DateGranularity.WEEKLY, -1, OffsetGranularity.YEARLY, 6)))
+
+    def test_pickle_and_copy(self):
+        plan = deloreans.compile(DateGranularity.WEEKLY, -1, OffsetGranularity.YEARLY, 6)
+        for copied_plan in (pickle.loads(pickle.dumps(plan)), copy.copy(plan), copy.deepcopy(plan)):
+            self.assertEqual(copied_plan, plan)
+            self.assertEqual(
+                copied_plan.apply(datetime.date(2024, 2, 11), datetime.date(2024, 2, 24)),
+                plan.apply(datetime.date(2024, 2, 11), datetime.date(2024, 2, 24)),
+            )
+
+    def test_invalid_grain_comb(self):
+        with self.assertRaises(ValueError):
+            deloreans.compile(DateGranularity.YEARLY, -1, OffsetGranularity.MONTHLY)
+
+    def test_invalid_firstweekday(self):
+        with self.assertRaises(ValueError):
+            deloreans.compile(DateGranularity.WEEKLY, -1, OffsetGranularity.YEARLY, 7)
+
+    def test_invalid_offset_type(self):
+        with self.assertRaises(TypeError):
+            deloreans.compile(DateGranularity.WEEKLY, '1', OffsetGranularity.YEARLY)  # NOQA
+
+    def test_apply_offsets_consistent_with_apply(self):
+        for date_granularity, offset_granularities in VALID_GRAINS_COMB.items():
+            for offset_granularity in offset_granularities:
+                plan = ComparisonPlan(date_granularity, 0, offset_granularity)
+                for start_date, end_date in SAMPLE_DATE_RANGES[date_granularity]:
+                    expected = []
+                    for offset in range(-5, 3):
+                        try:
+                            expected.append(
+                                ComparisonPlan(date_granularity, offset, offset_granularity).apply(start_date, end_date)
+                            )
+                        except ValueError:
+                            expected.append(None)
+                    self.assertEqual(
+                        plan.apply_offsets(start_date, end_date, range(-5, 3), errors='coerce'),
+                        expected,
+                    )
+
+    def test_apply_offsets_errors(self):
+        plan = ComparisonPlan(DateGranularity.DAILY, 0, OffsetGranularity.YEARLY)
+        leap_day = datetime.date(2024, 12, 31)
+        with self.assertRaises(ValueError):
+            plan.apply_offsets(leap_day, leap_day, [-4, -1])
+        self.assertEqual(
+            plan.apply_offsets(leap_day, leap_day, [-4, -1], errors='coerce'),
+            [(datetime.date(2020, 12, 31), datetime.date(2020, 12, 31)), None],
+        )
+        with self.assertRaises(ValueError):
+            plan.apply_offsets(leap_day, leap_day, [-4], errors='ignore')
+
+        # compared end dates out of the calendar are coerced as well
+        plan = ComparisonPlan(DateGranularity.MONTHLY, 0, OffsetGranularity.YEARLY)
+        self.assertEqual(
+            plan.apply_offsets(datetime.date(9998, 12, 1), datetime.date(9998, 12, 31), [1], errors='coerce'),
+            [None],
+        )
+        plan = ComparisonPlan(DateGranularity.DAILY, 0, OffsetGranularity.PERIODIC)
+        last_day = datetime.date(9999, 12, 31)
+        with self.assertRaises(OverflowError):
+            plan.apply_offsets(last_day, last_day, [1])
+        self.assertEqual(
+            plan.apply_offsets(last_day, last_day, [0, 1], errors='coerce'),
+            [(last_day, last_day), None],
+        )
+        with self.assertRaises(TypeError):
+            plan.apply_offsets(leap_day, leap_day, [-4, 1.5])
+        with self.assertRaises(ValueError):
+            plan.apply_offsets(leap_day, datetime.date(2024, 12, 30), [-4])
@@ -0,0 +1,131 @@
+import datetime
+from unittest import TestCase
+
+import deloreans
+from deloreans.date_utils import (
+    DateGranularity,
+    OffsetGranularity,
+    PeriodSequence,
+    VALID_GRAINS_COMB,
+)
+from deloreans.plan import ComparisonPlan
+from deloreans.rolling_window import rolling, RollingWindow
+
+
+class RollingTestCase(TestCase):
+
+    def test_consistent_with_deloreans(self):
+        for date_granularity, offset_granularities in VALID_GRAINS_COMB.items():
+            for offset_granularity in offset_granularities:
+                for firstweekday in (0, 6):
+                    periods = PeriodSequence(
+                        datetime.date(2019, 11, 20),
+                        datetime.date(2024, 3, 10),
+                        date_granularity,
+                        firstweekday,
+                        bounds=True,
+                    )
+                    start_date, end_date = periods[0][0], periods[-1][1]
+                    for offset in (-2, 1):
+                        plan = ComparisonPlan(date_granularity, offset, offset_granularity, firstweekday)
+                        for window_length in (1, 3):
+                            expected = []
+                            for position in range(len(periods) - window_length + 1):
+                                window_start_date = periods[position][0]
+                                window_end_date = periods[position + window_length - 1][1]
+                                try:
+                                    compared_date_range = plan.apply(window_start_date, window_end_date)
+                                except ValueError:
+                                    compared_date_range = (None, None)
+                                expected.append(RollingWindow(window_start_date, window_end_date, *compared_date_range))
+                            self.assertEqual(
+                                list(rolling(
+                                    start_date,
+                                    end_date,
+                                    window_length,
+                                    date_granularity,
+                                    offset,
+                                    offset_granularity,
+                                    firstweekday,
+                                )),
+                                expected,
+                            )
+
+    def test_window_without_compared_one(self):
+        windows = list(deloreans.rolling(
+            datetime.date(2024, 3, 29),
+            datetime.date(2024, 4, 2),
+            2,
+            DateGranularity.DAILY,
+            -1,
+            OffsetGranularity.MONTHLY,
+        ))
+        self.assertEqual(
+            windows,
+            [
+                RollingWindow(
+                    datetime.date(2024, 3, 29),
+                    datetime.date(2024, 3, 30),
+                    datetime.date(2024, 2, 29),
+                    datetime.date(2024, 3, 1),
+                ),
+                RollingWindow(datetime.date(2024, 3, 30), datetime.date(2024, 3, 31), None, None),
+                RollingWindow(datetime.date(2024, 3, 31), datetime.date(2024, 4, 1), None, None),
+                RollingWindow(
+                    datetime.date(2024, 4, 1),
+                    datetime.date(2024, 4, 2),
+                    datetime.date(2024, 3, 1),
+                    datetime.date(2024, 3, 2),
+                ),
+            ],
+        )
+
+    def test_date_range_shorter_than_window(self):
+        windows = rolling(
+            datetime.date(2024, 1, 1),
+            datetime.date(2024, 2, 29),
+            3,
+            DateGranularity.MONTHLY,
+            -1,
+            OffsetGranularity.YEARLY,
+        )
+        self.assertEqual(list(windows), [])
+
+    def test_invalid_params(self):
+        # validated when called instead of iterated
+        with self.assertRaises(ValueError):
+            rolling(
+                datetime.date(2024, 1, 2),
+                datetime.date(2024, 12, 31),
+                1,
+                DateGranularity.MONTHLY,
+                -1,
+                OffsetGranularity.YEARLY,
+            )
+        with self.assertRaises(ValueError):
+            rolling(
+                datetime.date(2024, 1, 1),
+                datetime.date(2024, 12, 31),
+                0,
+                DateGranularity.MONTHLY,
+                -1,
+                OffsetGranularity.YEARLY,
+            )
+        with self.assertRaises(TypeError):
+            rolling(
+                datetime.date(2024, 1, 1),
+                datetime.date(2024, 12, 31),
+                1.0,
+                DateGranularity.MONTHLY,
+                -1,
+                OffsetGranularity.YEARLY,
+            )
+        with self.assertRaises(ValueError):
+            rolling(
+                datetime.date(2024, 1, 1),
+                datetime.date(2024, 12, 31),
+                1,
+                DateGranularity.YEARLY,
+                -1,
+                OffsetGranularity.MONTHLY,
+            )
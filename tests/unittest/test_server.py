@@ -0,0 +1,246 @@
+import asyncio
+import datetime
+import json
+from unittest import TestCase
+from unittest.mock import patch
+
+import deloreans
+from deloreans.date_utils import DateGranularity, OffsetGranularity
+from deloreans.server import Batcher, LatencyStats, Server
+
+
+async def request(port, method, path, payload=None):
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    body = b'' if payload is None else json.dumps(payload).encode()
+    writer.write(
+        f'{method} {path} HTTP/1.1\r\nHost: localhost\r\nContent-Length: {len(body)}\r\nConnection: close\r\n\r\n'
+        .encode() + body
+    )
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    head, _, content = response.partition(b'\r\n\r\n')
+    return int(head.split()[1]), json.loads(content)
+
+
+def monthly_payload(month):
+    start_date = datetime.date(2024, month, 1)
+    end_date = DateGranularity.MONTHLY.get_end_date(start_date, 1)
+    return {
+        'start_date': start_date.isoformat(),
+        'end_date': end_date.isoformat(),
+        'date_granularity': 'monthly',
+        'offset': -1,
+        'offset_granularity': 'yearly',
+    }
+
+
+class BatcherTestCase(TestCase):
+
+    def test_coalesce_and_collapse(self):
+        batcher = Batcher(window=0.01)
+        params = [
+            (datetime.date(2024, month, 1), DateGranularity.MONTHLY.get_end_date(datetime.date(2024, month, 1), 1),
+             DateGranularity.MONTHLY, -1, OffsetGranularity.YEARLY, 0)
+            for month in (1, 2, 2, 3, 3, 3)
+        ]
+
+        async def submit_all():
+            return await asyncio.gather(*[batcher.submit(item) for item in params])
+
+        results = asyncio.run(submit_all())
+        self.assertEqual(results, [deloreans.get(*item) for item in params])
+        self.assertEqual((batcher.requests, batcher.batches, batcher.collapsed_requests), (6, 1, 3))
+
+    def test_max_batch_size(self):
+        batcher = Batcher(window=10, max_batch_size=2)
+        params = [
+            (datetime.date(2024, 1, day), datetime.date(2024, 1, day), DateGranularity.DAILY, 1,
+             OffsetGranularity.DAILY, 0)
+            for day in range(1, 5)
+        ]
+
+        async def submit_all():
+            return await asyncio.wait_for(asyncio.gather(*[batcher.submit(item) for item in params]), 1)
+
+        asyncio.run(submit_all())
+        self.assertEqual(batcher.batches, 2)
+
+    def test_invalid_request_in_batch(self):
+        batcher = Batcher()
+        valid = (datetime.date(2024, 6, 1), datetime.date(2024, 6, 30), DateGranularity.MONTHLY, -1,
+                 OffsetGranularity.YEARLY, 0)
+        invalid = (datetime.date(2024, 6, 2), datetime.date(2024, 6, 30), DateGranularity.MONTHLY, -1,
+                   OffsetGranularity.YEARLY, 0)
+
+        async def submit_all():
+            return await asyncio.gather(batcher.submit(valid), batcher.submit(invalid), return_exceptions=True)
+
+        result, error = asyncio.run(submit_all())
+        self.assertEqual(result, deloreans.get(*valid))
+        self.assertIsInstance(error, ValueError)
+
+    def test_overflowing_request_in_batch(self):
+        batcher = Batcher(window=0.01)
+        valid = (datetime.date(2024, 6, 1), datetime.date(2024, 6, 30), DateGranularity.MONTHLY, -1,
+                 OffsetGranularity.YEARLY, 0)
+        overflowing = (datetime.date(9999, 12, 31), datetime.date(9999, 12, 31), DateGranularity.DAILY, 1,
+                       OffsetGranularity.PERIODIC, 0)
+
+        async def submit_all():
+            results = await asyncio.wait_for(
+                asyncio.gather(
+                    batcher.submit(valid),
+                    batcher.submit(overflowing),
+                    batcher.submit(overflowing),
+                    return_exceptions=True,
+                ),
+                1,
+            )
+            # a later identical request is computed again instead of waiting for the finished one
+            later = await asyncio.wait_for(asyncio.gather(batcher.submit(overflowing), return_exceptions=True), 1)
+            return results + later
+
+        result, *errors = asyncio.run(submit_all())
+        self.assertEqual(result, deloreans.get(*valid))
+        for error in errors:
+            self.assertIsInstance(error, OverflowError)
+        self.assertEqual(batcher.collapsed_requests, 1)
+        self.assertEqual(batcher._in_flight, {})
+
+    def test_unexpected_error_in_batch(self):
+        batcher = Batcher()
+        params = (datetime.date(2024, 6, 1), datetime.date(2024, 6, 30), DateGranularity.MONTHLY, -1,
+                  OffsetGranularity.YEARLY, 0)
+
+        async def submit_all():
+            return await asyncio.wait_for(
+                asyncio.gather(batcher.submit(params), batcher.submit(params), return_exceptions=True),
+                1,
+            )
+
+        with patch('deloreans.server.get_many', side_effect=RuntimeError), \
+                patch('deloreans.server.get', side_effect=RuntimeError):
+            errors = asyncio.run(submit_all())
+        for error in errors:
+            self.assertIsInstance(error, RuntimeError)
+        self.assertEqual(batcher._in_flight, {})
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            Batcher(window=-1)
+        with self.assertRaises(ValueError):
+            Batcher(max_batch_size=0)
+
+
+class LatencyStatsTestCase(TestCase):
+
+    def test_percentile(self):
+        stats = LatencyStats(maxlen=100)
+        self.assertIsNone(stats.percentile(50))
+        for latency_ns in range(1, 201):
+            stats.record(latency_ns * 1000000)
+        # only the latest 100 latencies are kept
+        self.assertEqual(stats.percentile(50), 150)
+        self.assertEqual(stats.percentile(99), 199)
+        self.assertEqual(stats.percentile(100), 200)
+
+
+class ServerTestCase(TestCase):
+
+    def test_serve(self):
+        async def scenario():
+            server = Server(port=0, window=0.01)
+            await server.start()
+            try:
+                payloads = [monthly_payload(month) for month in (1, 2, 3, 1, 2, 3)]
+                responses = await asyncio.gather(*[request(server.port, 'POST', '/compare', item) for item in payloads])
+                invalid = await request(server.port, 'POST', '/compare', dict(payloads[0], start_date='2024-01-02'))
+                not_found = await request(server.port, 'GET', '/unknown')
+                stats = await request(server.port, 'GET', '/stats')
+            finally:
+                await server.close()
+            return payloads, responses, invalid, not_found, stats
+
+        payloads, responses, invalid, not_found, stats = asyncio.run(scenario())
+        for payload, (status, content) in zip(payloads, responses):
+            self.assertEqual(status, 200)
+            expected = deloreans.get(
+                datetime.date.fromisoformat(payload['start_date']),
+                datetime.date.fromisoformat(payload['end_date']),
+                DateGranularity.MONTHLY,
+                -1,
+                OffsetGranularity.YEARLY,
+            )
+            self.assertEqual(
+                (content['compared_start_date'], content['compared_end_date']),
+                (expected[0].isoformat(), expected[1].isoformat()),
+            )
+        self.assertEqual(invalid[0], 400)
+        self.assertIn('error', invalid[1])
+        self.assertEqual(not_found[0], 404)
+
+        status, content = stats
+        self.assertEqual(status, 200)
+        self.assertEqual(content['requests'], 7)
+        self.assertEqual(content['errors'], 1)
+        self.assertLess(content['batches'], 7)
+        self.assertGreaterEqual(content['latency_p99_ms'], content['latency_p50_ms'])
+
+    def test_error_statuses(self):
+        overflowing = {
+            'start_date': '9999-12-31',
+            'end_date': '9999-12-31',
+            'date_granularity': 'daily',
+            'offset': 1,
+            'offset_granularity': 'periodic',
+        }
+
+        async def scenario():
+            server = Server(port=0, window=0.01)
+            await server.start()
+            try:
+                responses = await asyncio.wait_for(
+                    asyncio.gather(*[request(server.port, 'POST', '/compare', overflowing) for _ in range(2)]),
+                    1,
+                )
+                with patch('deloreans.server.get_many', side_effect=RuntimeError('unexpected')), \
+                        patch('deloreans.server.get', side_effect=RuntimeError('unexpected')):
+                    responses.append(await request(server.port, 'POST', '/compare', monthly_payload(6)))
+                stats = await request(server.port, 'GET', '/stats')
+            finally:
+                await server.close()
+            return responses, stats
+
+        responses, stats = asyncio.run(scenario())
+        self.assertEqual([status for status, _ in responses], [400, 400, 500])
+        self.assertEqual(responses[2][1], {'error': 'RuntimeError: unexpected'})
+        self.assertEqual(stats[1]['errors'], 3)
+
+    def test_keep_alive(self):
+        async def scenario():
+            server = Server(port=0, window=0)
+            await server.start()
+            try:
+                reader, writer = await asyncio.open_connection('127.0.0.1', server.port)
+                statuses = []
+                for month in (4, 5):
+                    body = json.dumps(monthly_payload(month)).encode()
+                    writer.write(
+                        f'POST /compare HTTP/1.1\r\nContent-Length: {len(body)}\r\n\r\n'.encode() + body
+                    )
+                    statuses.append(await reader.readline())
+                    headers = {}
+                    while True:
+                        line = (await reader.readline()).strip()
+                        if not line:
+                            break
+                        name, _, value = line.decode().partition(':')
+                        headers[name.lower()] = value.strip()
+                    await reader.readexactly(int(headers['content-length']))
+                writer.close()
+            finally:
+                await server.close()
+            return statuses
+
+        self.assertEqual(asyncio.run(scenario()), [b'HTTP/1.1 200 OK\r\n'] * 2)
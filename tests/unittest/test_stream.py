@@ -0,0 +1,79 @@
+import datetime
+import random
+from unittest import TestCase
+
+import deloreans
+from deloreans.date_utils import (
+    DateGranularity,
+    OffsetGranularity,
+    VALID_GRAINS_COMB,
+)
+from deloreans.stream import StreamComparator, StreamInfo
+
+
+def get_expected(a_date, date_granularity, offset, offset_granularity, firstweekday):
+    start_date = date_granularity.from_key(date_granularity.to_key(a_date, firstweekday), firstweekday)
+    try:
+        compared_start_date, compared_end_date = deloreans.get(
+            start_date,
+            date_granularity.get_end_date(start_date, 1, firstweekday),
+            date_granularity,
+            offset,
+            offset_granularity,
+            firstweekday,
+        )
+    except ValueError:
+        return None
+    compared_date = compared_start_date + (a_date - start_date)
+    return compared_date if compared_date <= compared_end_date else None
+
+
+class StreamComparatorTestCase(TestCase):
+
+    def test_consistent_with_deloreans(self):
+        dates = [datetime.date(2020, 11, 20) + datetime.timedelta(days=days) for days in range(120)]
+        shuffled_dates = random.Random(0).sample(dates, len(dates))
+        for date_granularity, offset_granularities in VALID_GRAINS_COMB.items():
+            for offset_granularity in offset_granularities:
+                for firstweekday in (0, 6):
+                    for offset in (-1, 2):
+                        for stream in (dates, shuffled_dates):
+                            comparator = StreamComparator(date_granularity, offset, offset_granularity, firstweekday)
+                            self.assertEqual(
+                                comparator.feed(stream, errors='coerce'),
+                                [
+                                    get_expected(a_date, date_granularity, offset, offset_granularity, firstweekday)
+                                    for a_date in stream
+                                ],
+                            )
+
+    def test_recomputations(self):
+        comparator = deloreans.StreamComparator(DateGranularity.DAILY, -1, OffsetGranularity.YEARLY)
+        dates = [datetime.date(2023, 12, 30) + datetime.timedelta(days=days // 3) for days in range(12)]
+        comparator.feed(dates)
+        # 4 days crossing the boundary of a year once
+        self.assertEqual(comparator.info(), StreamInfo(events=12, period_changes=4, recomputations=2))
+        self.assertEqual(comparator.compare(datetime.date(2024, 1, 2)), datetime.date(2023, 1, 2))
+        self.assertEqual(comparator.info().recomputations, 2)
+
+    def test_no_counterpart(self):
+        comparator = StreamComparator(DateGranularity.MONTHLY, -1, OffsetGranularity.YEARLY)
+        self.assertEqual(comparator.compare(datetime.date(2024, 2, 28)), datetime.date(2023, 2, 28))
+        self.assertIsNone(comparator.compare(datetime.date(2024, 2, 29), errors='coerce'))
+        with self.assertRaises(ValueError):
+            comparator.compare(datetime.date(2024, 2, 29))
+        # 2020-W53 doesn't exist in 2019
+        comparator = StreamComparator(DateGranularity.WEEKLY, -1, OffsetGranularity.YEARLY)
+        self.assertEqual(
+            comparator.feed([datetime.date(2020, 12, 29), datetime.date(2021, 1, 5)], errors='coerce'),
+            [None, datetime.date(2019, 12, 31)],
+        )
+
+    def test_invalid_params(self):
+        with self.assertRaises(ValueError):
+            StreamComparator(DateGranularity.MONTHLY, -1, OffsetGranularity.WEEKLY)
+        comparator = StreamComparator(DateGranularity.DAILY, -1, OffsetGranularity.YEARLY)
+        with self.assertRaises(ValueError):
+            comparator.compare('2024-01-01')
+        with self.assertRaises(ValueError):
+            comparator.compare(datetime.date(2024, 1, 1), errors='ignore')
@@ -0,0 +1,61 @@
+import datetime
+from unittest import TestCase
+
+import deloreans
+from deloreans import DateGranularity, OffsetGranularity, TraceEvent
+import deloreans.date_utils.common as common_date_utils
+
+
+class TracingTestCase(TestCase):
+
+    def setUp(self):
+        self.events = []
+        self.params = (
+            datetime.date(2024, 2, 11),
+            datetime.date(2024, 2, 24),
+            DateGranularity.WEEKLY,
+            -1,
+            OffsetGranularity.PERIODIC,
+            6,
+        )
+
+    def tearDown(self):
+        deloreans.set_tracer(None)
+
+    def test_trace_phases(self):
+        expected = deloreans.get(*self.params)
+        deloreans.set_tracer(self.events.append)
+        self.assertEqual(deloreans.get(*self.params), expected)
+
+        self.assertEqual(
+            [event.phase for event in self.events],
+            [
+                'start_period_index',
+                'date_range_length',
+                'located_period_start_date',
+                'compared_start_date',
+                'compared_end_date',
+            ],
+        )
+        self.assertTrue(all(isinstance(event, TraceEvent) for event in self.events))
+        self.assertTrue(all(event.elapsed_ns >= 0 for event in self.events))
+
+        start_period_index, date_range_length, located, compared_start, compared_end = self.events
+        self.assertIs(start_period_index.func, common_date_utils.get_weekly_index_of_weekly)
+        self.assertIs(located.func, common_date_utils.get_compared_start_weekly_located_weekly)
+        self.assertEqual(date_range_length.values['length'], 2)
+        # periodic offset is multiplied by length of date range
+        self.assertEqual(located.values['offset'], -2)
+        self.assertEqual(compared_start.values['compared_start_date'], expected[0])
+        self.assertEqual(compared_end.values['compared_end_date'], expected[1])
+
+    def test_set_tracer(self):
+        self.assertIsNone(deloreans.get_tracer())
+        self.assertIsNone(deloreans.set_tracer(self.events.append))
+        self.assertEqual(deloreans.set_tracer(None), self.events.append)
+        deloreans.get(*self.params)
+        self.assertEqual(self.events, [])
+
+    def test_invalid_tracer(self):
+        with self.assertRaises(TypeError):
+            deloreans.set_tracer('tracer')  # NOQA
@@ -0,0 +1,593 @@
+import datetime
+import random
+from unittest import TestCase, skipIf
+
+import deloreans
+from deloreans.app import DeLoreans
+from deloreans.date_utils import (
+    DateGranularity,
+    OffsetGranularity,
+    PeriodSequence,
+    VALID_GRAINS_COMB,
+)
+import deloreans.date_utils.common as common_date_utils
+
+try:
+    import numpy as np
+    import deloreans.vectorized as vectorized
+except ImportError:  # pragma: no cover
+    np = None
+
+
+EPOCH = datetime.date(1970, 1, 1)
+
+
+def to_days(a_date: datetime.date) -> int:
+    return (a_date - EPOCH).days
+
+
+def to_date(days: int) -> datetime.date:
+    return EPOCH + datetime.timedelta(days=int(days))
+
+
+def sample_date_ranges(date_granularity, firstweekday, count=40, seed=0):
+    rand = random.Random(seed)
+    samples = []
+    for _ in range(count):
+        a_date = to_date(rand.randint(to_days(datetime.date(1995, 1, 1)), to_days(datetime.date(2035, 1, 1))))
+        length = rand.randint(1, 4)
+        if date_granularity == DateGranularity.DAILY:
+            start_date = a_date
+        elif date_granularity == DateGranularity.WEEKLY:
+            start_date = common_date_utils.get_weekly_start_date(a_date, firstweekday)
+        elif date_granularity == DateGranularity.MONTHLY:
+            start_date = datetime.date(a_date.year, a_date.month, 1)
+        else:
+            start_date = datetime.date(a_date.year, 1, 1)
+        end_date = date_granularity.get_end_date(start_date, length, firstweekday)
+        samples.append((start_date, end_date))
+    return samples
+
+
+@skipIf(np is None, 'NumPy is not installed')
+class CivilConversionTestCase(TestCase):
+
+    def test_days_to_civil(self):
+        days = np.arange(to_days(datetime.date(1600, 1, 1)), to_days(datetime.date(2400, 12, 31)), 17)
+        years, months, dates = vectorized.days_to_civil(days)
+        for day, year, month, date in zip(days[::97], years[::97], months[::97], dates[::97]):
+            expected = to_date(day)
+            self.assertEqual((year, month, date), (expected.year, expected.month, expected.day))
+
+    def test_civil_to_days(self):
+        days = np.arange(to_days(datetime.date(1600, 1, 1)), to_days(datetime.date(2400, 12, 31)), 13)
+        self.assertTrue(np.array_equal(vectorized.civil_to_days(*vectorized.days_to_civil(days)), days))
+
+    def test_weekday(self):
+        dates = np.arange('2024-06-01', '2024-06-30', dtype='datetime64[D]')
+        expected = [to_date(day).weekday() for day in dates.astype(np.int64)]
+        self.assertEqual(vectorized.get_weekday(dates).tolist(), expected)
+
+
+@skipIf(np is None, 'NumPy is not installed')
+class DateUtilsTestCase(TestCase):
+
+    def setUp(self):
+        self.dates = [
+            datetime.date(2020, 12, 27),
+            datetime.date(2021, 1, 1),
+            datetime.date(2024, 2, 29),
+            datetime.date(2024, 6, 20),
+            datetime.date(2024, 12, 30),
+            datetime.date(2026, 1, 4),
+        ]
+        self.days = np.array([to_days(a_date) for a_date in self.dates])
+
+    def test_start_and_index_families(self):
+        for firstweekday in range(7):
+            for date_granularity, offset_granularities in VALID_GRAINS_COMB.items():
+                date_grain_name = date_granularity.name.lower()
+                for offset_granularity in offset_granularities - {OffsetGranularity.PERIODIC}:
+                    offset_grain_name = offset_granularity.name.lower()
+                    func_name = f'get_{date_grain_name}_index_of_{offset_grain_name}'
+                    self.assertEqual(
+                        getattr(vectorized, func_name)(self.days, firstweekday).tolist(),
+                        [
+                            getattr(common_date_utils, func_name)(a_date, firstweekday=firstweekday)
+                            for a_date in self.dates
+                        ],
+                    )
+                    for offset in (-3, 0, 2):
+                        func_name = f'get_compared_start_{date_grain_name}_located_{offset_grain_name}'
+                        self.assertEqual(
+                            [to_date(day) for day in getattr(vectorized, func_name)(self.days, offset, firstweekday)],
+                            [
+                                getattr(common_date_utils, func_name)(a_date, offset, firstweekday=firstweekday)
+                                for a_date in self.dates
+                            ],
+                        )
+
+    def test_with_index_family(self):
+        for firstweekday in (0, 3, 6):
+            for date_granularity, offset_granularities in VALID_GRAINS_COMB.items():
+                date_grain_name = date_granularity.name.lower()
+                for offset_granularity in offset_granularities - {OffsetGranularity.PERIODIC}:
+                    func_name = f'get_{date_grain_name}_with_index_in_{offset_granularity.name.lower()}'
+                    for index in (-1, 0, 3, 4, 5, 11, 12, 27, 28, 30, 52, 364, 365):
+                        start_days, valid = getattr(vectorized, func_name)(self.days, index, firstweekday)
+                        for a_date, start_day, is_valid in zip(self.dates, start_days, valid):
+                            try:
+                                expected = getattr(common_date_utils, func_name)(
+                                    a_date,
+                                    index,
+                                    firstweekday=firstweekday,
+                                )
+                            except ValueError:
+                                self.assertFalse(is_valid)
+                                continue
+                            self.assertTrue(is_valid)
+                            self.assertEqual(to_date(start_day), expected)
+
+    def test_datetime64_dates(self):
+        dates = np.array(['2024-06-20', '2024-02-29'], dtype='datetime64[D]')
+        start_dates = vectorized.get_start_weekly_of_monthly(dates, 6)
+        self.assertEqual(start_dates.dtype, np.dtype('datetime64[D]'))
+        self.assertEqual(
+            start_dates.tolist(),
+            [datetime.date(2024, 6, 2), datetime.date(2024, 2, 4)],
+        )
+
+    def test_invalid_dates_type(self):
+        with self.assertRaises(ValueError):
+            vectorized.get_weekday(np.array([1.5, 2.5]))
+
+    def test_dates_out_of_int32_range(self):
+        with self.assertRaises(ValueError):
+            vectorized.get_weekday(np.array([0, 2 ** 31], dtype=np.int64))
+        with self.assertRaises(ValueError):
+            vectorized.get_weekday(np.array(['2024-01-01', 'NaT'], dtype='datetime64[D]'))
+        self.assertEqual(vectorized.get_weekday(np.array([0], dtype=np.int64)).tolist(), [3])
+
+
+@skipIf(np is None, 'NumPy is not installed')
+class DateGranularityTestCase(TestCase):
+
+    def test_date_range_length_and_end_date(self):
+        for firstweekday in (0, 6):
+            for date_granularity in DateGranularity:
+                samples = sample_date_ranges(date_granularity, firstweekday)
+                start_days = np.array([to_days(start_date) for start_date, _ in samples])
+                end_days = np.array([to_days(end_date) for _, end_date in samples])
+                lengths = vectorized.get_date_range_length(date_granularity, start_days, end_days, firstweekday)
+                self.assertEqual(
+                    lengths.tolist(),
+                    [
+                        date_granularity.get_date_range_length(start_date, end_date, firstweekday)
+                        for start_date, end_date in samples
+                    ],
+                )
+                self.assertTrue(np.array_equal(
+                    vectorized.get_end_date(date_granularity, start_days, lengths, firstweekday),
+                    end_days,
+                ))
+                self.assertTrue(np.all(vectorized.is_complete(date_granularity, start_days, end_days, firstweekday)))
+
+    def test_incomplete_date_range(self):
+        start_days = np.array([to_days(datetime.date(2024, 6, 1))])
+        end_days = np.array([to_days(datetime.date(2024, 6, 29))])
+        self.assertFalse(vectorized.is_complete(DateGranularity.MONTHLY, start_days, end_days)[0])
+
+    def test_get_end_date_with_invalid_start_date(self):
+        with self.assertRaises(ValueError):
+            vectorized.get_end_date(DateGranularity.MONTHLY, np.array([to_days(datetime.date(2024, 6, 2))]), 1)
+
+
+@skipIf(np is None, 'NumPy is not installed')
+class CompareTestCase(TestCase):
+
+    def test_consistent_with_deloreans(self):
+        for firstweekday in (0, 2, 6):
+            for date_granularity, offset_granularities in VALID_GRAINS_COMB.items():
+                samples = sample_date_ranges(date_granularity, firstweekday, seed=firstweekday)
+                start_days = np.array([to_days(start_date) for start_date, _ in samples])
+                end_days = np.array([to_days(end_date) for _, end_date in samples])
+                for offset_granularity in offset_granularities:
+                    for offset in (-5, -1, 1):
+                        compared_start_days, compared_end_days, valid = vectorized.compare(
+                            start_days,
+                            end_days,
+                            date_granularity,
+                            offset,
+                            offset_granularity,
+                            firstweekday,
+                        )
+                        for (start_date, end_date), *result in zip(
+                            samples,
+                            compared_start_days,
+                            compared_end_days,
+                            valid,
+                        ):
+                            try:
+                                expected = DeLoreans(
+                                    start_date,
+                                    end_date,
+                                    date_granularity,
+                                    offset,
+                                    offset_granularity,
+                                    firstweekday,
+                                ).get()
+                            except ValueError:
+                                self.assertFalse(result[2])
+                                continue
+                            self.assertTrue(result[2])
+                            self.assertEqual((to_date(result[0]), to_date(result[1])), expected)
+
+    def test_get_with_datetime64(self):
+        start_dates = np.array(['2024-06-01', '2024-02-01'], dtype='datetime64[D]')
+        end_dates = np.array(['2024-06-30', '2024-02-29'], dtype='datetime64[D]')
+        compared_start_dates, compared_end_dates = vectorized.get(
+            start_dates,
+            end_dates,
+            DateGranularity.MONTHLY,
+            -1,
+            OffsetGranularity.YEARLY,
+        )
+        self.assertEqual(
+            compared_start_dates.tolist(),
+            [datetime.date(2023, 6, 1), datetime.date(2023, 2, 1)],
+        )
+        self.assertEqual(
+            compared_end_dates.tolist(),
+            [datetime.date(2023, 6, 30), datetime.date(2023, 2, 28)],
+        )
+
+    def test_get_with_offset_array(self):
+        start_dates = np.array(['2024-06-01', '2024-06-01'], dtype='datetime64[D]')
+        end_dates = np.array(['2024-06-30', '2024-06-30'], dtype='datetime64[D]')
+        compared_start_dates, _ = vectorized.get(
+            start_dates,
+            end_dates,
+            DateGranularity.MONTHLY,
+            np.array([-1, -2]),
+            OffsetGranularity.YEARLY,
+        )
+        self.assertEqual(
+            compared_start_dates.tolist(),
+            [datetime.date(2023, 6, 1), datetime.date(2022, 6, 1)],
+        )
+
+    def test_offset_out_of_int32_range(self):
+        start_dates = np.array(['2024-06-01'], dtype='datetime64[D]')
+        end_dates = np.array(['2024-06-30'], dtype='datetime64[D]')
+        with self.assertRaises(ValueError):
+            vectorized.compare(start_dates, end_dates, DateGranularity.MONTHLY, 2 ** 32 - 1, OffsetGranularity.YEARLY)
+
+    def test_non_integer_offset(self):
+        start_dates = np.array(['2024-06-01'], dtype='datetime64[D]')
+        end_dates = np.array(['2024-06-30'], dtype='datetime64[D]')
+        for offset in (1.7, np.array([1.0]), True):
+            with self.assertRaises(TypeError):
+                vectorized.compare(start_dates, end_dates, DateGranularity.MONTHLY, offset, OffsetGranularity.YEARLY)
+
+    def test_periodic_offset_beyond_int32_range(self):
+        # the offset in days is 'offset * 1000', which doesn't fit int32
+        start_dates = np.array(['2000-01-01'], dtype='datetime64[D]')
+        end_dates = start_dates + 999
+        _, _, valid = vectorized.compare(
+            start_dates,
+            end_dates,
+            DateGranularity.DAILY,
+            np.array([2 ** 22, -(2 ** 22), -1]),
+            OffsetGranularity.PERIODIC,
+        )
+        self.assertEqual(valid.tolist(), [False, False, True])
+
+    def test_compared_date_range_out_of_calendar(self):
+        cases = [
+            ('9999-12-01', '9999-12-31', DateGranularity.MONTHLY, 1, OffsetGranularity.MONTHLY),
+            ('0001-01-01', '0001-01-31', DateGranularity.MONTHLY, -1, OffsetGranularity.YEARLY),
+            ('9999-12-31', '9999-12-31', DateGranularity.DAILY, 1, OffsetGranularity.PERIODIC),
+            ('0001-01-01', '0001-01-01', DateGranularity.DAILY, -1, OffsetGranularity.DAILY),
+        ]
+        for start_date, end_date, date_granularity, offset, offset_granularity in cases:
+            start_dates = np.array([start_date], dtype='datetime64[D]')
+            end_dates = np.array([end_date], dtype='datetime64[D]')
+            _, _, valid = vectorized.compare(start_dates, end_dates, date_granularity, offset, offset_granularity)
+            self.assertEqual(valid.tolist(), [False])
+            with self.assertRaises(ValueError):
+                vectorized.get(start_dates, end_dates, date_granularity, offset, offset_granularity)
+            with self.assertRaises((ValueError, OverflowError)):
+                deloreans.get(
+                    datetime.date.fromisoformat(start_date),
+                    datetime.date.fromisoformat(end_date),
+                    date_granularity,
+                    offset,
+                    offset_granularity,
+                )
+
+        # the last and first periods of the calendar are still compared
+        start_dates = np.array(['9999-12-01', '0001-02-01'], dtype='datetime64[D]')
+        end_dates = np.array(['9999-12-31', '0001-02-28'], dtype='datetime64[D]')
+        compared_start_dates, _, valid = vectorized.compare(
+            start_dates,
+            end_dates,
+            DateGranularity.MONTHLY,
+            np.array([0, -1]),
+            OffsetGranularity.MONTHLY,
+        )
+        self.assertEqual(valid.tolist(), [True, True])
+        self.assertEqual(compared_start_dates.tolist(), [datetime.date(9999, 12, 1), datetime.date(1, 1, 1)])
+
+    def test_get_without_compared_date_range(self):
+        start_dates = np.array(['2024-12-31'], dtype='datetime64[D]')
+        with self.assertRaises(ValueError):
+            vectorized.get(start_dates, start_dates, DateGranularity.DAILY, -1, OffsetGranularity.YEARLY)
+
+    def test_get_with_incomplete_date_range(self):
+        start_dates = np.array(['2024-06-01'], dtype='datetime64[D]')
+        end_dates = np.array(['2024-06-29'], dtype='datetime64[D]')
+        with self.assertRaises(ValueError):
+            vectorized.get(start_dates, end_dates, DateGranularity.MONTHLY, -1, OffsetGranularity.YEARLY)
+
+    def test_get_with_invalid_grain_comb(self):
+        start_dates = np.array(['2024-01-01'], dtype='datetime64[D]')
+        end_dates = np.array(['2024-12-31'], dtype='datetime64[D]')
+        with self.assertRaises(ValueError):
+            vectorized.get(start_dates, end_dates, DateGranularity.YEARLY, -1, OffsetGranularity.MONTHLY)
+
+    def test_compare_offsets(self):
+        start_dates = np.array(['2024-02-01', '2024-06-01', '2023-12-01'], dtype='datetime64[D]')
+        end_dates = np.array(['2024-02-29', '2024-08-31', '2023-12-31'], dtype='datetime64[D]')
+        offsets = np.arange(-5, 0)
+        for offset_granularity in (OffsetGranularity.PERIODIC, OffsetGranularity.YEARLY):
+            compared_start_dates, compared_end_dates, valid = vectorized.compare_offsets(
+                start_dates,
+                end_dates,
+                DateGranularity.MONTHLY,
+                offsets,
+                offset_granularity,
+            )
+            self.assertEqual(compared_start_dates.shape, (3, 5))
+            self.assertTrue(valid.all())
+            for position, offset in enumerate(offsets):
+                expected_start_dates, expected_end_dates, _ = vectorized.compare(
+                    start_dates,
+                    end_dates,
+                    DateGranularity.MONTHLY,
+                    int(offset),
+                    offset_granularity,
+                )
+                self.assertTrue(np.array_equal(compared_start_dates[:, position], expected_start_dates))
+                self.assertTrue(np.array_equal(compared_end_dates[:, position], expected_end_dates))
+
+    def test_compare_offsets_validity(self):
+        days = np.array([to_days(datetime.date(2024, 12, 31))])
+        _, _, valid = vectorized.compare_offsets(days, days, DateGranularity.DAILY, [-4, -1], OffsetGranularity.YEARLY)
+        self.assertEqual(valid.tolist(), [[True, False]])
+        with self.assertRaises(ValueError):
+            vectorized.compare_offsets(days, days, DateGranularity.DAILY, [[-1]], OffsetGranularity.YEARLY)
+
+    def test_rolling(self):
+        for offset_granularity in VALID_GRAINS_COMB[DateGranularity.DAILY]:
+            start_dates, end_dates, compared_start_dates, compared_end_dates, valid = vectorized.rolling(
+                np.datetime64('2023-12-01'),
+                np.datetime64('2024-03-31'),
+                7,
+                DateGranularity.DAILY,
+                -1,
+                offset_granularity,
+            )
+            expected = list(deloreans.rolling(
+                datetime.date(2023, 12, 1),
+                datetime.date(2024, 3, 31),
+                7,
+                DateGranularity.DAILY,
+                -1,
+                offset_granularity,
+            ))
+            self.assertEqual(len(start_dates), len(expected))
+            for position, window in enumerate(expected):
+                self.assertEqual(start_dates[position].item(), window.start_date)
+                self.assertEqual(end_dates[position].item(), window.end_date)
+                self.assertEqual(bool(valid[position]), window.compared_start_date is not None)
+                if valid[position]:
+                    self.assertEqual(compared_start_dates[position].item(), window.compared_start_date)
+                    self.assertEqual(compared_end_dates[position].item(), window.compared_end_date)
+
+    def test_rolling_with_invalid_params(self):
+        with self.assertRaises(ValueError):
+            vectorized.rolling(
+                np.datetime64('2024-01-01'),
+                np.datetime64('2024-12-31'),
+                0,
+                DateGranularity.MONTHLY,
+                -1,
+                OffsetGranularity.YEARLY,
+            )
+        with self.assertRaises(ValueError):
+            vectorized.rolling(
+                np.array(['2024-01-01'], dtype='datetime64[D]'),
+                np.array(['2024-12-31'], dtype='datetime64[D]'),
+                1,
+                DateGranularity.MONTHLY,
+                -1,
+                OffsetGranularity.YEARLY,
+            )
+
+    def test_align_positions_consistent_with_compare(self):
+        for date_granularity, offset_granularities in VALID_GRAINS_COMB.items():
+            for offset_granularity in offset_granularities:
+                for firstweekday in (0, 6):
+                    periods = PeriodSequence(
+                        datetime.date(2016, 1, 1),
+                        datetime.date(2024, 12, 31),
+                        date_granularity,
+                        firstweekday,
+                    )
+                    # some compared periods are missing in dates
+                    dates = np.array([
+                        start_date for position, start_date in enumerate(periods) if position % 5
+                    ], dtype='datetime64[D]')
+                    for offset in (-2, -1, 1):
+                        positions, valid = vectorized.align_positions(
+                            dates,
+                            date_granularity,
+                            offset,
+                            offset_granularity,
+                            firstweekday,
+                        )
+                        compared_start_dates, _, compared = vectorized.compare(
+                            dates,
+                            vectorized.get_end_date(date_granularity, dates, 1, firstweekday),
+                            date_granularity,
+                            offset,
+                            offset_granularity,
+                            firstweekday,
+                        )
+                        date_positions = {date: position for position, date in enumerate(dates.tolist())}
+                        expected = [
+                            date_positions.get(compared_start_date, -1) if is_compared else -1
+                            for compared_start_date, is_compared in zip(compared_start_dates.tolist(), compared)
+                        ]
+                        self.assertEqual(positions.tolist(), expected)
+                        self.assertEqual(valid.tolist(), [position != -1 for position in expected])
+
+    def test_align(self):
+        months = np.arange('2022-01', '2024-07', dtype='datetime64[M]').astype('datetime64[D]')
+        values = np.arange(len(months) * 2).reshape(-1, 2)
+        base_values, compared_values, valid = vectorized.align(
+            months,
+            values,
+            DateGranularity.MONTHLY,
+            -1,
+            OffsetGranularity.YEARLY,
+        )
+        self.assertIs(base_values, values)
+        self.assertEqual(valid.tolist(), [False] * 12 + [True] * 18)
+        self.assertTrue(np.array_equal(compared_values[valid], values[:18]))
+
+    def test_align_with_invalid_dates(self):
+        values = np.arange(2)
+        for dates in (
+            np.array(['2024-02-01', '2024-01-01'], dtype='datetime64[D]'),
+            np.array(['2024-01-01', '2024-01-01'], dtype='datetime64[D]'),
+            np.array(['2024-01-01', '2024-02-02'], dtype='datetime64[D]'),
+        ):
+            with self.assertRaises(ValueError):
+                vectorized.align(dates, values, DateGranularity.MONTHLY, -1, OffsetGranularity.YEARLY)
+        with self.assertRaises(ValueError):
+            vectorized.align(
+                np.array(['2024-01-01'], dtype='datetime64[D]'),
+                values,
+                DateGranularity.MONTHLY,
+                -1,
+                OffsetGranularity.YEARLY,
+            )
+
+    def test_shift_dates_consistent_with_deloreans(self):
+        dates = np.arange('2020-11-20', '2021-01-20', dtype='datetime64[D]')
+        for date_granularity, offset_granularities in VALID_GRAINS_COMB.items():
+            for offset_granularity in offset_granularities:
+                for firstweekday in (0, 6):
+                    shifted_dates, valid = vectorized.shift_dates(
+                        dates,
+                        date_granularity,
+                        -1,
+                        offset_granularity,
+                        firstweekday,
+                    )
+                    for a_date, shifted_date, is_valid in zip(dates.tolist(), shifted_dates.tolist(), valid):
+                        start_date = date_granularity.from_key(
+                            date_granularity.to_key(a_date, firstweekday),
+                            firstweekday,
+                        )
+                        try:
+                            compared_start_date, compared_end_date = deloreans.get(
+                                start_date,
+                                date_granularity.get_end_date(start_date, 1, firstweekday),
+                                date_granularity,
+                                -1,
+                                offset_granularity,
+                                firstweekday,
+                            )
+                        except ValueError:
+                            self.assertFalse(is_valid)
+                            continue
+                        expected = compared_start_date + (a_date - start_date)
+                        self.assertEqual(is_valid, expected <= compared_end_date)
+                        if is_valid:
+                            self.assertEqual(shifted_date, expected)
+
+    def test_shift_dates_out_of_range(self):
+        # 2020-W53 doesn't exist in 2019, and 2024-02-29 doesn't exist in February 2023
+        shifted_dates, valid = vectorized.shift_dates(
+            np.array(['2020-12-29', '2021-01-05'], dtype='datetime64[D]'),
+            DateGranularity.WEEKLY,
+            -1,
+            OffsetGranularity.YEARLY,
+        )
+        self.assertEqual(valid.tolist(), [False, True])
+        self.assertEqual(shifted_dates[1], np.datetime64('2019-12-31'))
+        shifted_dates, valid = vectorized.shift_dates(
+            np.array(['2024-02-28', '2024-02-29'], dtype='datetime64[D]'),
+            DateGranularity.MONTHLY,
+            -1,
+            OffsetGranularity.YEARLY,
+        )
+        self.assertEqual(valid.tolist(), [True, False])
+        self.assertEqual(shifted_dates[0], np.datetime64('2023-02-28'))
+
+
+@skipIf(np is None, 'NumPy is not installed')
+class BucketTestCase(TestCase):
+
+    def test_consistent_with_date_utils(self):
+        dates = np.arange('2019-12-01', '2021-02-01', dtype='datetime64[D]')
+        for date_granularity in DateGranularity:
+            date_grain_name = date_granularity.name.lower()
+            for offset_granularity in VALID_GRAINS_COMB[date_granularity] - {OffsetGranularity.PERIODIC}:
+                located_granularity = DateGranularity[offset_granularity.name]
+                located_grain_name = located_granularity.name.lower()
+                index_func = getattr(common_date_utils, f'get_{date_grain_name}_index_of_{located_grain_name}')
+                for firstweekday in range(7):
+                    # both tabulated and not
+                    for sample_dates in (dates, dates[::-7][:40]):
+                        keys, located_keys, indexes = vectorized.bucket(
+                            sample_dates,
+                            date_granularity,
+                            located_granularity,
+                            firstweekday,
+                        )
+                        for a_date, key, located_key, index in zip(
+                            sample_dates.tolist(),
+                            keys.tolist(),
+                            located_keys.tolist(),
+                            indexes.tolist(),
+                        ):
+                            anchor_date = a_date
+                            if date_granularity == DateGranularity.WEEKLY:
+                                anchor_date = common_date_utils.get_week_anchor_date(a_date, firstweekday)
+                            self.assertEqual(key, date_granularity.to_key(a_date, firstweekday))
+                            self.assertEqual(located_key, located_granularity.to_key(anchor_date, firstweekday))
+                            self.assertEqual(index, index_func(a_date, firstweekday=firstweekday))
+
+    def test_week_located_by_fourth_day(self):
+        # the week from 2024-03-31 (Sunday) to 2024-04-06 is the first week of April
+        keys, located_keys, indexes = vectorized.bucket(
+            np.array(['2024-03-31', '2024-04-06', '2024-03-30'], dtype='datetime64[D]'),
+            DateGranularity.WEEKLY,
+            DateGranularity.MONTHLY,
+            firstweekday=6,
+        )
+        self.assertEqual(keys[0], keys[1])
+        self.assertEqual(located_keys.tolist(), [2024 * 12 + 3] * 2 + [2024 * 12 + 2])
+        self.assertEqual(indexes.tolist(), [0, 0, 3])
+
+    def test_invalid_granularities(self):
+        days = np.arange(10)
+        with self.assertRaises(ValueError):
+            vectorized.bucket(days, DateGranularity.MONTHLY, DateGranularity.WEEKLY)
+        with self.assertRaises(ValueError):
+            vectorized.bucket(days, DateGranularity.WEEKLY, OffsetGranularity.MONTHLY)
+        with self.assertRaises(ValueError):
+            vectorized.bucket(days, DateGranularity.WEEKLY, DateGranularity.MONTHLY, 7)